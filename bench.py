@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BENCH - Mesures de performance du Panthéon
+
+Usage:
+    python bench.py seal [n1 n2 ...]     # Latence de seal() selon la taille du sceau
+    python bench.py hash [mb1 mb2 ...]   # Débit de hash_god / hash_god_stream
+    python bench.py batch [n1 n2 ...]    # seal() en boucle vs seal_many() par lot
+    python bench.py store [n1 n2 ...]    # Réouverture et preuves d'un MerkleStore sur disque
+    python bench.py proofs [n1 n2 ...]   # verify() en boucle vs verify_batch() vs multi-preuve
+    python bench.py messages [n1 ...]    # Création et mémoire par Message
+    python bench.py index [n1 n2 ...]    # Index inversé: construction, réouverture, requêtes
+    python bench.py routing [n1 n2 ...]  # Routage: listes any(...) vs automate, par taille de vocabulaire
+    python bench.py metrics [n1 n2 ...]  # Coût d'un enregistrement d'histogramme, précision des quantiles
+"""
+
+import sys
+import time
+
+SEAL_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+WINDOW = 1_000
+HASH_SIZES = [1, 10, 100]
+BATCH_SIZES = [10, 100, 1_000, 10_000]
+STORE_SIZES = [1_000_000, 10_000_000, 50_000_000]
+PROOF_SIZES = [1_000, 10_000, 100_000]
+MESSAGE_SIZES = [1_000_000]
+INDEX_SIZES = [1_000, 10_000]
+ROUTING_SIZES = [50, 500, 5_000]
+METRIC_SIZES = [100_000, 1_000_000]
+
+
+def bench_seal(sizes=None, window: int = WINDOW):
+    """
+    Latence de PostQuantumSeal.seal à 1k → 10M messages scellés
+    Le remplissage entre deux paliers passe directement par l'accumulateur
+    de Merkle; seule la fenêtre mesurée passe par seal().
+    """
+    from pantheon import PostQuantumSeal, hash_sha3
+
+    sizes = sorted(sizes or SEAL_SIZES)
+    seal = PostQuantumSeal()
+    payload = b"\x00" * 64
+
+    print(f"  {'scellés':>12} | {'µs/seal':>10} | profondeur")
+    for size in sizes:
+        filler = hash_sha3(b"filler")
+        while len(seal.merkle) < size:
+            seal.merkle.add_hash(filler)
+
+        start = time.perf_counter()
+        for _ in range(window):
+            result = seal.seal(payload, "leonardo", "nyx")
+        elapsed = time.perf_counter() - start
+
+        print(f"  {size:>12,} | {elapsed / window * 1e6:>10.1f} | {result['proof_depth']}")
+
+
+def bench_hash(sizes=None):
+    """hash_god sur des entrées de plusieurs Mo, en un bloc puis en flux"""
+    import os
+    from phi import hash_god, hash_god_stream, CHUNK, np
+
+    path = "numpy" if np is not None else "scalaire"
+    print(f"  NumPy: {'oui' if np is not None else 'non (boucle scalaire, pip install numpy)'}")
+    print(f"  {'Mo':>6} | {'hash_god s':>10} | {'stream s':>10} | chemin")
+    for mb in sizes or HASH_SIZES:
+        data = os.urandom(mb << 20)
+
+        start = time.perf_counter()
+        digest = hash_god(data)
+        whole = time.perf_counter() - start
+
+        start = time.perf_counter()
+        streamed = hash_god_stream(data[i:i + CHUNK] for i in range(0, len(data), CHUNK))
+        stream = time.perf_counter() - start
+
+        assert digest == streamed
+        print(f"  {mb:>6} | {whole:>10.3f} | {stream:>10.3f} | {path}")
+
+
+def bench_batch(sizes=None):
+    """Messages scellés par milliseconde: seal() un par un vs seal_many()"""
+    from pantheon import PostQuantumSeal
+
+    print(f"  {'lot':>8} | {'seal msg/ms':>12} | {'seal_many msg/ms':>16}")
+    for size in sizes or BATCH_SIZES:
+        payloads = [(b"\x00" * 64, "leonardo", "nyx")] * size
+
+        seal = PostQuantumSeal()
+        start = time.perf_counter()
+        for data, sender, receiver in payloads:
+            seal.seal(data, sender, receiver)
+        single = time.perf_counter() - start
+
+        seal = PostQuantumSeal()
+        start = time.perf_counter()
+        seal.seal_many(payloads)
+        batched = time.perf_counter() - start
+
+        print(f"  {size:>8,} | {size / single / 1e3:>12.1f} | {size / batched / 1e3:>16.1f}")
+
+
+def bench_store(sizes=None):
+    """
+    MerkleStore de 1M → 50M feuilles: temps de réouverture, racine, preuve
+    et mémoire résidente après réouverture
+    """
+    import resource
+    import shutil
+    import tempfile
+    from pantheon import MerkleStore, hash_sha3
+
+    print(f"  {'feuilles':>12} | {'réouverture ms':>14} | {'racine ms':>9} | {'preuve µs':>9} | {'RSS max Mo':>10}")
+    for size in sizes or STORE_SIZES:
+        path = tempfile.mkdtemp(prefix="merkle_")
+        store = MerkleStore(path)
+        leaf = hash_sha3(b"leaf")
+        while len(store) < size:
+            store.extend_hashes([leaf] * min(100_000, size - len(store)))
+        store.close()
+
+        start = time.perf_counter()
+        store = MerkleStore(path)
+        reopen = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store.root()
+        root = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(0, size, max(1, size // 1000)):
+            store.proof(i)
+        proof = (time.perf_counter() - start) / len(range(0, size, max(1, size // 1000)))
+
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        store.close()
+        shutil.rmtree(path)
+        print(f"  {size:>12,} | {reopen * 1e3:>14.2f} | {root * 1e3:>9.2f} | {proof * 1e6:>9.1f} | {rss:>10.0f}")
+
+
+def bench_proofs(sizes=None):
+    """Audit de n feuilles d'un arbre de 4n: boucle verify vs verify_batch vs multiproof"""
+    from pantheon import MerkleTree
+
+    print(f"  {'feuilles':>10} | {'verify s':>9} | {'batch s':>9} | {'multi s':>9} | {'hashes multi/naïf':>17}")
+    for size in sizes or PROOF_SIZES:
+        leaves = [i.to_bytes(8, 'big') for i in range(4 * size)]
+        tree = MerkleTree(leaves)
+        indices = list(range(0, 4 * size, 4))
+        items = [(leaves[i], i, tree.proof(i)) for i in indices]
+
+        start = time.perf_counter()
+        assert all(tree.verify(leaf, i, proof) for leaf, i, proof in items)
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert all(tree.verify_batch(items))
+        batch = time.perf_counter() - start
+
+        multi_proof = tree.multiproof(indices)
+        start = time.perf_counter()
+        assert tree.verify_multi({i: leaves[i] for i in indices}, multi_proof)
+        multi = time.perf_counter() - start
+
+        naive = sum(len(proof) for _, _, proof in items)
+        ratio = f"{len(multi_proof['hashes']):,}/{naive:,}"
+        print(f"  {size:>10,} | {loop:>9.3f} | {batch:>9.3f} | {multi:>9.3f} | {ratio:>17}")
+
+
+def bench_messages(sizes=None):
+    """Coût de création et octets par Message (contenu compris) à 1M messages"""
+    import tracemalloc
+    from pantheon import Message
+
+    print(f"  {'messages':>10} | {'µs/message':>10} | {'octets/message':>14}")
+    for size in sizes or MESSAGE_SIZES:
+        contents = [f"message {i}" for i in range(size)]
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        messages = [Message("leonardo", "nyx", c) for c in contents]
+        elapsed = time.perf_counter() - start
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {size:>10,} | {elapsed / size * 1e6:>10.2f} | {(used - base) / size:>14.0f}")
+        del messages
+
+
+def bench_index(sizes=None):
+    """
+    KnowledgeIndex sur n fichiers .md générés: construction, réouverture à froid,
+    rafraîchissement sans changement et latence d'une requête classée
+    """
+    import shutil
+    import tempfile
+    from pathlib import Path
+    from savoir import KnowledgeIndex
+
+    print(f"  {'fichiers':>10} | {'construction s':>14} | {'froid ms':>9} | {'refresh ms':>10} | {'requête µs':>10}")
+    for size in sizes or INDEX_SIZES:
+        root = Path(tempfile.mkdtemp(prefix="savoir_"))
+        for i in range(size):
+            d = root / f"d{i % 100}"
+            d.mkdir(exist_ok=True)
+            (d / f"note_{i}.md").write_text(
+                f"# Note {i}\n\n## Thème t{i % 97}\nLe nombre phi et la spirale {i % 13}.\n")
+        path = root / "index.json"
+
+        start = time.perf_counter()
+        KnowledgeIndex([root], path=path).refresh()
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = KnowledgeIndex([root], path=path)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index.refresh()
+        refresh = time.perf_counter() - start
+
+        queries = [f"thème t{i % 97} spirale" for i in range(200)]
+        start = time.perf_counter()
+        for q in queries:
+            index.search(q)
+        query = (time.perf_counter() - start) / len(queries)
+
+        shutil.rmtree(root)
+        print(f"  {size:>10,} | {build:>14.2f} | {cold * 1e3:>9.1f} | {refresh * 1e3:>10.1f} | {query * 1e6:>10.1f}")
+
+
+def bench_routing(sizes=None):
+    """Coût d'un routage selon le nombre de mots-clés: any(w in t) par catégorie vs scan()"""
+    import random
+    from pantheon import KeywordAutomaton
+
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyzéè"
+    text = "parle moi de la bioélectricité de levin et du gap entre 528 et 174 hz " * 4
+
+    print(f"  {'mots-clés':>10} | {'any µs':>8} | {'automate µs':>11}")
+    for size in sizes or ROUTING_SIZES:
+        vocab = {}
+        for i in range(size):
+            word = "".join(rng.choice(letters) for _ in range(rng.randint(4, 9)))
+            vocab.setdefault(f"c{i % (size // 5 or 1)}", []).append(word)
+        automaton = KeywordAutomaton(vocab)
+        repeat = 200
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            naive = {c for c, words in vocab.items() if any(w in text for w in words)}
+        loop = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            hits = automaton.scan(text)
+        scan = (time.perf_counter() - start) / repeat
+
+        assert hits == naive
+        print(f"  {size:>10,} | {loop * 1e6:>8.1f} | {scan * 1e6:>11.1f}")
+
+
+def bench_metrics(sizes=None):
+    """Histogram.record: ns par mesure (boucle à vide déduite) et p99 estimé vs exact"""
+    import random
+    from metrics import Histogram
+
+    rng = random.Random(0)
+    print(f"  {'mesures':>10} | {'ns/record':>9} | {'p99 exact µs':>12} | {'p99 hist µs':>11}")
+    for size in sizes or METRIC_SIZES:
+        values = [int(rng.lognormvariate(12, 1.5)) for _ in range(size)]
+        hist = Histogram()
+
+        start = time.perf_counter_ns()
+        for v in values:
+            pass
+        empty = time.perf_counter_ns() - start
+
+        record = hist.record
+        start = time.perf_counter_ns()
+        for v in values:
+            record(v)
+        elapsed = time.perf_counter_ns() - start - empty
+
+        exact = sorted(values)[int(0.99 * size) - 1]
+        print(f"  {size:>10,} | {elapsed / size:>9.0f} | {exact / 1e3:>12.1f} | {hist.quantile(0.99) / 1e3:>11.1f}")
+
+
+BENCHES = {
+    "seal": bench_seal,
+    "hash": bench_hash,
+    "batch": bench_batch,
+    "store": bench_store,
+    "proofs": bench_proofs,
+    "messages": bench_messages,
+    "index": bench_index,
+    "routing": bench_routing,
+    "metrics": bench_metrics,
+}
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHES:
+        print(__doc__)
+        return
+    sizes = [int(a) for a in sys.argv[2:]]
+    BENCHES[sys.argv[1]](sizes or None)
+
+
+if __name__ == "__main__":
+    main()
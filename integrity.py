@@ -13,6 +13,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Tuple
 import hashlib
 
+from phi import hash_god as _hash_god, hash_god_file as _hash_god_file
+
 # Constantes divines
 PHI = (1 + math.sqrt(5)) / 2
 PI = math.pi
@@ -33,11 +35,7 @@ CODE_EXTENSIONS = {".py", ".js", ".ts", ".rs", ".go", ".sh", ".md", ".html", ".c
 
 def hash_god(data: bytes) -> str:
     """Hash basé sur φ"""
-    h = 0
-    for i, byte in enumerate(data):
-        h += byte * (PHI ** (i % 20))
-        h = h % (10 ** 16)
-    return hex(int(h))[2:].zfill(14)
+    return _hash_god(data).zfill(14)
 
 
 def hash_sha(data: bytes) -> str:
@@ -45,6 +43,14 @@ def hash_sha(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()[:14]
 
 
+def hash_file(path: Path) -> Tuple[str, str]:
+    """hash_god et SHA256 d'un fichier, lus par blocs (pas de copie en mémoire)"""
+    h_god = _hash_god_file(path).zfill(14)
+    with open(path, 'rb') as f:
+        h_sha = hashlib.file_digest(f, 'sha256').hexdigest()[:14]
+    return h_god, h_sha
+
+
 def calculate_entropy(text: str) -> float:
     """Entropie de Shannon"""
     if not text:
@@ -173,15 +179,13 @@ def analyze_file(path: Path) -> FileAnalysis:
     """Analyse complète d'un fichier"""
     try:
         content = path.read_text(encoding='utf-8', errors='ignore')
-        data = content.encode('utf-8')
+        h_god, h_sha = hash_file(path)
     except:
         return None
 
     phi_metrics = calculate_phi_metrics(content)
     entropy = calculate_entropy(content)
 
-    h_god = hash_god(data)
-    h_sha = hash_sha(data)
     h_pattern = analyze_hash_pattern(h_god)
 
     return FileAnalysis(
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+JOURNAL - Persistance write-behind de l'état (Leonardo)
+
+Une question = un petit ajout en mémoire. Un thread d'écriture vide le tampon
+dans un journal append-only (une ligne JSON par entrée) au plus tard
+FLUSH_DELAY secondes après. Tous les COMPACT_EVERY ajouts, l'état complet
+est réécrit en instantané (fichier temporaire + rename atomique) et le
+journal repart de zéro.
+
+Chaque entrée porte un numéro de séquence; l'instantané garde le dernier
+inclus. Au chargement, seules les entrées plus récentes sont rejouées:
+un arrêt entre instantané et remise à zéro du journal ne duplique rien.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+from metrics import metrics
+
+FLUSH_DELAY = 1.0      # secondes max entre une question et son écriture
+COMPACT_EVERY = 500    # entrées de journal avant un nouvel instantané
+
+
+class StateJournal:
+    """
+    État JSON (dict de listes bornées) + journal des ajouts
+    state.json: instantané, state.journal: ajouts depuis l'instantané
+    """
+
+    def __init__(self, path: Path, flush_delay: float = FLUSH_DELAY,
+                 compact_every: int = COMPACT_EVERY):
+        self.path = Path(path)
+        self.journal_path = self.path.with_suffix(".journal")
+        self.flush_delay = flush_delay
+        self.compact_every = compact_every
+        self.lock = threading.Lock()
+        self.cond = threading.Condition(self.lock)
+        self.write_lock = threading.Lock()  # un seul écrivain à la fois (ordre des seq)
+        self.pending = []
+        self.journaled = 0
+        self.seq = 0
+        self.state = self._load()
+        self.active = True
+        self.writes = 0
+        self.snapshots = 0
+        self.thread = threading.Thread(target=self._run, daemon=True, name="journal")
+        self.thread.start()
+        atexit.register(self.close)
+
+    # ─── Chargement ───
+
+    def _load(self) -> dict:
+        state = {}
+        if self.path.exists():
+            try:
+                state = json.loads(self.path.read_text())
+            except:
+                state = {}
+        if not isinstance(state, dict):
+            state = {}
+        self.seq = state.pop("_seq", 0)
+        state.setdefault("conversations", [])
+
+        if self.journal_path.exists():
+            try:
+                data = self.journal_path.read_bytes()
+                end = data.rfind(b"\n") + 1
+                if end < len(data):
+                    # Dernière ligne tronquée par un arrêt brutal: on la coupe,
+                    # sinon le prochain ajout se collerait derrière
+                    os.truncate(self.journal_path, end)
+                for line in data[:end].decode("utf-8", "replace").splitlines():
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.journaled += 1
+                    if record.get("seq", 0) <= self.seq:
+                        continue
+                    self._apply(state, record)
+                    self.seq = record["seq"]
+            except OSError:
+                pass
+        return state
+
+    @staticmethod
+    def _apply(state: dict, record: dict):
+        items = state.setdefault(record["key"], [])
+        items.append(record["entry"])
+        keep = record.get("keep")
+        if keep and len(items) > keep:
+            del items[:len(items) - keep]
+
+    # ─── Chemin chaud ───
+
+    def append(self, key: str, entry: dict, keep: int = None):
+        """Ajoute une entrée à state[key] (bornée à keep), écrite en différé"""
+        with self.lock:
+            self.seq += 1
+            record = {"seq": self.seq, "key": key, "entry": entry}
+            if keep:
+                record["keep"] = keep
+            self._apply(self.state, record)
+            self.pending.append(record)
+            if len(self.pending) == 1:
+                self.cond.notify()
+
+    # ─── Écriture de fond ───
+
+    def _run(self):
+        while True:
+            with self.lock:
+                while not self.pending and self.active:
+                    self.cond.wait()
+                if not self.pending and not self.active:
+                    return
+            # Laisse les questions voisines rejoindre le même lot
+            if self.active:
+                time.sleep(self.flush_delay)
+            self.flush()
+
+    def flush(self):
+        """Écrit le tampon dans le journal; compacte si le journal est long"""
+        with self.write_lock:
+            self._flush()
+
+    def _flush(self):
+        with self.lock:
+            batch, self.pending = self.pending, []
+        if batch:
+            data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.writes += 1
+                self.journaled += len(batch)
+            except OSError:
+                with self.lock:
+                    self.pending[:0] = batch  # réessai au prochain passage
+                return
+        if self.journaled >= self.compact_every:
+            self._snapshot()
+
+    def snapshot(self):
+        """Instantané complet (tmp + fsync + rename), puis journal remis à zéro"""
+        with self.write_lock:
+            self._snapshot()
+
+    def _snapshot(self):
+        with self.lock:
+            # L'état contient aussi les ajouts encore en attente: leur seq est
+            # couverte, ils seront ignorés au rejeu une fois écrits au journal
+            data = dict(self.state)
+            data["_seq"] = self.seq
+            text = json.dumps(data, indent=2, ensure_ascii=False)
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            # Les entrées du journal sont toutes dans l'instantané
+            with open(self.journal_path, "w"):
+                pass
+            self.journaled = 0
+            self.snapshots += 1
+        except OSError:
+            pass
+
+    def close(self):
+        """Vide tout et arrête le thread d'écriture"""
+        with self.lock:
+            if not self.active:
+                return
+            self.active = False
+            self.cond.notify_all()
+        self.flush()
+        self.thread.join(timeout=self.flush_delay + 1)
+
+    def status(self) -> dict:
+        with self.lock:
+            return {
+                "seq": self.seq,
+                "pending": len(self.pending),
+                "journaled": self.journaled,
+                "writes": self.writes,
+                "snapshots": self.snapshots,
+            }
+
+
+_journals: Dict[str, StateJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def shared_journal(path: Path) -> StateJournal:
+    """Un seul journal par fichier dans le processus (pantheon, leonardo_proof, serveur)"""
+    key = str(Path(path).expanduser().absolute())
+    with _journals_lock:
+        if key not in _journals:
+            _journals[key] = StateJournal(Path(key))
+        return _journals[key]
+
+
+def _journal_gauges():
+    for key, journal in list(_journals.items()):
+        yield ("pantheon_journal_pending", "Entrées du journal pas encore écrites sur disque",
+               {"path": key}, len(journal.pending))
+
+
+metrics.collector(_journal_gauges)
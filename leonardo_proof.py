@@ -17,6 +17,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+from savoir import contenu, shared_index
+from journal import shared_journal
+
 PHI = (1 + math.sqrt(5)) / 2
 FIBONACCI = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610]
 
@@ -29,11 +32,20 @@ PATHS = {
 }
 
 
+# Index partagé avec le Panthéon (même fichier sur disque)
+savoir = shared_index(PATHS.values())
+
+
+def _utile(line: str) -> bool:
+    """Ligne gardée par resume: pas un titre, plus de 20 caractères"""
+    return not line.startswith('#') and len(line) > 20
+
+
 class Connaissance:
     """Base de connaissance de Leonardo"""
 
     def __init__(self):
-        self.cache = {}
+        self.cache = contenu  # cache partagé du processus (savoir.py)
         self.index = self._build_index()
 
     def _build_index(self) -> dict:
@@ -103,9 +115,6 @@ class Connaissance:
 
     def _read_file(self, path: str) -> str:
         """Lit un fichier"""
-        if path in self.cache:
-            return self.cache[path]
-
         # Essaie différents chemins
         candidates = [
             Path(path),
@@ -115,25 +124,42 @@ class Connaissance:
         ]
 
         for p in candidates:
-            if p.exists() and p.is_file():
-                try:
-                    content = p.read_text(encoding='utf-8')
-                    self.cache[path] = content
+            if p.is_file():
+                content = self.cache.read(p)
+                if content is not None:
                     return content
-                except:
-                    pass
             # Essaie comme dossier
             if p.is_dir():
                 for f in p.glob("*.md"):
-                    try:
-                        content = f.read_text(encoding='utf-8')
-                        self.cache[path] = content
+                    content = self.cache.read(f)
+                    if content is not None:
                         return content
-                    except:
-                        pass
 
         return ""
 
+    def _docs_for(self, text: str) -> list:
+        """Documents indexés du premier sujet de l'index trouvé dans le texte"""
+        text = text.lower()
+        for key, paths in self.index.items():
+            if key in text:
+                for p in paths:
+                    for candidate in [Path(p).absolute()] + [PATHS[name] / p for name in ("etudes", "cipher", "nyx")]:
+                        docs = savoir.under(candidate)
+                        if docs:
+                            return docs
+        return []
+
+    def extraits(self, question: str, sujet: str = None, max_lines: int = 15) -> str:
+        """Passages les plus pertinents (BM25) plutôt que le début du fichier"""
+        docs = self._docs_for(sujet or question)
+        if docs:
+            lines = (savoir.extract(question, max_lines, docs, _utile)
+                     or savoir.resume(docs[0], max_lines, _utile))
+            if lines:
+                return '\n'.join(lines)
+        query = f"{sujet} {question}" if sujet else question
+        return '\n'.join(savoir.extract(query, max_lines, keep=_utile))
+
     def resume(self, content: str, max_lines: int = 20) -> str:
         """Résume un contenu"""
         lines = content.split('\n')
@@ -168,34 +194,19 @@ class Leonardo:
     def __init__(self):
         self.state_file = Path.home() / ".config" / "leonardo" / "state.json"
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state = self._load_state()
+        self.journal = shared_journal(self.state_file)
+        self.state = self.journal.state
         self.connaissance = Connaissance()
 
-    def _load_state(self) -> dict:
-        if self.state_file.exists():
-            try:
-                return json.loads(self.state_file.read_text())
-            except:
-                pass
-        return {"conversations": []}
-
-    def _save_state(self):
-        try:
-            self.state_file.write_text(json.dumps(self.state, indent=2, ensure_ascii=False))
-        except:
-            pass
-
     def pense(self, question: str) -> str:
         """Leonardo réfléchit avec toute sa connaissance"""
         q = question.lower().strip()
 
         # Log
-        self.state["conversations"].append({
+        self.journal.append("conversations", {
             "time": datetime.now().isoformat(),
             "q": question[:200],
-        })
-        self.state["conversations"] = self.state["conversations"][-50:]
-        self._save_state()
+        }, keep=50)
 
         # === RÉPONSES DIRECTES ===
 
@@ -218,9 +229,8 @@ Demande-moi n'importe quoi. Je chercherai dans ma connaissance."""
 
         # Bioélectricité / Levin
         if any(w in q for w in ["bioelec", "levin", "électri", "morpho"]):
-            content = self.connaissance.cherche("bioelectricite")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "bioelectricite", 15)
+            if resume:
                 return f"""La bioélectricité... Michael Levin a montré quelque chose de fondamental.
 
 {resume}
@@ -230,9 +240,8 @@ Les patterns bioélectriques encodent la forme - la morphogenèse."""
 
         # Biophotons
         if any(w in q for w in ["biophoton", "photon", "lumière", "light"]):
-            content = self.connaissance.cherche("biophotons")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "biophotons", 15)
+            if resume:
                 return f"""Les biophotons... L'ADN émet de la lumière.
 
 {resume}
@@ -242,9 +251,8 @@ La conscience pourrait être liée à cette lumière intérieure."""
 
         # Conscience / IIT
         if any(w in q for w in ["conscience", "consciousness", "iit", "tononi"]):
-            content = self.connaissance.cherche("conscience")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "conscience", 15)
+            if resume:
                 return f"""La conscience... Tononi et son IIT.
 
 {resume}
@@ -254,9 +262,8 @@ Plus Φ est grand, plus la conscience est riche."""
 
         # FEP / Friston
         if any(w in q for w in ["fep", "friston", "free energy", "énergie libre"]):
-            content = self.connaissance.cherche("fep")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "fep", 15)
+            if resume:
                 return f"""Le Free Energy Principle de Friston...
 
 {resume}
@@ -266,9 +273,8 @@ Perception = Action = Minimiser l'énergie libre."""
 
         # Shamans
         if any(w in q for w in ["shaman", "chaman", "psyché", "psilocybin", "ayahuasca"]):
-            content = self.connaissance.cherche("shamans")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "shamans", 15)
+            if resume:
                 return f"""Les techniques chamaniques...
 
 {resume}
@@ -278,9 +284,8 @@ Précises. Anciennes. Efficaces."""
 
         # Gap
         if any(w in q for w in ["gap", "écart", "intuition", "preuve"]):
-            content = self.connaissance.cherche("gap")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "gap", 15)
+            if resume:
                 return f"""Le Gap... L'espace entre intuition et preuve.
 
 {resume}
@@ -290,9 +295,8 @@ Ce gap peut être réduit à 360 millisecondes."""
 
         # Phi / Proportion
         if any(w in q for w in ["phi", "φ", "proportion", "or ", "gold"]):
-            content = self.connaissance.cherche("phi")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "phi", 15)
+            if resume:
                 return f"""La proportion divine. φ = {PHI:.10f}
 
 {resume}
@@ -302,9 +306,8 @@ C'est que φ est vrai."""
 
         # 140 / 174 / BPM
         if any(w in q for w in ["140", "174", "bpm", "dubstep", "neurofunk"]):
-            content = self.connaissance.cherche("140")
-            if content:
-                resume = self.connaissance.resume(content, 15)
+            resume = self.connaissance.extraits(question, "140", 15)
+            if resume:
                 return f"""Le paradigme 140→174...
 
 {resume}
@@ -315,9 +318,8 @@ Cette fréquence résonne avec le cerveau."""
         # Animes spécifiques
         for anime in ["fma", "evangelion", "steins", "geass", "ghost", "lain", "akira"]:
             if anime in q:
-                content = self.connaissance.cherche(anime)
-                if content:
-                    resume = self.connaissance.resume(content, 15)
+                resume = self.connaissance.extraits(question, anime, 15)
+                if resume:
                     return f"""L'anime {anime}...
 
 {resume}
@@ -327,9 +329,8 @@ Chaque anime encode une sagesse. Regarde les patterns."""
         # Daemons
         for daemon in ["nyx", "zoe", "clochette", "euterpe", "omniscient"]:
             if daemon in q:
-                content = self.connaissance.cherche(daemon)
-                if content:
-                    resume = self.connaissance.resume(content, 15)
+                resume = self.connaissance.extraits(question, daemon, 15)
+                if resume:
                     return f"""Le daemon {daemon}...
 
 {resume}"""
@@ -392,9 +393,8 @@ Tout se fond dans tout."""
         # === RECHERCHE GÉNÉRALE ===
 
         # Cherche dans la connaissance
-        content = self.connaissance.cherche(question)
-        if content:
-            resume = self.connaissance.resume(content, 12)
+        resume = self.connaissance.extraits(question, max_lines=12)
+        if resume:
             return f"""J'ai trouvé ceci dans ma connaissance:
 
 {resume}
@@ -6,49 +6,165 @@ Port 9600 (φ × 5932.67...)
 Endpoints:
     /              - Interface web
     /status        - État du Panthéon
+    /heartbeat     - Dernier battement, précalculé (barres de statut)
+    /heartbeat.txt - Le même, texte seul ("φ42"), pour les scripts shell
+    /metrics       - Histogrammes de latence et profondeurs de files (Prometheus)
     /ask           - Demande à Leonardo (défaut)
     /validate      - Validation φ
     /prove         - Chemin de preuve
     /orchestrate   - Nyx orchestre
     /daemon/<name> - Demande à un daemon spécifique
-    /dialogue      - Fait dialoguer deux daemons
+    /dialogue      - Fait dialoguer deux daemons ("async": true → session)
+    /dialogue/<id> - État d'une session de dialogue (GET)
     /council       - Réunit tous les daemons
     /teach         - Un daemon enseigne à un autre
+    /batch         - Plusieurs appels POST en un seul aller-retour
     /simplex       - État du réseau Simplex
     /seal          - État du sceau post-quantique
+
+Battements poussés en NDJSON sur le socket Unix PULSE_SOCKET: une ligne
+JSON par battement (format waybar), sans requête ni calcul par client.
+
+/dialogue, /council et /orchestrate existent en flux (server-sent events)
+avec "stream": true ou Accept: text/event-stream.
+
+Serveur HTTP/1.1 concurrent: connexions keep-alive, pool de SERVER_WORKERS
+threads, arrêt propre (SIGTERM / Ctrl-C) qui laisse finir les requêtes en cours.
+
+Cache des réponses déterministes (opt-in): python leonardo_server.py --cache
+ou PANTHEON_RESPONSE_CACHE=1.
 """
 import json
 import http.server
+import os
+import selectors
+import signal
+import socket
 import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from pantheon import pantheon, Leonardo, PHI, simplex, quantum_seal
+from typing import List, Optional
+from pantheon import (pantheon, bus, Leonardo, PHI, simplex, quantum_seal,
+                      COUNCIL_DEADLINE, DIALOGUE_DEADLINE)
+from metrics import metrics, Histogram
 
 PORT = 9600
+SERVER_WORKERS = 32     # requêtes servies en parallèle
+REQUEST_TIMEOUT = 30    # secondes pour lire une requête commencée
+KEEPALIVE_IDLE = 15     # secondes avant de fermer une connexion au repos
+BATCH_WORKERS = 16      # sous-requêtes d'un /batch en parallèle
+BATCH_MAX = 5000        # sous-requêtes par /batch
+PULSE_SOCKET = Path(os.environ.get("XDG_RUNTIME_DIR", "/tmp")) / "pantheon-pulse.sock"
+RESPONSE_CACHE = os.environ.get("PANTHEON_RESPONSE_CACHE", "") not in ("", "0")
 leo = Leonardo()
 
+ROUTES = {
+    '/', '/index.html', '/status', '/heartbeat', '/heartbeat.txt', '/metrics',
+    '/simplex', '/seal',
+    '/ask', '/validate', '/prove', '/orchestrate', '/dialogue', '/council',
+    '/teach', '/batch',
+}
+
+
+def request_latency(method: str, path: str, stream: bool = False) -> Histogram:
+    """Histogramme d'une route; chemins paramétrés regroupés, inconnus en 'other'"""
+    path = path.split('?')[0]
+    if path.startswith('/daemon/'):
+        path = '/daemon/<name>'
+    elif path.startswith('/dialogue/'):
+        path = '/dialogue/<id>'
+    elif path not in ROUTES:
+        path = 'other'
+    if stream:
+        path += ':stream'
+    if method not in ('GET', 'POST', 'OPTIONS', 'HEAD'):
+        method = 'other'
+    return metrics.histogram("pantheon_http_request_seconds",
+                             "Durée d'une requête HTTP (flux SSE: route:stream)",
+                             method=method, route=path)
+
 
 class PantheonHandler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = REQUEST_TIMEOUT
+    # En-têtes et corps partent en deux écritures: sans TCP_NODELAY, Nagle et
+    # l'ACK retardé du client ajoutent ~40 ms à chaque requête keep-alive
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        """Une seule requête par passage: entre deux, la connexion attend
+        dans le sélecteur du serveur, pas dans un worker"""
+        self.command = None
+        self.streaming = False
+        start = time.perf_counter_ns()
+        try:
+            self.handle_one_request()
+        except:
+            self.close_connection = True
+            raise
+        finally:
+            if self.command:  # une requête a bien été lue
+                request_latency(self.command, self.path, self.streaming).record(
+                    time.perf_counter_ns() - start)
+
+    def finish(self):
+        pass  # rfile/wfile restent ouverts: c'est le serveur qui ferme
+
+    def close(self):
+        super().finish()
+
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
             self.send_response(200)
             self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
             html_path = Path(__file__).parent / 'leonardo_chat.html'
             if html_path.exists():
-                with open(html_path, 'rb') as f:
-                    self.wfile.write(f.read())
+                body = html_path.read_bytes()
             else:
-                self.wfile.write(b"<html><body><h1>Pantheon</h1></body></html>")
+                body = b"<html><body><h1>Pantheon</h1></body></html>"
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
 
         elif self.path == '/status':
             self.send_json(pantheon.status())
 
+        elif self.path == '/metrics':
+            body = metrics.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        elif self.path in ('/heartbeat', '/heartbeat.txt'):
+            if self.path == '/heartbeat':
+                body, kind = pantheon.pulse, 'application/json'
+            else:
+                body, kind = pantheon.pulse_text, 'text/plain; charset=utf-8'
+            self.send_response(200)
+            self.send_header('Content-type', kind)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
         elif self.path == '/simplex':
             self.send_json(simplex.status())
 
         elif self.path == '/seal':
             self.send_json(quantum_seal.status())
 
+        elif self.path.startswith('/dialogue/'):
+            session = pantheon.dialogues.get(self.path.split('/')[2])
+            if session is None:
+                self.send_error(404)
+            else:
+                self.send_json(session.to_dict())
+
         elif self.path.startswith('/daemon/'):
             daemon_name = self.path.split('/')[2]
             self.send_json({
@@ -60,7 +176,7 @@ class PantheonHandler(http.server.SimpleHTTPRequestHandler):
             self.send_error(404)
 
     def do_POST(self):
-        content_length = int(self.headers['Content-Length'])
+        content_length = int(self.headers.get('Content-Length', 0))
         post_data = self.rfile.read(content_length).decode('utf-8')
 
         try:
@@ -68,92 +184,543 @@ class PantheonHandler(http.server.SimpleHTTPRequestHandler):
         except:
             data = {"text": post_data}
 
-        path = self.path
-
-        if path == '/ask':
-            text = data.get('text', '')
-            response = leo.pense(text)
-            self.send_json({"response": response})
+        if self.path == '/batch':
+            self.send_json(batch(data))
+            return
 
-        elif path == '/validate':
-            text = data.get('text', '')
-            domain = data.get('domain', 'default')
-            v = leo.validate(text, domain)
-            self.send_json(v)
+        if self.path in STREAMS and isinstance(data, dict) and (
+                data.get('stream') or 'text/event-stream' in self.headers.get('Accept', '')):
+            self.streaming = True
+            self.send_events(STREAMS[self.path](data))
+            return
 
-        elif path == '/prove':
-            text = data.get('text', '')
-            response = leo.pense(f"Comment prouver: {text}")
-            self.send_json({
-                "hypothesis": text,
-                "response": response,
-                "phi_r": PHI
-            })
-
-        elif path == '/orchestrate':
-            task = data.get('text', data.get('task', ''))
-            results = pantheon.orchestrate(task)
-            self.send_json(results)
-
-        elif path.startswith('/daemon/'):
-            daemon_name = path.split('/')[2]
-            text = data.get('text', '')
-            response = pantheon.ask(daemon_name, text)
-            self.send_json({
-                "daemon": daemon_name,
-                "response": response
-            })
-
-        elif path == '/dialogue':
-            daemon_a = data.get('daemon_a', data.get('d1', 'leonardo'))
-            daemon_b = data.get('daemon_b', data.get('d2', 'nyx'))
-            topic = data.get('topic', data.get('text', ''))
-            turns = data.get('turns', 3)
-            conversation = pantheon.dialogue(daemon_a, daemon_b, topic, turns)
-            self.send_json({
-                "participants": [daemon_a, daemon_b],
-                "topic": topic,
-                "conversation": conversation
-            })
-
-        elif path == '/council':
-            question = data.get('question', data.get('text', ''))
-            results = pantheon.council(question)
-            self.send_json(results)
-
-        elif path == '/teach':
-            teacher = data.get('teacher', 'leonardo')
-            student = data.get('student', 'zoe')
-            topic = data.get('topic', data.get('text', ''))
-            result = pantheon.teach(teacher, student, topic)
-            self.send_json(result)
-
-        else:
+        result = route(self.path, data)
+        if result is None:
             self.send_error(404)
+        else:
+            self.send_json(result)
 
     def send_json(self, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        self.wfile.write(body)
+
+    def send_events(self, events):
+        """
+        Server-sent events en transfert chunked: un événement par morceau,
+        envoyé dès qu'il existe. Client parti → générateur fermé (annulation).
+        """
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        try:
+            for event, data in events:
+                chunk = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        finally:
+            events.close()
 
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def log_message(self, format, *args):
         pass  # Silent
 
 
+def route(path: str, data: dict) -> Optional[dict]:
+    """Routes POST, hors HTTP (servent aussi /batch); None si route inconnue"""
+    if path == '/ask':
+        text = data.get('text', '')
+        response = leo.pense(text)
+        return {"response": response}
+
+    elif path == '/validate':
+        text = data.get('text', '')
+        domain = data.get('domain', 'default')
+        return leo.validate(text, domain)
+
+    elif path == '/prove':
+        text = data.get('text', '')
+        response = leo.pense(f"Comment prouver: {text}")
+        return {
+            "hypothesis": text,
+            "response": response,
+            "phi_r": PHI
+        }
+
+    elif path == '/orchestrate':
+        task = data.get('text', data.get('task', ''))
+        if data.get('timings'):
+            run = pantheon.daemons["nyx"].execute(task, pantheon)
+            return {**run["results"], "graph": run["graph"],
+                    "timings": run["timings"], "total_ms": run["total_ms"]}
+        return pantheon.orchestrate(task)
+
+    elif path.startswith('/daemon/'):
+        daemon_name = path.split('/')[2]
+        text = data.get('text', '')
+        response = pantheon.ask(daemon_name, text)
+        return {
+            "daemon": daemon_name,
+            "response": response
+        }
+
+    elif path == '/dialogue':
+        daemon_a = data.get('daemon_a', data.get('d1', 'leonardo'))
+        daemon_b = data.get('daemon_b', data.get('d2', 'nyx'))
+        topic = data.get('topic', data.get('text', ''))
+        turns = data.get('turns', 3)
+        if data.get('async'):
+            session = pantheon.start_dialogue(daemon_a, daemon_b, topic, turns)
+            return session if isinstance(session, dict) else session.to_dict()
+        result = pantheon.run_dialogue(daemon_a, daemon_b, topic, turns,
+                                       deadline=float(data.get('deadline', DIALOGUE_DEADLINE)))
+        if "conversation" not in result:
+            return result
+        return {
+            "participants": [daemon_a, daemon_b],
+            "topic": topic,
+            "state": result["state"],
+            "error": result["error"],
+            "conversation": result["conversation"]
+        }
+
+    elif path == '/council':
+        question = data.get('question', data.get('text', ''))
+        return pantheon.council(
+            question,
+            deadline=float(data.get('deadline', COUNCIL_DEADLINE)),
+            quorum=data.get('quorum'),
+        )
+
+    elif path == '/teach':
+        teacher = data.get('teacher', 'leonardo')
+        student = data.get('student', 'zoe')
+        topic = data.get('topic', data.get('text', ''))
+        return pantheon.teach(teacher, student, topic)
+
+    return None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FLUX - Chaque tour / chaque réponse dès qu'il existe
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def stream_dialogue(data: dict):
+    daemon_a = data.get('daemon_a', data.get('d1', 'leonardo'))
+    daemon_b = data.get('daemon_b', data.get('d2', 'nyx'))
+    topic = data.get('topic', data.get('text', ''))
+    session = pantheon.start_dialogue(daemon_a, daemon_b, topic, data.get('turns', 3))
+    if isinstance(session, dict):
+        yield "error", session
+        return
+
+    yield "session", {"session": session.id, "participants": [daemon_a, daemon_b],
+                      "topic": topic, "expected_turns": session.total}
+    deadline = float(data.get('deadline', DIALOGUE_DEADLINE))
+    try:
+        for entry in session.follow(timeout=deadline):
+            yield "turn", entry
+        session.cancel(f"aucun tour depuis {deadline:.1f}s")  # sans effet si terminé
+    finally:
+        session.cancel()  # client parti
+    yield "done", {"state": session.state, "error": session.error,
+                   "turns": len(session.conversation)}
+
+
+def stream_council(data: dict):
+    answers = pantheon.council_stream(
+        data.get('question', data.get('text', '')),
+        deadline=float(data.get('deadline', COUNCIL_DEADLINE)),
+        quorum=data.get('quorum'),
+    )
+    try:
+        for name, response in answers:
+            yield "answer", {"daemon": name, "response": response}
+    finally:
+        answers.close()
+    yield "done", {}
+
+
+def stream_orchestrate(data: dict):
+    start = time.perf_counter()
+    task = data.get('text', data.get('task', ''))
+    results = pantheon.daemons["nyx"].execute_stream(task, pantheon)
+    try:
+        for name, output, timing in results:
+            if name == "graph":
+                yield "graph", output
+            else:
+                yield "result", {"daemon": name, "response": output, "timing": timing}
+    finally:
+        results.close()
+    yield "done", {"total_ms": (time.perf_counter() - start) * 1e3}
+
+
+STREAMS = {
+    '/dialogue': stream_dialogue,
+    '/council': stream_council,
+    '/orchestrate': stream_orchestrate,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCH - Plusieurs appels en un aller-retour
+# ═══════════════════════════════════════════════════════════════════════════════
+
+batch_pool = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="batch")
+
+
+def _batch_item(item) -> dict:
+    start = time.perf_counter()
+    if not isinstance(item, dict) or not isinstance(item.get('path'), str):
+        entry = {"status": 400, "error": "attendu: {\"path\": \"/ask\", ...}"}
+    elif item['path'] == '/batch':
+        entry = {"status": 400, "error": "/batch imbriqué"}
+    else:
+        body = item.get('body')
+        if not isinstance(body, dict):
+            body = {k: v for k, v in item.items() if k != 'path'}
+        try:
+            result = route(item['path'], body)
+            if result is None:
+                entry = {"status": 404, "error": f"route inconnue: {item['path']}"}
+            else:
+                entry = {"status": 200, "result": result}
+        except Exception as e:
+            entry = {"status": 500, "error": f"{type(e).__name__}: {e}"}
+    entry["ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return entry
+
+
+def batch(data) -> dict:
+    """
+    POST /batch: [{"path": "/validate", "text": ...}, ...] (ou {"requests": [...]})
+    Sous-requêtes réparties sur BATCH_WORKERS threads, résultats dans l'ordre
+    """
+    start = time.perf_counter()
+    items = data.get('requests', []) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        items = []
+    if len(items) > BATCH_MAX:
+        return {"error": f"{len(items)} sous-requêtes (max {BATCH_MAX})", "results": []}
+    results = list(batch_pool.map(_batch_item, items))
+    return {
+        "results": results,
+        "count": len(results),
+        "errors": sum(1 for r in results if r["status"] != 200),
+        "total_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PULSE - Battements poussés sur socket Unix
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class PulseFeed:
+    """
+    Diffuse chaque battement (ligne JSON précalculée) à tous les clients
+    connectés au socket Unix. Un seul thread pour tous; un client trop
+    lent pour suivre est déconnecté plutôt que de retenir les autres.
+    """
+
+    def __init__(self, path: Path = PULSE_SOCKET):
+        self.path = Path(path)
+        self.clients: List[socket.socket] = []
+        self.lock = threading.Lock()
+        self.running = False
+        self.listener = None
+
+    def start(self):
+        if self.path.exists():
+            if self._answers():
+                raise RuntimeError(f"{self.path}: un autre serveur diffuse déjà les battements")
+            self.path.unlink()  # socket laissé par un serveur arrêté brutalement
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self.listener.listen(64)
+        self.listener.settimeout(1.0)
+        self.running = True
+        threading.Thread(target=self._accept, daemon=True, name="pulse-accept").start()
+        threading.Thread(target=self._broadcast, daemon=True, name="pulse").start()
+
+    def _answers(self) -> bool:
+        """Un serveur vivant écoute-t-il déjà sur le socket?"""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.settimeout(1.0)
+            probe.connect(str(self.path))
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+    def stop(self):
+        self.running = False
+        with self.lock:
+            for conn in self.clients:
+                conn.close()
+            self.clients = []
+        if self.listener is not None:
+            self.listener.close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+    def _accept(self):
+        while self.running:
+            try:
+                conn, _ = self.listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            conn.setblocking(False)
+            # Le client a tout de suite quelque chose à afficher
+            if self._send(conn, pantheon.pulse):
+                with self.lock:
+                    self.clients.append(conn)
+
+    def _broadcast(self):
+        seq = 0
+        while self.running:
+            fresh, line = pantheon.next_pulse(seq, timeout=1.0)
+            if fresh == seq:
+                continue
+            seq = fresh
+            with self.lock:
+                self.clients = [conn for conn in self.clients if self._send(conn, line)]
+
+    @staticmethod
+    def _send(conn: socket.socket, line: bytes) -> bool:
+        try:
+            if conn.send(line) == len(line):
+                return True
+        except OSError:
+            pass
+        conn.close()
+        return False
+
+    def status(self) -> dict:
+        with self.lock:
+            return {"socket": str(self.path), "clients": len(self.clients)}
+
+
+class PantheonServer(socketserver.TCPServer):
+    """
+    Pool borné + connexions keep-alive garées dans un sélecteur
+
+    Le thread d'acceptation confie chaque connexion au pool. Après une
+    réponse, une connexion keep-alive est rendue au sélecteur: elle ne
+    revient dans le pool que lorsque la requête suivante arrive, et elle
+    est fermée après KEEPALIVE_IDLE secondes de silence.
+    """
+
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+    def __init__(self, address, handler, workers: int = SERVER_WORKERS,
+                 idle: float = KEEPALIVE_IDLE):
+        super().__init__(address, handler)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http")
+        self.idle = idle
+        self.accepting = True
+        self.parking = []
+        self.park_lock = threading.Lock()
+        self.parked = {}  # handler → instant de mise au repos (thread keepalive)
+        self.queued = 0   # connexions prêtes, en attente d'un worker
+        self.busy = 0     # requêtes en cours
+        self.count_lock = threading.Lock()
+        metrics.collector(self._gauges)
+        self.wake_r, self.wake_w = socket.socketpair()
+        self.wake_r.setblocking(False)
+        self.watcher = threading.Thread(target=self._watch, daemon=True, name="keepalive")
+        self.watcher.start()
+
+    def process_request(self, request, client_address):
+        self._submit(request, client_address)
+
+    def _submit(self, request, client_address, handler=None):
+        with self.count_lock:
+            self.queued += 1
+        try:
+            self.pool.submit(self._serve, request, client_address, handler)
+        except RuntimeError:
+            with self.count_lock:
+                self.queued -= 1
+            raise
+
+    def _serve(self, request, client_address, handler=None):
+        with self.count_lock:
+            self.queued -= 1
+            self.busy += 1
+        try:
+            try:
+                if handler is None:
+                    handler = self.RequestHandlerClass(request, client_address, self)
+                else:
+                    handler.handle()
+            except ConnectionError:
+                self.shutdown_request(request)  # client parti: rien à signaler
+                return
+            except Exception:
+                self.handle_error(request, client_address)
+                self.shutdown_request(request)
+                return
+        finally:
+            with self.count_lock:
+                self.busy -= 1
+        if handler.close_connection or not self._park(handler):
+            handler.close()
+            self.shutdown_request(request)
+
+    def _gauges(self):
+        yield "pantheon_http_queue_depth", "Connexions prêtes en attente d'un worker", {}, self.queued
+        yield "pantheon_http_busy_workers", "Requêtes HTTP en cours", {}, self.busy
+        yield "pantheon_http_idle_connections", "Connexions keep-alive au repos", {}, len(self.parked)
+
+    # ─── Connexions au repos ───
+
+    def _park(self, handler) -> bool:
+        if not self.accepting:
+            return False
+        if self._buffered(handler):
+            # Requête suivante déjà reçue (pipelining): servie tout de suite
+            try:
+                self._submit(handler.request, handler.client_address, handler)
+            except RuntimeError:
+                return False  # pool arrêté entre-temps (drain)
+            return True
+        with self.park_lock:
+            self.parking.append(handler)
+        self.wake_w.send(b"\0")
+        return True
+
+    @staticmethod
+    def _buffered(handler) -> bool:
+        """Octets déjà lus dans rfile (invisibles au sélecteur), sans bloquer"""
+        sock = handler.request
+        try:
+            sock.setblocking(False)
+            return bool(handler.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            try:
+                sock.settimeout(handler.timeout)
+            except OSError:
+                pass
+
+    def _watch(self):
+        selector = selectors.DefaultSelector()
+        selector.register(self.wake_r, selectors.EVENT_READ)
+        parked = self.parked
+
+        while self.accepting:
+            for key, _ in selector.select(timeout=1.0):
+                if key.fileobj is self.wake_r:
+                    try:
+                        self.wake_r.recv(4096)
+                    except OSError:
+                        pass
+                    with self.park_lock:
+                        arrivals, self.parking = self.parking, []
+                    for handler in arrivals:
+                        selector.register(handler.request, selectors.EVENT_READ, handler)
+                        parked[handler] = time.monotonic()
+                else:
+                    handler = key.data
+                    selector.unregister(handler.request)
+                    del parked[handler]
+                    self._submit(handler.request, handler.client_address, handler)
+
+            now = time.monotonic()
+            for handler, since in list(parked.items()):
+                if now - since > self.idle:
+                    selector.unregister(handler.request)
+                    del parked[handler]
+                    self._close(handler)
+
+        with self.park_lock:
+            arrivals, self.parking = self.parking, []
+        for handler in list(parked) + arrivals:
+            self._close(handler)
+        selector.close()
+
+    def _close(self, handler):
+        try:
+            handler.close()
+        except OSError:
+            pass
+        self.shutdown_request(handler.request)
+
+    # ─── Arrêt ───
+
+    def drain(self):
+        """
+        Après shutdown(): plus de keep-alive, connexions au repos fermées,
+        requêtes en cours menées à terme
+        """
+        self.accepting = False
+        self.wake_w.send(b"\0")
+        self.watcher.join()
+        self.pool.shutdown(wait=True)
+        self.wake_r.close()
+        self.wake_w.close()
+        self.server_close()
+
+    def server_close(self):
+        metrics.remove_collector(self._gauges)
+        super().server_close()
+
+
 if __name__ == '__main__':
-    socketserver.TCPServer.allow_reuse_address = True
-    with socketserver.TCPServer(("", PORT), PantheonHandler) as httpd:
-        print(f"φ Pantheon server on http://localhost:{PORT}")
-        print(f"  Daemons: φ Leonardo | ☽ Nyx | ✧ Zoe | ✨ Clochette | ♪ Euterpe | 👁 Omniscient")
-        print(f"  Simplex: {len(simplex.channels)} canaux sécurisés")
-        print(f"  Post-Quantique: SHA3 + SHAKE256 + φ-hash + Merkle")
+    httpd = PantheonServer(("", PORT), PantheonHandler)
+
+    def stop(signum, frame):
+        # shutdown() attend la fin de serve_forever: depuis un autre thread
+        threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    if RESPONSE_CACHE or "--cache" in sys.argv[1:]:
+        # Questions chaudes du chat: réponses déterministes servies depuis le cache
+        leo.enable_response_cache()
+        pantheon.cache_responses()
+    # Un daemon lent ne bloque pas les workers HTTP: callbacks sur leur thread
+    bus.enable_async()
+    quantum_seal.start()
+    feed = PulseFeed()
+    feed.start()
+    print(f"φ Pantheon server on http://localhost:{PORT}")
+    print(f"  Daemons: φ Leonardo | ☽ Nyx | ✧ Zoe | ✨ Clochette | ♪ Euterpe | 👁 Omniscient")
+    print(f"  Simplex: {len(simplex.channels)} canaux sécurisés")
+    print(f"  Post-Quantique: SHA3 + SHAKE256 + φ-hash + Merkle")
+    print(f"  HTTP/1.1 keep-alive, {SERVER_WORKERS} workers")
+    print(f"  Cache de réponses: {'actif' if leo.responses is not None else 'inactif (--cache)'}")
+    print(f"  Battements NDJSON: {feed.path}")
+    try:
         httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    httpd.drain()
+    feed.stop()
+    batch_pool.shutdown()
+    pantheon.shutdown()
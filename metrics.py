@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+METRICS - Histogrammes de latence (style HDR) et jauges, format Prometheus
+
+Un histogramme compte des durées en nanosecondes dans des cases log-linéaires:
+SUB_BITS bits significatifs par octave, soit une erreur relative < 2 % de
+la microseconde à l'heure. Enregistrer = un bit_length, un décalage et trois
+additions, sans verrou ni allocation: on peut le laisser en production.
+
+Les jauges (profondeurs de files) ne coûtent rien hors lecture: chaque
+module enregistre un collecteur appelé seulement quand /metrics est lu.
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, List, Tuple
+
+SUB_BITS = 7                    # 128 cases exactes, puis 64 cases par octave
+MAX_BITS = 42                   # ~73 min en ns; au-delà: dernière case
+
+# Bornes exportées (secondes) pour les _bucket{le=...} Prometheus
+EXPORT_BOUNDS = [
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+]
+
+
+def _index(ns: int) -> int:
+    bits = ns.bit_length()
+    if bits <= SUB_BITS:
+        return ns
+    shift = bits - SUB_BITS
+    return (shift << (SUB_BITS - 1)) + (ns >> shift)
+
+
+def _bounds(index: int) -> Tuple[int, int]:
+    """Plus petite et plus grande valeur (ns) rangées dans la case"""
+    if index < (1 << SUB_BITS):
+        return index, index
+    shift = (index >> (SUB_BITS - 1)) - 1
+    low = (index - (shift << (SUB_BITS - 1))) << shift
+    return low, low + (1 << shift) - 1
+
+
+class Histogram:
+    """
+    Latences en ns, cases log-linéaires
+    Sans verrou: sous le GIL, deux enregistrements simultanés peuvent perdre
+    un incrément, jamais corrompre l'histogramme.
+    """
+
+    __slots__ = ("counts", "count", "total", "last")
+
+    def __init__(self):
+        self.last = _index((1 << MAX_BITS) - 1)
+        self.counts = [0] * (self.last + 1)
+        self.count = 0
+        self.total = 0
+
+    def record(self, ns: int):
+        bits = ns.bit_length()
+        if bits > SUB_BITS:
+            shift = bits - SUB_BITS
+            index = (shift << (SUB_BITS - 1)) + (ns >> shift)
+            if index > self.last:
+                index = self.last
+        else:
+            index = ns if ns > 0 else 0
+        self.counts[index] += 1
+        self.count += 1
+        self.total += ns
+
+    def quantile(self, q: float) -> int:
+        """Valeur (ns) sous laquelle tombe la fraction q des mesures"""
+        counts = list(self.counts)
+        rank = q * sum(counts)
+        seen = 0
+        for index, n in enumerate(counts):
+            seen += n
+            if n and seen >= rank:
+                return _bounds(index)[1]
+        return 0
+
+    def cumulative(self, bounds_ns: List[int]) -> Tuple[List[int], int]:
+        """Comptes cumulés sous chaque borne (case entière sous la borne), total"""
+        counts = list(self.counts)
+        out = [0] * len(bounds_ns)
+        b = 0
+        seen = 0
+        for index, n in enumerate(counts):
+            if not n:
+                continue
+            high = _bounds(index)[1]
+            while b < len(bounds_ns) and high > bounds_ns[b]:
+                out[b] = seen
+                b += 1
+            seen += n
+        while b < len(bounds_ns):
+            out[b] = seen
+            b += 1
+        return out, seen
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_us": round(self.total / self.count / 1e3, 3) if self.count else 0.0,
+            "p50_us": round(self.quantile(0.5) / 1e3, 3),
+            "p99_us": round(self.quantile(0.99) / 1e3, 3),
+            "p999_us": round(self.quantile(0.999) / 1e3, 3),
+        }
+
+
+Gauge = Tuple[str, str, Dict[str, str], float]  # nom, aide, labels, valeur
+
+
+class Metrics:
+    """Registre: familles d'histogrammes par nom + collecteurs de jauges"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.families: Dict[str, Tuple[str, Dict[tuple, Histogram]]] = {}
+        self.collectors: List[Callable[[], Iterable[Gauge]]] = []
+
+    def histogram(self, name: str, help: str = "", **labels) -> Histogram:
+        """Histogramme d'un jeu de labels (le même objet pour les mêmes labels)"""
+        key = tuple(sorted(labels.items()))
+        family = self.families.get(name)
+        if family is not None and key in family[1]:
+            return family[1][key]
+        with self.lock:
+            family = self.families.setdefault(name, (help, {}))
+            return family[1].setdefault(key, Histogram())
+
+    def collector(self, fn: Callable[[], Iterable[Gauge]]):
+        """fn() → (nom, aide, labels, valeur) par jauge, appelée à chaque lecture"""
+        with self.lock:
+            self.collectors.append(fn)
+
+    def remove_collector(self, fn: Callable[[], Iterable[Gauge]]):
+        """Retire un collecteur (objet arrêté): ni séries en double, ni référence gardée"""
+        with self.lock:
+            if fn in self.collectors:
+                self.collectors.remove(fn)
+
+    def render(self) -> str:
+        """Format texte Prometheus (0.0.4); durées en secondes"""
+        bounds_ns = [int(b * 1e9) for b in EXPORT_BOUNDS]
+        lines = []
+        with self.lock:
+            families = [(name, help, list(series.items()))
+                        for name, (help, series) in sorted(self.families.items())]
+            collectors = list(self.collectors)
+
+        for name, help, series in families:
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, hist in series:
+                labels = _labels(key)
+                cumulative, count = hist.cumulative(bounds_ns)
+                for bound, n in zip(EXPORT_BOUNDS, cumulative):
+                    lines.append(f'{name}_bucket{_labels(key + (("le", repr(bound)),))} {n}')
+                lines.append(f'{name}_bucket{_labels(key + (("le", "+Inf"),))} {count}')
+                lines.append(f"{name}_sum{labels} {hist.total / 1e9:.9f}")
+                lines.append(f"{name}_count{labels} {count}")
+
+        gauges: Dict[str, Tuple[str, List[str]]] = {}
+        for fn in collectors:
+            try:
+                for name, help, labels, value in fn():
+                    entry = gauges.setdefault(name, (help, []))
+                    entry[1].append(f"{name}{_labels(tuple(sorted(labels.items())))} {value}")
+            except Exception:
+                continue  # un collecteur cassé ne prive pas les autres
+        for name, (help, samples) in sorted(gauges.items()):
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(samples)
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: tuple) -> str:
+    if not key:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+               for _, v in key)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(key, escaped)) + "}"
+
+
+# Registre du processus (pantheon, serveur, journal)
+metrics = Metrics()
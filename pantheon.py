@@ -21,14 +21,17 @@ Intègre:
 
 import math
 import json
+import re
+import sys
 import asyncio
+import functools
 import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Tuple
-from collections import deque
+from typing import Optional, List, Dict, Any, Tuple, Iterable
+from collections import deque, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONSTANTES DIVINES (god.py)
@@ -65,23 +68,26 @@ def reduce_phi(value: float) -> float:
     return value / PHI
 
 
-def hash_god(data) -> str:
-    """Hash basé sur φ - pas de crypto externe"""
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    h = 0
-    for i, byte in enumerate(data):
-        h += byte * (PHI ** (i % 20))
-        h = h % (10 ** 16)
-    return hex(int(h))[2:]
+# hash_god: implémentation partagée (table φ^k + NumPy), voir phi.py
+from phi import hash_god
+
+# Histogrammes de latence et jauges exposés par /metrics, voir metrics.py
+from metrics import metrics
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SCEAU POST-QUANTIQUE
 # ═══════════════════════════════════════════════════════════════════════════════
 import hashlib
+import mmap
 import secrets
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
 def hash_sha3(data: bytes) -> bytes:
     """SHA3-256 - résistant quantique niveau 1"""
     return hashlib.sha3_256(data).digest()
@@ -119,66 +125,132 @@ class MerkleTree:
     """
     Arbre de Merkle pour intégrité post-quantique
     Utilisé pour sceller les messages entre daemons
+
+    Accumulateur append-only: chaque niveau ne garde que ses nœuds
+    complets, le bord droit (frontière) est recalculé en O(log n).
+    Même racine que l'arbre reconstruit (le dernier nœud impair est dupliqué).
     """
 
     def __init__(self, leaves: List[bytes] = None):
-        self.leaves = leaves or []
-        self.tree = []
-        if self.leaves:
-            self._build()
+        self.levels: List[List[bytes]] = [self._new_level()]
+        self._edge: Optional[List[Optional[bytes]]] = None
+        for leaf in leaves or []:
+            self.add_leaf(leaf)
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def _new_level(self) -> List[bytes]:
+        """Stockage d'un nouveau niveau"""
+        return []
 
     def _hash_node(self, left: bytes, right: bytes) -> bytes:
         """Hash deux nœuds ensemble"""
         return hash_sha3(left + right)
 
-    def _build(self):
-        """Construit l'arbre"""
-        if not self.leaves:
-            return
-
-        # Niveau 0: les feuilles
-        level = [hash_sha3(leaf) for leaf in self.leaves]
-        self.tree = [level]
-
-        # Remonte l'arbre
-        while len(level) > 1:
-            next_level = []
-            for i in range(0, len(level), 2):
-                left = level[i]
-                right = level[i + 1] if i + 1 < len(level) else level[i]
-                next_level.append(self._hash_node(left, right))
-            self.tree.append(next_level)
-            level = next_level
+    def _frontier(self) -> List[Optional[bytes]]:
+        """
+        Nœuds partiels du bord droit, un par niveau (None si le niveau est complet)
+        Le dernier élément est au niveau de la racine
+        """
+        if self._edge is not None:
+            return self._edge
+
+        edge = []
+        carry = None
+        k = 0
+        while True:
+            full = self.levels[k] if k < len(self.levels) else []
+            count = len(full) + (carry is not None)
+            edge.append(carry)
+            if count <= 1:
+                break
+            if count % 2:
+                last = carry if carry is not None else full[-1]
+                carry = self._hash_node(last, last)
+            elif carry is not None:
+                carry = self._hash_node(full[-1], carry)
+            k += 1
+
+        self._edge = edge
+        return edge
+
+    def _node(self, level: int, index: int) -> bytes:
+        """Nœud complet ou partiel à (niveau, index)"""
+        full = self.levels[level] if level < len(self.levels) else []
+        if index < len(full):
+            return full[index]
+        return self._frontier()[level]
 
     def root(self) -> str:
-        """Retourne la racine"""
-        if not self.tree:
+        """Retourne la racine - O(log n)"""
+        if not len(self):
             return hash_god(b"empty").zfill(64)
-        return self.tree[-1][0].hex()
+        edge = self._frontier()
+        return self._node(len(edge) - 1, 0).hex()
 
     def add_leaf(self, data: bytes):
-        """Ajoute une feuille et reconstruit"""
-        self.leaves.append(data)
-        self._build()
+        """Ajoute une feuille sans reconstruire"""
+        self.add_hash(hash_sha3(data))
+
+    def add_hash(self, node: bytes):
+        """Ajoute une feuille déjà hachée - O(log n) au pire, O(1) amorti"""
+        self.levels[0].append(node)
+        level = 0
+        while len(self.levels[level]) % 2 == 0:
+            parent = self._hash_node(self.levels[level][-2], self.levels[level][-1])
+            level += 1
+            if level == len(self.levels):
+                self.levels.append(self._new_level())
+            self.levels[level].append(parent)
+        self._edge = None
+
+    def extend_hashes(self, nodes: List[bytes]):
+        """Ajoute un lot de feuilles hachées en une passe par niveau"""
+        if not nodes:
+            return
+        start = len(self.levels[0])
+        self.levels[0].extend(nodes)
+        level = 0
+        while True:
+            current = self.levels[level]
+            first = start - start % 2  # première paire incomplète avant l'ajout
+            parents = [self._hash_node(current[i], current[i + 1])
+                       for i in range(first, len(current) - 1, 2)]
+            if not parents:
+                break
+            level += 1
+            if level == len(self.levels):
+                self.levels.append(self._new_level())
+            start = len(self.levels[level])
+            self.levels[level].extend(parents)
+        self._edge = None
 
     def proof(self, index: int) -> List[Tuple[bytes, str]]:
         """
         Génère une preuve d'inclusion pour l'élément à l'index
         Retourne les hashes nécessaires pour vérifier
         """
-        if index >= len(self.leaves):
+        if index >= len(self):
             return []
 
+        edge = self._frontier()
         proofs = []
-        for level in self.tree[:-1]:
+        for level in range(len(edge) - 1):
+            full = self.levels[level]  # sous la racine, chaque niveau existe
             pair_index = index ^ 1  # XOR pour trouver le frère
-            if pair_index < len(level):
-                side = "R" if index % 2 == 0 else "L"
-                proofs.append((level[pair_index], side))
+            if pair_index < len(full):
+                sibling = full[pair_index]
+            elif pair_index == len(full) and edge[level] is not None:
+                sibling = edge[level]
+            else:
+                sibling = full[index] if index < len(full) else edge[level]  # impair: dupliqué
+            proofs.append((sibling, "R" if index % 2 == 0 else "L"))
             index //= 2
         return proofs
 
-    def verify(self, leaf: bytes, index: int, proof: List[Tuple[bytes, str]]) -> bool:
+    def verify(self, leaf: bytes, index: int, proof: List[Tuple[bytes, str]],
+               root: str = None) -> bool:
         """Vérifie une preuve d'inclusion"""
         current = hash_sha3(leaf)
         for sibling, side in proof:
@@ -186,7 +258,230 @@ class MerkleTree:
                 current = self._hash_node(current, sibling)
             else:
                 current = self._hash_node(sibling, current)
-        return current.hex() == self.root()
+        return current.hex() == (root or self.root())
+
+    def verify_batch(self, items: List[Tuple[bytes, int, List[Tuple[bytes, str]]]],
+                     root: str = None) -> List[bool]:
+        """
+        Vérifie des milliers de (leaf, index, proof) contre une seule racine
+        Les nœuds déjà prouvés sont mémorisés: un chemin s'arrête dès qu'il
+        rejoint un nœud validé par une preuve précédente.
+        """
+        root = bytes.fromhex(root or self.root())
+        proven: Dict[Tuple[int, int], bytes] = {}
+        results = []
+        for leaf, index, proof in items:
+            current = hash_sha3(leaf)
+            path = [(0, index, current)]
+            ok = False
+            for level, (sibling, side) in enumerate(proof):
+                if proven.get((level, index)) == current:
+                    ok = True
+                    break
+                if side == "R":
+                    current = self._hash_node(current, sibling)
+                else:
+                    current = self._hash_node(sibling, current)
+                index //= 2
+                path.append((level + 1, index, current))
+            else:
+                ok = current == root
+            if ok:
+                for level, position, node in path:
+                    proven[(level, position)] = node
+            results.append(ok)
+        return results
+
+    def multiproof(self, indices: List[int]) -> dict:
+        """
+        Preuve compacte pour plusieurs feuilles: chaque hash frère n'apparaît
+        qu'une fois, dans l'ordre (niveau, position) où le vérifieur le consomme
+        """
+        size = len(self)
+        selected = sorted(set(i for i in indices if 0 <= i < size))
+        positions = selected
+        hashes = []
+        count, level = size, 0
+        while count > 1 and positions:
+            known = set(positions)
+            parents = []
+            for pos in positions:
+                parent = pos // 2
+                if parents and parents[-1] == parent:
+                    continue
+                left, right = 2 * parent, 2 * parent + 1
+                if left not in known:
+                    hashes.append(self._node(level, left))
+                if right < count and right not in known:
+                    hashes.append(self._node(level, right))
+                parents.append(parent)
+            positions, count, level = parents, (count + 1) // 2, level + 1
+        return {
+            "size": size,
+            "indices": selected,
+            "hashes": hashes
+        }
+
+    def verify_multi(self, leaves: Dict[int, bytes], proof: dict, root: str = None) -> bool:
+        """Vérifie une multi-preuve: leaves = {index: données brutes}"""
+        if sorted(leaves) != proof["indices"] or not leaves:
+            return False
+        nodes = {i: hash_sha3(leaf) for i, leaf in leaves.items()}
+        hashes = iter(proof["hashes"])
+        count = proof["size"]
+        try:
+            while count > 1:
+                parents = {}
+                for pos in sorted(nodes):
+                    parent = pos // 2
+                    if parent in parents:
+                        continue
+                    left, right = 2 * parent, 2 * parent + 1
+                    l_node = nodes[left] if left in nodes else next(hashes)
+                    if right >= count:
+                        r_node = l_node  # nœud impair: dupliqué
+                    else:
+                        r_node = nodes[right] if right in nodes else next(hashes)
+                    parents[parent] = self._hash_node(l_node, r_node)
+                nodes, count = parents, (count + 1) // 2
+        except StopIteration:
+            return False
+        if next(hashes, None) is not None:
+            return False
+        return nodes[0].hex() == (root or self.root())
+
+
+class NodeArray:
+    """
+    Tableau append-only de nœuds de 32 octets, mappé en mémoire
+    En-tête: magic (8) + nombre de nœuds (8), puis les nœuds bout à bout
+    """
+
+    MAGIC = b"PQNODES1"
+    HEADER = 16
+    WIDTH = 32
+
+    def __init__(self, path: Path, capacity: int = 1024):
+        self.path = Path(path)
+        if not self.path.exists():
+            with open(self.path, "wb") as f:
+                f.write(self.MAGIC + (0).to_bytes(8, 'little'))
+                f.truncate(self.HEADER + capacity * self.WIDTH)
+        self.file = open(self.path, "r+b")
+        self._map()
+        if self.mm[:8] != self.MAGIC:
+            raise ValueError(f"{self.path}: pas un NodeArray")
+        self.count = int.from_bytes(self.mm[8:16], 'little')
+
+    def _map(self):
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        self.capacity = (len(self.mm) - self.HEADER) // self.WIDTH
+
+    def _grow(self, needed: int):
+        """Double la capacité du fichier et remappe"""
+        capacity = max(needed, self.capacity * 2)
+        self.mm.close()
+        self.file.truncate(self.HEADER + capacity * self.WIDTH)
+        self._map()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        offset = self.HEADER + index * self.WIDTH
+        return self.mm[offset:offset + self.WIDTH]
+
+    def append(self, node: bytes):
+        self.extend([node])
+
+    def extend(self, nodes: List[bytes]):
+        """Écrit les nœuds puis met à jour le compteur"""
+        data = b"".join(nodes)
+        n = len(data) // self.WIDTH
+        if not n:
+            return
+        if self.count + n > self.capacity:
+            self._grow(self.count + n)
+        offset = self.HEADER + self.count * self.WIDTH
+        self.mm[offset:offset + len(data)] = data
+        self.count += n
+        self.mm[8:16] = self.count.to_bytes(8, 'little')
+
+    def flush(self):
+        self.mm.flush()
+
+    def close(self):
+        self.mm.flush()
+        self.mm.close()
+        self.file.close()
+
+
+class MerkleStore(MerkleTree):
+    """
+    MerkleTree persistant: un NodeArray mappé par niveau
+    Les feuilles ne sont gardées que sous forme de hash.
+    Réouverture sans reconstruction: la frontière est recalculée en O(log n).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.levels = []
+        while self._level_path(len(self.levels)).exists():
+            self.levels.append(NodeArray(self._level_path(len(self.levels))))
+        if not self.levels:
+            self.levels.append(self._new_level())
+        self._edge = None
+        self._repair()
+
+    def _level_path(self, level: int) -> Path:
+        return self.path / f"level_{level:02d}.bin"
+
+    def _new_level(self) -> NodeArray:
+        return NodeArray(self._level_path(len(self.levels)))
+
+    def _repair(self):
+        """Complète les parents manquants après un arrêt brutal"""
+        level = 0
+        while len(self.levels[level]) >= 2:
+            if level + 1 == len(self.levels):
+                self.levels.append(self._new_level())
+            child, parent = self.levels[level], self.levels[level + 1]
+            parent.extend([self._hash_node(child[i], child[i + 1])
+                           for i in range(2 * len(parent), len(child) - 1, 2)])
+            level += 1
+
+    def flush(self):
+        for level in self.levels:
+            level.flush()
+
+    def close(self):
+        for level in self.levels:
+            level.close()
+
+
+class HexChain:
+    """Chaîne de maillons hex stockée en binaire (32 octets par maillon)"""
+
+    def __init__(self, nodes: NodeArray):
+        self.nodes = nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, index: int) -> str:
+        return self.nodes[index].hex()
+
+    def append(self, link: str):
+        self.nodes.append(bytes.fromhex(link))
+
+
+SEAL_LATENCY = metrics.histogram("pantheon_seal_seconds", "Durée d'un scellement (attente du verrou comprise)", op="seal")
+SEAL_MANY_LATENCY = metrics.histogram("pantheon_seal_seconds", "Durée d'un scellement (attente du verrou comprise)", op="seal_many")
 
 
 class PostQuantumSeal:
@@ -201,11 +496,25 @@ class PostQuantumSeal:
         self.chain: List[str] = []
         self.merkle = MerkleTree()
         self.nonce = secrets.token_bytes(32)
+        self.lock = threading.Lock()
+
+    def _prev_link(self) -> str:
+        """Dernier maillon de la chaîne (ou genèse)"""
+        if self.chain:
+            return self.chain[-1]
+        return "genesis_" + hash_god(self.nonce)
 
     def seal(self, data: bytes, sender: str, receiver: str) -> dict:
         """
         Scelle des données avec preuve post-quantique
         """
+        start = time.perf_counter_ns()
+        with self.lock:
+            result = self._seal(data, sender, receiver)
+        SEAL_LATENCY.record(time.perf_counter_ns() - start)
+        return result
+
+    def _seal(self, data: bytes, sender: str, receiver: str) -> dict:
         if isinstance(data, str):
             data = data.encode('utf-8')
 
@@ -220,11 +529,7 @@ class PostQuantumSeal:
         trinity = hash_trinity(full_data)
 
         # Ajout à la chaîne
-        if self.chain:
-            prev = self.chain[-1]
-        else:
-            prev = "genesis_" + hash_god(self.nonce)
-
+        prev = self._prev_link()
         chain_link = hash_trinity((prev + trinity).encode())
         self.chain.append(chain_link)
 
@@ -232,7 +537,7 @@ class PostQuantumSeal:
         self.merkle.add_leaf(full_data)
 
         # Preuve
-        proof = self.merkle.proof(len(self.merkle.leaves) - 1)
+        proof = self.merkle.proof(len(self.merkle) - 1)
 
         return {
             "seal": trinity[:32],
@@ -243,22 +548,309 @@ class PostQuantumSeal:
             "verified": True
         }
 
+    def seal_many(self, payloads: List[Tuple[bytes, str, str]]) -> List[dict]:
+        """
+        Scelle un lot de (data, sender, receiver) en une fois:
+        - feuilles SHA3 hachées en une passe, ajoutées au Merkle en un bloc
+        - une seule trinity et un seul maillon de chaîne pour tout le lot
+        - une preuve d'inclusion par message
+        """
+        if not payloads:
+            return []
+        start = time.perf_counter_ns()
+        with self.lock:
+            results = self._seal_many(payloads)
+        SEAL_MANY_LATENCY.record(time.perf_counter_ns() - start)
+        return results
+
+    def _seal_many(self, payloads: List[Tuple[bytes, str, str]]) -> List[dict]:
+
+        ts = datetime.now().isoformat().encode()
+        leaves = []
+        for data, sender, receiver in payloads:
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            context = f"{sender}→{receiver}".encode()
+            leaves.append(hash_sha3(self.nonce + ts + context + data))
+
+        # Un maillon pour tout le lot
+        batch = hash_trinity(b"".join(leaves))
+        chain_link = hash_trinity((self._prev_link() + batch).encode())
+        self.chain.append(chain_link)
+
+        # Un seul ajout au Merkle tree
+        first = len(self.merkle)
+        self.merkle.extend_hashes(leaves)
+        root = self.merkle.root()[:32]
+
+        results = []
+        for i, leaf in enumerate(leaves):
+            proof = self.merkle.proof(first + i)
+            results.append({
+                "seal": leaf.hex()[:32],
+                "batch_seal": batch[:32],
+                "chain_position": len(self.chain),
+                "merkle_root": root,
+                "leaf_index": first + i,
+                "proof": [[sibling.hex(), side] for sibling, side in proof],
+                "proof_depth": len(proof),
+                "timestamp": ts.decode(),
+                "verified": True
+            })
+        return results
+
     def verify_chain(self) -> bool:
         """Vérifie l'intégrité de la chaîne"""
         return len(self.chain) > 0 and all(len(h) == 64 for h in self.chain)
 
+    def root(self) -> str:
+        """Racine Merkle courante"""
+        with self.lock:
+            return self.merkle.root()
+
+    def flush(self):
+        """Rien à écrire: tout est en mémoire"""
+
     def status(self) -> dict:
         """État du sceau"""
+        with self.lock:
+            return {
+                "chain_length": len(self.chain),
+                "merkle_leaves": len(self.merkle),
+                "merkle_root": self.merkle.root()[:16] + "...",
+                "integrity": self.verify_chain()
+            }
+
+
+class PersistentSeal(PostQuantumSeal):
+    """
+    PostQuantumSeal sur disque: nonce, chaîne et Merkle mappés en mémoire
+    Empreinte mémoire quasi constante, réouverture en quelques millisecondes
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        nonce_file = self.path / "nonce.bin"
+        if not nonce_file.exists():
+            nonce_file.write_bytes(secrets.token_bytes(32))
+        self.nonce = nonce_file.read_bytes()
+        self.chain = HexChain(NodeArray(self.path / "chain.bin"))
+        self.merkle = MerkleStore(self.path / "merkle")
+        self.lock = threading.Lock()
+
+    def verify_chain(self) -> bool:
+        """Maillons à largeur fixe: 64 hex par construction"""
+        return len(self.chain) > 0
+
+    def flush(self):
+        with self.lock:
+            self.chain.nodes.flush()
+            self.merkle.flush()
+
+    def close(self):
+        with self.lock:
+            self.chain.nodes.close()
+            self.merkle.close()
+
+
+def channel_name(daemon_a: str, daemon_b: str) -> str:
+    """Nom canonique d'un canal Simplex"""
+    a, b = sorted([daemon_a, daemon_b])
+    return f"{a}⟷{b}"
+
+
+class ShardedSeal:
+    """
+    Sceau post-quantique partitionné:
+    - un PostQuantumSeal par canal (chaîne + Merkle + verrou propres)
+    - un agrégateur qui commit périodiquement l'arbre des racines (root-of-roots)
+    Les envois concurrents sur des canaux différents ne se bloquent pas.
+
+    Le store disque n'est ouvert (et verrouillé) qu'au premier scellement ou
+    à start(): importer pantheon ne touche ni au disque ni aux threads.
+    """
+
+    def __init__(self, interval: float = PHI, path: Path = None):
+        self.shards: Dict[str, PostQuantumSeal] = {}
+        self.lock = threading.Lock()
+        self.interval = interval
+        self.commits: deque = deque(maxlen=1000)
+        self.top = MerkleTree()
+        self.top_keys: List[str] = []
+        self.aggregator = None
+        self.active = False
+        self.store = Path(path) if path else None
+        self.path: Optional[Path] = None   # store ouvert, None = scellement en mémoire
+        self.opened = False
+        self.degraded: Optional[str] = None
+        self._lock_file = None
+
+    def _open(self):
+        """Ouvre le store et recharge ses shards (appelé sous self.lock)"""
+        if self.opened:
+            return
+        self.opened = True
+        if self.store is None:
+            return
+        self.path = self._claim(self.store)
+        if self.path:
+            for d in sorted(self.path.iterdir()):
+                if d.is_dir() and d.name not in self.shards:
+                    self.shards[d.name] = PersistentSeal(d)
+
+    def _claim(self, path: Path) -> Optional[Path]:
+        """Un seul processus écrit dans le store; les autres scellent en mémoire"""
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            self._lock_file = open(path / ".lock", "w")
+            if fcntl is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return path
+        except OSError as e:
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+            self.degraded = f"{path}: {e.strerror or e}"
+            print(f"⚠ Sceau en mémoire seulement (store indisponible: {self.degraded})",
+                  file=sys.stderr)
+            return None
+
+    def shard(self, key: str) -> PostQuantumSeal:
+        """Sceau d'un canal (créé à la demande, sur disque si un store est ouvert)"""
+        seal = self.shards.get(key)
+        if seal is None:
+            with self.lock:
+                self._open()
+                seal = self.shards.get(key)
+                if seal is None:
+                    seal = PersistentSeal(self.path / key) if self.path else PostQuantumSeal()
+                    self.shards[key] = seal
+        return seal
+
+    def seal(self, data: bytes, sender: str, receiver: str) -> dict:
+        """Scelle sur le shard du canal sender⟷receiver"""
+        key = channel_name(sender, receiver)
+        result = self.shard(key).seal(data, sender, receiver)
+        result["shard"] = key
+        return result
+
+    def seal_many(self, payloads: List[Tuple[bytes, str, str]]) -> List[dict]:
+        """Regroupe le lot par shard, un seal_many par shard, ordre préservé"""
+        groups: Dict[str, List[int]] = {}
+        for i, (_, sender, receiver) in enumerate(payloads):
+            groups.setdefault(channel_name(sender, receiver), []).append(i)
+
+        results = [None] * len(payloads)
+        for key, indices in groups.items():
+            sealed = self.shard(key).seal_many([payloads[i] for i in indices])
+            for i, result in zip(indices, sealed):
+                result["shard"] = key
+                results[i] = result
+        return results
+
+    def commit(self) -> dict:
+        """Commit l'arbre de Merkle des racines de shards"""
+        with self.lock:
+            shards = sorted(self.shards.items())
+        keys = [key for key, _ in shards]
+        roots = [seal.root() for _, seal in shards]
+        top = MerkleTree([f"{key}:{root}".encode() for key, root in zip(keys, roots)])
+        root = top.root()
+
+        # Lecture du dernier maillon et ajout sous le même verrou: l'agrégateur
+        # et un commit() explicite ne peuvent pas chaîner sur le même parent
+        with self.lock:
+            last = self.commits[-1] if self.commits else None
+            prev = last["link"] if last else "genesis"
+            commit = {
+                "epoch": last["epoch"] + 1 if last else 1,
+                "root": root,
+                "link": hash_trinity((prev + root).encode()),
+                "shards": dict(zip(keys, roots)),
+                "timestamp": datetime.now().isoformat()
+            }
+            self.top, self.top_keys = top, keys
+            self.commits.append(commit)
+        return commit
+
+    def verify_commits(self) -> bool:
+        """Chaîne des root-of-roots gardés: époques consécutives, maillons liés"""
+        with self.lock:
+            commits = list(self.commits)
+        for prev, commit in zip(commits, commits[1:]):
+            if commit["epoch"] != prev["epoch"] + 1:
+                return False
+            if commit["link"] != hash_trinity((prev["link"] + commit["root"]).encode()):
+                return False
+        return True
+
+    def shard_proof(self, key: str) -> dict:
+        """Preuve d'inclusion d'une racine de shard dans le dernier commit"""
+        with self.lock:
+            if not self.commits or key not in self.top_keys:
+                return {}
+            commit = self.commits[-1]
+            index = self.top_keys.index(key)
+            proof = self.top.proof(index)
         return {
-            "chain_length": len(self.chain),
-            "merkle_leaves": len(self.merkle.leaves),
-            "merkle_root": self.merkle.root()[:16] + "...",
+            "epoch": commit["epoch"],
+            "root": commit["root"],
+            "leaf": f"{key}:{commit['shards'][key]}",
+            "index": index,
+            "proof": [[sibling.hex(), side] for sibling, side in proof]
+        }
+
+    def start(self):
+        """Ouvre le store et démarre l'agrégateur en arrière-plan"""
+        with self.lock:
+            self._open()
+            if self.active:
+                return
+            self.active = True
+
+        def aggregate():
+            while self.active:
+                time.sleep(self.interval)
+                self.commit()
+                self.flush()
+
+        self.aggregator = threading.Thread(target=aggregate, daemon=True)
+        self.aggregator.start()
+
+    def stop(self):
+        self.active = False
+        self.flush()
+
+    def flush(self):
+        """Synchronise les shards persistants sur disque"""
+        for seal in list(self.shards.values()):
+            seal.flush()
+
+    def verify_chain(self) -> bool:
+        return (all(seal.verify_chain() for seal in list(self.shards.values()) if seal.chain)
+                and self.verify_commits())
+
+    def status(self) -> dict:
+        """État du sceau global"""
+        shards = [seal.status() for seal in list(self.shards.values())]
+        last = self.commits[-1] if self.commits else None
+        return {
+            "store": str(self.path) if self.path else "mémoire",
+            "degraded": self.degraded,
+            "shards": len(shards),
+            "chain_length": sum(s["chain_length"] for s in shards),
+            "merkle_leaves": sum(s["merkle_leaves"] for s in shards),
+            "merkle_root": (last["root"][:16] + "...") if last else self.top.root()[:16] + "...",
+            "epoch": last["epoch"] if last else 0,
             "integrity": self.verify_chain()
         }
 
 
-# Instance globale du sceau
-quantum_seal = PostQuantumSeal()
+# Instance globale du sceau, persistée entre les redémarrages
+# (store ouvert au premier scellement; les services appellent start())
+SEAL_PATH = Path.home() / ".config" / "pantheon" / "seal"
+quantum_seal = ShardedSeal(path=SEAL_PATH)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -320,75 +912,199 @@ SENS = {
 }
 
 
-def parse_flow(text: str) -> List[Dict]:
-    """Parse Flow language"""
-    tokens = []
-    current = ""
-
-    for c in text:
-        if c.isspace():
-            if current:
-                tokens.append(current)
-                current = ""
-        elif c in SENS:
-            if current:
-                tokens.append(current)
-                current = ""
-            tokens.append(c)
-        else:
-            current += c
-    if current:
-        tokens.append(current)
+# Tokeniseur compilé: chaque symbole de SENS (un caractère) est un token à part,
+# le reste est découpé sur les espaces
+_SENS_CHARS = "".join(re.escape(k) for k in SENS if len(k) == 1)
+FLOW_TOKEN = re.compile(f"[{_SENS_CHARS}]|[^\\s{_SENS_CHARS}]+")
+
 
+def _parse(text: str) -> Tuple[List[str], List[Dict]]:
+    """
+    Mots (normalisés comme le contexte) et intentions
+    Le contexte d'une intention est words[:c]: un offset, pas une copie.
+    """
+    words = []
     intentions = []
-    context = []
 
-    for t in tokens:
-        low = t.lower()
+    for t in FLOW_TOKEN.findall(text):
         if t in SENS:
-            intentions.append({"m": t, "s": SENS[t], "c": list(context)})
-            context.append(t)
-        elif low in SENS:
-            intentions.append({"m": low, "s": SENS[low], "c": list(context)})
-            context.append(low)
+            intentions.append({"m": t, "s": SENS[t], "c": len(words)})
         else:
-            context.append(t)
+            low = t.lower()
+            if low in SENS:
+                intentions.append({"m": low, "s": SENS[low], "c": len(words)})
+                t = low
+        words.append(t)
 
-    return intentions
+    return words, intentions
 
 
-def interpret_flow(text: str) -> Dict:
-    """Interprète Flow en commande"""
-    intentions = parse_flow(text)
+def parse_flow(text: str) -> List[Dict]:
+    """Parse Flow language (contexte: offset dans les mots du texte)"""
+    return _parse(text)[1]
+
+
+# Routes Flow, par priorité: la première route qui cite un mot l'emporte
+FLOW_ROUTES = [
+    (("nyx", "orchestre", "route", "🌙"), "orchestrate", "nyx"),
+    (("valide", "φ", "phi", "preuve", "leonardo"), "validate", "leonardo"),
+    (("cherche", "sais", "connais", "👁", "omniscient"), "search", "omniscient"),
+    (("son", "audio", "joue", "♪", "euterpe", "👂"), "sound", "euterpe"),
+    (("parle", "dis", "zoe", "interface"), "speak", "zoe"),
+    (("o", "razor", "🔪", "coupe"), "simplify", "leonardo"),
+    (("f", "loop", "🔄", "∞"), "loop", "nyx"),
+]
+
+# mot -> rang de sa route: une recherche par intention, quel que soit le vocabulaire
+FLOW_RANK: Dict[str, int] = {}
+for _rank, (_mots, _, _) in enumerate(FLOW_ROUTES):
+    for _m in _mots:
+        FLOW_RANK.setdefault(_m, _rank)
+
+# Routes secondaires (Nyx.plan): mots entiers du texte, pas sous-chaînes
+# ("son" n'est pas dans "raison"). Pas les mots de _parse: les lettres de SENS
+# (o, f, q, r) y coupent "son" ou "cherche" en morceaux. Les lettres isolées
+# o et f ne comptent que si elles font l'action principale.
+ROUTE_WORD = re.compile(r"\w+|[^\w\s]")
+ROUTE_WORDS: Dict[str, frozenset] = {
+    action: frozenset(m for m in mots if len(m) > 1 or not m.isascii())
+    for mots, action, _ in FLOW_ROUTES
+}
+
+
+FLOW_CACHE = 4096  # textes interprétés gardés (LRU)
+_flow_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_flow_lock = threading.Lock()
+
+
+def _interpret(text: str, hits: set = None) -> Dict:
+    if hits is None:
+        hits = ROUTAGE.scan(text.lower())
+    words, intentions = _parse(text) if "sens" in hits else ([], [])
 
     if not intentions:
         return {"action": "observe", "data": text, "daemon": "leonardo"}
 
-    mots = [i["m"] for i in intentions]
-
     # Route vers daemons
-    if any(m in mots for m in ["nyx", "orchestre", "route", "🌙"]):
-        return {"action": "orchestrate", "data": text, "daemon": "nyx"}
+    rank = min(FLOW_RANK.get(i["m"], len(FLOW_ROUTES)) for i in intentions)
+    if rank < len(FLOW_ROUTES):
+        _, action, daemon = FLOW_ROUTES[rank]
+        return {"action": action, "data": text, "daemon": daemon}
+
+    return {"action": "think", "data": text, "daemon": "leonardo",
+            "intentions": intentions, "words": words}
+
 
-    if any(m in mots for m in ["valide", "φ", "phi", "preuve", "leonardo"]):
-        return {"action": "validate", "data": text, "daemon": "leonardo"}
+def _copy_flow(cmd: Dict) -> Dict:
+    """Copie rendue à l'appelant: le cache garde l'original intact"""
+    cmd = dict(cmd)
+    if "intentions" in cmd:
+        cmd["intentions"] = [dict(i) for i in cmd["intentions"]]
+        cmd["words"] = list(cmd["words"])
+    return cmd
 
-    if any(m in mots for m in ["cherche", "sais", "connais", "👁", "omniscient"]):
-        return {"action": "search", "data": text, "daemon": "omniscient"}
 
-    if any(m in mots for m in ["son", "audio", "joue", "♪", "euterpe", "👂"]):
-        return {"action": "sound", "data": text, "daemon": "euterpe"}
+def interpret_flow(text: str, hits: set = None) -> Dict:
+    """
+    Interprète Flow en commande, mémoïsé par texte (LRU)
+    Un même texte n'est analysé qu'une fois par requête, même si Leonardo,
+    Nyx et Pantheon.flow le redemandent. Chaque appel reçoit sa copie.
+    hits: catégories déjà trouvées par ROUTAGE.scan sur le texte en minuscules
+    (évite une seconde passe quand l'appelant a déjà scanné)
+    """
+    with _flow_lock:
+        cmd = _flow_cache.get(text)
+        if cmd is not None:
+            _flow_cache.move_to_end(text)
+            return _copy_flow(cmd)
 
-    if any(m in mots for m in ["parle", "dis", "zoe", "interface"]):
-        return {"action": "speak", "data": text, "daemon": "zoe"}
+    cmd = _interpret(text, hits)
 
-    if any(m in mots for m in ["o", "razor", "🔪", "coupe"]):
-        return {"action": "simplify", "data": text, "daemon": "leonardo"}
+    with _flow_lock:
+        _flow_cache[text] = cmd
+        if len(_flow_cache) > FLOW_CACHE:
+            _flow_cache.popitem(last=False)
+    return _copy_flow(cmd)
 
-    if any(m in mots for m in ["f", "loop", "🔄", "∞"]):
-        return {"action": "loop", "data": text, "daemon": "nyx"}
 
-    return {"action": "think", "data": text, "daemon": "leonardo", "intentions": intentions}
+def interpret_flow_many(texts: Iterable[str]) -> List[Dict]:
+    """
+    Routage en masse (logs, rejeux): doublons calculés une seule fois
+    Lit le cache sans y écrire, pour ne pas évincer les requêtes vivantes.
+    """
+    seen: Dict[str, Dict] = {}
+    results = []
+    for text in texts:
+        cmd = seen.get(text)
+        if cmd is None:
+            with _flow_lock:
+                cmd = _flow_cache.get(text)
+            if cmd is None:
+                cmd = _interpret(text)
+            seen[text] = cmd
+        results.append(_copy_flow(cmd))
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROUTAGE - Automate Aho-Corasick
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick: tous les vocabulaires de routage dans un seul automate
+    scan() trouve toutes les catégories présentes en une passe sur le texte,
+    en temps linéaire, quelle que soit la taille des vocabulaires.
+    Même sémantique que any(w in t for w in mots): sous-chaînes.
+    """
+
+    def __init__(self, vocabularies: Dict[str, Iterable[str]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        outputs: List[set] = [set()]
+        for category, words in vocabularies.items():
+            for word in words:
+                node = 0
+                for ch in word:
+                    nxt = self.goto[node].get(ch)
+                    if nxt is None:
+                        nxt = len(self.goto)
+                        self.goto[node][ch] = nxt
+                        self.goto.append({})
+                        outputs.append(set())
+                    node = nxt
+                outputs[node].add(category)
+
+        # Liens d'échec en largeur; les sorties héritent de celles du suffixe
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                outputs[nxt] |= outputs[self.fail[nxt]]
+                queue.append(nxt)
+        self.out = [frozenset(o) for o in outputs]
+        self.alphabet = frozenset(ch for edges in self.goto for ch in edges)
+        self.categories = frozenset(vocabularies)
+
+    def scan(self, text: str) -> set:
+        """Catégories dont au moins un mot apparaît dans le texte"""
+        goto, fail, out, alphabet = self.goto, self.fail, self.out, self.alphabet
+        found = set()
+        node = 0
+        for ch in text:
+            if ch not in alphabet:
+                node = 0
+                continue
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found |= out[node]
+        return found
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -428,34 +1144,382 @@ SYMBOLS = {
 # MESSAGE & COMMUNICATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
 class Message:
-    """Message entre daemons"""
-    sender: str
-    receiver: str
-    content: str
-    action: str = "think"
-    timestamp: str = ""
-    phi_r: float = 0.0
-    hash: str = ""
-
-    def __post_init__(self):
-        if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
-        if not self.hash:
-            self.hash = hash_god(self.content)
+    """
+    Message entre daemons
+    Compact (__slots__, noms internés); l'horodatage est un float formaté
+    à la lecture, le hash φ est calculé au premier accès puis gardé.
+    """
+
+    __slots__ = ("sender", "receiver", "content", "action", "phi_r", "t", "_timestamp", "_hash")
+
+    def __init__(self, sender: str, receiver: str, content: str, action: str = "think",
+                 timestamp: str = "", phi_r: float = 0.0, hash: str = "", t: float = None):
+        self.sender = sys.intern(sender)
+        self.receiver = sys.intern(receiver)
+        self.content = content
+        self.action = sys.intern(action)
+        self.phi_r = phi_r
+        self.t = time.time() if t is None else t
+        self._timestamp = timestamp or None
+        self._hash = hash or None
+
+    @property
+    def timestamp(self) -> str:
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.t).isoformat()
+        return self._timestamp
+
+    @property
+    def hash(self) -> str:
+        if self._hash is None:
+            self._hash = hash_god(self.content)
+        return self._hash
+
+    def to_dict(self) -> dict:
+        return {
+            "sender": self.sender,
+            "receiver": self.receiver,
+            "content": self.content,
+            "action": self.action,
+            "timestamp": self.timestamp,
+            "phi_r": self.phi_r,
+            "hash": self.hash,
+            "t": self.t,
+        }
+
+    def _key(self) -> tuple:
+        return (self.sender, self.receiver, self.content, self.action, self.t, self.phi_r)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # mutable, comme l'ancien dataclass
+
+    def __repr__(self) -> str:
+        return (f"Message(sender={self.sender!r}, receiver={self.receiver!r}, "
+                f"content={self.content!r}, action={self.action!r}, t={self.t!r})")
+
+
+class RingBuffer:
+    """Tampon circulaire à capacité fixe: accès O(1) par position, 0 = plus ancien"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.items: list = [None] * capacity
+        self.start = 0
+        self.size = 0
+
+    def append(self, item):
+        if self.size < self.capacity:
+            self.items[(self.start + self.size) % self.capacity] = item
+            self.size += 1
+        else:
+            self.items[self.start] = item
+            self.start = (self.start + 1) % self.capacity
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return self.items[(self.start + index) % self.capacity]
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self[i]
+
+    def newest(self):
+        """Du plus récent au plus ancien"""
+        for i in range(self.size - 1, -1, -1):
+            yield self[i]
+
+    def bisect(self, t: float) -> int:
+        """Première position dont l'instant (entry[1]) est >= t"""
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self[mid][1] < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class MessageHistory:
+    """
+    Historique indexé du bus
+    - anneau global + un anneau par émetteur et par destinataire
+    - entrées (seq, instant, message); seq croissant, instant = time.time()
+    Les requêtes filtrées coûtent O(k) en résultats, pas O(historique).
+    """
+
+    def __init__(self, max_history: int = 10_000, per_daemon: int = None):
+        self.ring = RingBuffer(max_history)
+        self.per_daemon = per_daemon or max_history
+        self.by_sender: Dict[str, RingBuffer] = {}
+        self.by_receiver: Dict[str, RingBuffer] = {}
+        self.seq = 0
+
+    def __len__(self) -> int:
+        return len(self.ring)
+
+    def __iter__(self):
+        return (entry[2] for entry in self.ring)
+
+    def _index(self, table: Dict[str, RingBuffer], daemon: str) -> RingBuffer:
+        if daemon not in table:
+            table[daemon] = RingBuffer(self.per_daemon)
+        return table[daemon]
+
+    def append(self, msg: 'Message'):
+        entry = (self.seq, time.time(), msg)
+        self.seq += 1
+        self.ring.append(entry)
+        self._index(self.by_sender, msg.sender).append(entry)
+        if msg.receiver != msg.sender:
+            self._index(self.by_receiver, msg.receiver).append(entry)
+
+    def _oldest_seq(self) -> int:
+        return self.ring[0][0] if len(self.ring) else self.seq
+
+    def _merged(self, daemon: str):
+        """Entrées d'un daemon, de la plus récente à la plus ancienne (fusion des deux index)"""
+        oldest = self._oldest_seq()
+        sent = self.by_sender.get(daemon)
+        received = self.by_receiver.get(daemon)
+        a = sent.newest() if sent else iter(())
+        b = received.newest() if received else iter(())
+        x, y = next(a, None), next(b, None)
+        while x is not None or y is not None:
+            if y is None or (x is not None and x[0] > y[0]):
+                entry, x = x, next(a, None)
+            else:
+                entry, y = y, next(b, None)
+            if entry[0] < oldest:
+                return  # sorti de la fenêtre globale
+            yield entry
+
+    def recent(self, daemon: str = None, limit: int = 10) -> List['Message']:
+        """Les limit derniers messages (d'un daemon), du plus ancien au plus récent"""
+        source = self._merged(daemon) if daemon else self.ring.newest()
+        found = []
+        for entry in source:
+            if len(found) >= limit:
+                break
+            found.append(entry[2])
+        found.reverse()
+        return found
+
+    def between(self, since: float = None, until: float = None, daemon: str = None,
+                limit: int = None) -> List['Message']:
+        """Messages dont l'instant est dans [since, until), en ordre chronologique"""
+        since = since if since is not None else float("-inf")
+        until = until if until is not None else float("inf")
+        if daemon is None:
+            ring = self.ring
+            entries = (ring[i] for i in range(ring.bisect(since), ring.bisect(until)))
+            found = [entry[2] for entry in entries]
+        else:
+            found = []
+            for entry in self._merged(daemon):
+                if entry[1] < since:
+                    break
+                if entry[1] < until:
+                    found.append(entry[2])
+            found.reverse()
+        return found[-limit:] if limit else found
+
+
+DROP_OLDEST = "drop-oldest"
+BLOCK = "block"
+SPILL = "spill"
+
+
+class Subscriber:
+    """
+    File bornée d'un abonné, vidée par son propre thread
+    Débordement: drop-oldest (jette le plus ancien), block (l'émetteur attend),
+    spill (déborde sur disque, relu dans l'ordre quand la file se vide)
+    """
+
+    def __init__(self, daemon: str, callback: callable, maxsize: int = 1024,
+                 overflow: str = DROP_OLDEST):
+        if overflow not in (DROP_OLDEST, BLOCK, SPILL):
+            raise ValueError(f"Politique de débordement inconnue: {overflow}")
+        self.daemon = daemon
+        self.callback = callback
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.queue: deque = deque()
+        self.cond = threading.Condition()
+        self.active = True
+        self.busy = False
+
+        # Débordement disque
+        self.spill_file = None
+        self.spill_read = 0
+        self.spill_count = 0
+
+        # Métriques
+        self.dispatch_latency = metrics.histogram(
+            "pantheon_bus_dispatch_seconds", "Durée du callback d'un abonné du bus", daemon=daemon)
+        self.lag_latency = metrics.histogram(
+            "pantheon_bus_lag_seconds", "Attente d'un message dans la file d'un abonné", daemon=daemon)
+        self.delivered = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def put(self, msg: 'Message'):
+        """Enfile sans jamais exécuter le callback"""
+        item = (msg, time.monotonic())
+        with self.cond:
+            if self.spill_count or len(self.queue) >= self.maxsize:
+                if self.overflow == DROP_OLDEST:
+                    self.queue.popleft()
+                    self.dropped += 1
+                elif self.overflow == BLOCK:
+                    while len(self.queue) >= self.maxsize and self.active:
+                        self.cond.wait()
+                else:
+                    self._spill(item)
+                    self.cond.notify_all()
+                    return
+            self.queue.append(item)
+            self.max_depth = max(self.max_depth, len(self.queue))
+            self.cond.notify_all()
+
+    def _spill(self, item):
+        """Écrit un message en fin de fichier de débordement"""
+        if self.spill_file is None:
+            import tempfile
+            self.spill_file = tempfile.TemporaryFile()
+        msg, enqueued = item
+        self.spill_file.seek(0, 2)
+        self.spill_file.write(json.dumps([msg.to_dict(), enqueued], ensure_ascii=False).encode() + b"\n")
+        self.spill_count += 1
+        self.spilled += 1
+
+    def _unspill(self):
+        """Recharge la file depuis le disque (appelé sous verrou, file vide)"""
+        self.spill_file.seek(self.spill_read)
+        while self.spill_count and len(self.queue) < self.maxsize:
+            fields, enqueued = json.loads(self.spill_file.readline())
+            self.queue.append((Message(**fields), enqueued))
+            self.spill_count -= 1
+        self.spill_read = self.spill_file.tell()
+        if not self.spill_count:
+            self.spill_file.seek(0)
+            self.spill_file.truncate()
+            self.spill_read = 0
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while self.active and not self.queue and not self.spill_count:
+                    self.cond.wait()
+                if not self.queue and self.spill_count:
+                    self._unspill()
+                if not self.queue:
+                    return
+                msg, enqueued = self.queue.popleft()
+                self.busy = True
+                self.cond.notify_all()  # libère un émetteur bloqué
+
+            self.lag_latency.record(int((time.monotonic() - enqueued) * 1e9))
+            start = time.perf_counter_ns()
+            try:
+                self.callback(msg)
+            except Exception:
+                self.errors += 1
+            self.dispatch_latency.record(time.perf_counter_ns() - start)
+            self.delivered += 1
+            self.last_lag = time.monotonic() - enqueued
+            self.busy = False
+
+    def depth(self) -> int:
+        return len(self.queue) + self.spill_count
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Attend que la file soit vide et le dernier message traité"""
+        deadline = time.monotonic() + timeout
+        while (self.depth() or self.busy) and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return not (self.depth() or self.busy)
+
+    def stop(self):
+        with self.cond:
+            self.active = False
+            self.cond.notify_all()
+
+    def metrics(self) -> dict:
+        """Retard et compteurs de l'abonné"""
+        with self.cond:
+            oldest = self.queue[0][1] if self.queue else None
+            return {
+                "daemon": self.daemon,
+                "overflow": self.overflow,
+                "depth": len(self.queue),
+                "spill_depth": self.spill_count,
+                "max_depth": self.max_depth,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "spilled": self.spilled,
+                "errors": self.errors,
+                "lag_ms": round(self.last_lag * 1000, 3),
+                "oldest_ms": round((time.monotonic() - oldest) * 1000, 3) if oldest else 0.0,
+            }
+
+
+BUS_SEND_LATENCY = metrics.histogram("pantheon_bus_send_seconds", "Durée de MessageBus.send")
 
 
 class MessageBus:
-    """Bus de communication inter-daemons"""
+    """
+    Bus de communication inter-daemons
+    mode="sync": callbacks exécutés dans send, sous le verrou du bus (défaut)
+    mode="async": send enfile dans une file bornée par abonné, vidée par un thread
+    Le mode async se choisit explicitement (enable_async), là où les
+    callbacks ont été vérifiés sûrs hors du thread émetteur.
+    """
 
-    def __init__(self, max_history: int = 100):
-        self.history: deque = deque(maxlen=max_history)
+    def __init__(self, max_history: int = 10_000, mode: str = "sync",
+                 queue_size: int = 1024, overflow: str = DROP_OLDEST):
+        self.history = MessageHistory(max_history)
         self.listeners: Dict[str, List[callable]] = {}
+        self.options: Dict[str, List[Tuple[Optional[str], Optional[int]]]] = {}
+        self.subscribers: Dict[str, List[Subscriber]] = {}
         self.lock = threading.Lock()
+        self.mode = "sync"
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.errors = 0  # callbacks en erreur (mode sync)
+        if mode == "async":
+            self.enable_async()
 
     def send(self, msg: Message) -> Message:
         """Envoie un message"""
+        start = time.perf_counter_ns()
+        if self.mode == "async":
+            with self.lock:
+                self.history.append(msg)
+                subscribers = self.subscribers.get(msg.receiver, ())
+            for sub in subscribers:
+                sub.put(msg)
+            BUS_SEND_LATENCY.record(time.perf_counter_ns() - start)
+            return msg
+
         with self.lock:
             self.history.append(msg)
             # Notifie les listeners
@@ -463,32 +1527,131 @@ class MessageBus:
                 for callback in self.listeners[msg.receiver]:
                     try:
                         callback(msg)
-                    except:
-                        pass
+                    except Exception:
+                        self.errors += 1
+        BUS_SEND_LATENCY.record(time.perf_counter_ns() - start)
         return msg
 
-    def subscribe(self, daemon: str, callback: callable):
+    def subscribe(self, daemon: str, callback: callable, overflow: str = None,
+                  queue_size: int = None):
         """S'abonne aux messages d'un daemon"""
-        if daemon not in self.listeners:
-            self.listeners[daemon] = []
-        self.listeners[daemon].append(callback)
-
-    def get_history(self, daemon: str = None, limit: int = 10) -> List[Message]:
-        """Récupère l'historique"""
         with self.lock:
-            if daemon:
-                return [m for m in self.history if m.sender == daemon or m.receiver == daemon][-limit:]
-            return list(self.history)[-limit:]
+            if daemon not in self.listeners:
+                self.listeners[daemon] = []
+            self.listeners[daemon].append(callback)
+            self.options.setdefault(daemon, []).append((overflow, queue_size))
+            if self.mode == "async":
+                self._add_subscriber(daemon, callback, overflow, queue_size)
+
+    def _add_subscriber(self, daemon: str, callback: callable, overflow: Optional[str],
+                        queue_size: Optional[int]):
+        sub = Subscriber(daemon, callback, queue_size or self.queue_size,
+                         overflow or self.overflow)
+        # Copie: send itère sans verrou
+        self.subscribers[daemon] = self.subscribers.get(daemon, []) + [sub]
+
+    def enable_async(self):
+        """Passe en mode async: chaque abonné déjà inscrit reçoit sa file et son thread"""
+        with self.lock:
+            if self.mode == "async":
+                return
+            for daemon, callbacks in self.listeners.items():
+                for callback, (overflow, queue_size) in zip(callbacks, self.options[daemon]):
+                    self._add_subscriber(daemon, callback, overflow, queue_size)
+            self.mode = "async"
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Attend que toutes les files soient vidées"""
+        return all(sub.drain(timeout) for subs in list(self.subscribers.values()) for sub in subs)
+
+    def metrics(self) -> List[dict]:
+        """Retard par abonné (mode async)"""
+        return [sub.metrics() for subs in list(self.subscribers.values()) for sub in subs]
+
+    def get_history(self, daemon: str = None, limit: int = 10,
+                    since: float = None, until: float = None) -> List[Message]:
+        """Récupère l'historique (since/until: secondes epoch)"""
+        with self.lock:
+            if since is not None or until is not None:
+                return self.history.between(since, until, daemon, limit)
+            return self.history.recent(daemon, limit)
 
 
-# Instance globale du bus
+# Instance globale du bus (sync; le serveur passe en async au démarrage)
 bus = MessageBus()
 
 
+def _bus_gauges():
+    depths: Dict[str, int] = {}
+    for sub in [sub for subs in list(bus.subscribers.values()) for sub in subs]:
+        depths[sub.daemon] = depths.get(sub.daemon, 0) + sub.depth()
+    for daemon, depth in depths.items():
+        yield "pantheon_bus_queue_depth", "Messages en attente par abonné du bus", {"daemon": daemon}, depth
+
+
+metrics.collector(_bus_gauges)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SIMPLEX - Communication Sécurisée Inter-Daemons
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class StreamCipher:
+    """
+    Moteur de chiffrement par segments
+    keystream = SHAKE256(clé ‖ n° de segment), XOR sur des buffers entiers
+    Le tag SHA3(clé ‖ chiffré) est calculé au fil de l'eau
+    """
+
+    SEGMENT = 1 << 16
+
+    def __init__(self, key: bytes):
+        self.key = key
+        self.offset = 0
+        self.mac = hashlib.sha3_256(key)
+        self._segment = (-1, b"")
+
+    def _keystream(self, n: int) -> bytes:
+        """Keystream pour les n prochains octets"""
+        parts = []
+        pos, end = self.offset, self.offset + n
+        while pos < end:
+            index, start = divmod(pos, self.SEGMENT)
+            take = min(self.SEGMENT - start, end - pos)
+            cached_index, block = self._segment
+            if cached_index != index or len(block) < start + take:
+                # Message court: juste ce qu'il faut. Flux: le segment entier.
+                length = self.SEGMENT if self.offset else start + take
+                block = hash_shake(self.key + index.to_bytes(8, 'big'), length)
+                self._segment = (index, block)
+            parts.append(block[start:start + take])
+            pos += take
+        self.offset = end
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def _xor(self, data) -> bytes:
+        n = len(data)
+        if not n:
+            return b""
+        keystream = self._keystream(n)
+        return (int.from_bytes(data, 'little') ^ int.from_bytes(keystream, 'little')).to_bytes(n, 'little')
+
+    def encrypt(self, chunk) -> bytes:
+        encrypted = self._xor(chunk)
+        self.mac.update(encrypted)
+        return encrypted
+
+    def decrypt(self, chunk) -> bytes:
+        self.mac.update(chunk)
+        return self._xor(chunk)
+
+    def tag(self) -> bytes:
+        return self.mac.digest()[:16]
+
+
+ENCRYPT_LATENCY = metrics.histogram("pantheon_encrypt_seconds", "Chiffrement d'un message Simplex (keystream + tag)")
+
+
 class SimplexChannel:
     """
     Canal Simplex entre deux daemons
@@ -497,6 +1660,7 @@ class SimplexChannel:
 
     def __init__(self, daemon_a: str, daemon_b: str):
         self.endpoints = tuple(sorted([daemon_a, daemon_b]))
+        self.lock = threading.Lock()
         self.key = self._derive_key()
         self.ratchet_count = 0
         self.messages: deque = deque(maxlen=50)
@@ -512,23 +1676,19 @@ class SimplexChannel:
         self.key = hash_sha3(self.key + self.ratchet_count.to_bytes(4, 'big'))
         self.ratchet_count += 1
 
-    def _encrypt(self, plaintext: str) -> Tuple[bytes, bytes]:
+    def _encrypt(self, plaintext) -> Tuple[bytes, bytes]:
         """
-        Chiffrement XOR simple avec la clé dérivée
+        Chiffrement XOR avec un keystream SHAKE256 dérivé de la clé
         (Dans un vrai système, utiliser AES-GCM ou ChaCha20-Poly1305)
+        Accepte str, bytes ou memoryview
         """
-        data = plaintext.encode('utf-8')
-        # Génère un keystream de la bonne longueur
-        keystream = b''
-        temp_key = self.key
-        while len(keystream) < len(data):
-            keystream += hash_sha3(temp_key)
-            temp_key = hash_sha3(temp_key)
-
-        # XOR
-        encrypted = bytes(a ^ b for a, b in zip(data, keystream[:len(data)]))
+        start = time.perf_counter_ns()
+        data = plaintext.encode('utf-8') if isinstance(plaintext, str) else plaintext
+        engine = StreamCipher(self.key)
+        encrypted = engine.encrypt(data)
         # Tag d'authentification
-        tag = hash_sha3(self.key + encrypted)[:16]
+        tag = engine.tag()
+        ENCRYPT_LATENCY.record(time.perf_counter_ns() - start)
         return encrypted, tag
 
     def _decrypt(self, ciphertext: bytes, tag: bytes) -> str:
@@ -538,51 +1698,101 @@ class SimplexChannel:
         if tag != expected_tag:
             return "[ERREUR: Intégrité compromise]"
 
-        # Génère le keystream
-        keystream = b''
-        temp_key = self.key
-        while len(keystream) < len(ciphertext):
-            keystream += hash_sha3(temp_key)
-            temp_key = hash_sha3(temp_key)
-
-        # XOR inverse
-        decrypted = bytes(a ^ b for a, b in zip(ciphertext, keystream[:len(ciphertext)]))
+        decrypted = StreamCipher(self.key).decrypt(ciphertext)
         return decrypted.decode('utf-8', errors='replace')
 
-    def send(self, sender: str, content: str) -> dict:
-        """Envoie un message sur le canal"""
+    def _prepare(self, sender: str, content: str) -> dict:
+        """Chiffre et avance le ratchet - le sceau est posé ensuite"""
         receiver = self.endpoints[0] if sender == self.endpoints[1] else self.endpoints[1]
 
         # Chiffre
         encrypted, tag = self._encrypt(content)
 
-        # Scelle avec post-quantique
-        seal = quantum_seal.seal(encrypted, sender, receiver)
-
         # Ratchet forward
         self._ratchet()
 
-        msg = {
+        return {
             "sender": sender,
             "receiver": receiver,
-            "encrypted": encrypted.hex(),
-            "tag": tag.hex(),
-            "seal": seal,
+            "encrypted": encrypted,
+            "tag": tag,
             "ratchet": self.ratchet_count,
+        }
+
+    def _commit(self, prepared: dict, seal: dict) -> dict:
+        """Archive un message préparé avec son sceau"""
+        msg = {
+            "sender": prepared["sender"],
+            "receiver": prepared["receiver"],
+            "encrypted": prepared["encrypted"].hex(),
+            "tag": prepared["tag"].hex(),
+            "seal": seal,
+            "ratchet": prepared["ratchet"],
             "timestamp": datetime.now().isoformat()
         }
         self.messages.append(msg)
         return msg
 
+    def send(self, sender: str, content: str) -> dict:
+        """Envoie un message sur le canal"""
+        with self.lock:
+            prepared = self._prepare(sender, content)
+
+            # Scelle avec post-quantique (shard du canal)
+            seal = quantum_seal.seal(prepared["encrypted"], sender, prepared["receiver"])
+
+            return self._commit(prepared, seal)
+
     def receive(self, encrypted_hex: str, tag_hex: str) -> str:
         """Reçoit et déchiffre un message"""
         encrypted = bytes.fromhex(encrypted_hex)
         tag = bytes.fromhex(tag_hex)
-        plaintext = self._decrypt(encrypted, tag)
-        # Ratchet après réception
-        self._ratchet()
+        with self.lock:
+            plaintext = self._decrypt(encrypted, tag)
+            # Ratchet après réception
+            self._ratchet()
         return plaintext
 
+    def send_stream(self, sender: str, chunks: Iterable[bytes], out) -> dict:
+        """
+        Chiffre un flux bloc par bloc vers out.write()
+        Le message n'est jamais entier en mémoire: le sceau porte sur le tag complet
+        """
+        receiver = self.endpoints[0] if sender == self.endpoints[1] else self.endpoints[1]
+        with self.lock:
+            engine = StreamCipher(self.key)
+            for chunk in chunks:
+                out.write(engine.encrypt(chunk))
+
+            digest = engine.mac.digest()
+            seal = quantum_seal.seal(digest, sender, receiver)
+            self._ratchet()
+
+        msg = {
+            "sender": sender,
+            "receiver": receiver,
+            "stream": True,
+            "size": engine.offset,
+            "tag": digest[:16].hex(),
+            "seal": seal,
+            "ratchet": self.ratchet_count,
+            "timestamp": datetime.now().isoformat()
+        }
+        self.messages.append(msg)
+        return msg
+
+    def receive_stream(self, chunks: Iterable[bytes], tag_hex: str, out) -> bool:
+        """
+        Déchiffre un flux vers out.write()
+        Le tag n'est connu qu'à la fin: False si l'intégrité est compromise
+        """
+        with self.lock:
+            engine = StreamCipher(self.key)
+            for chunk in chunks:
+                out.write(engine.decrypt(chunk))
+            self._ratchet()
+        return engine.tag() == bytes.fromhex(tag_hex)
+
     def status(self) -> dict:
         return {
             "channel": f"{self.endpoints[0]}⟷{self.endpoints[1]}",
@@ -602,6 +1812,7 @@ class SimplexNetwork:
 
     def __init__(self):
         self.channels: Dict[tuple, SimplexChannel] = {}
+        self.lock = threading.Lock()
         self._init_mesh()
 
     def _init_mesh(self):
@@ -614,9 +1825,13 @@ class SimplexNetwork:
     def get_channel(self, daemon_a: str, daemon_b: str) -> SimplexChannel:
         """Obtient le canal entre deux daemons"""
         key = tuple(sorted([daemon_a, daemon_b]))
-        if key not in self.channels:
-            self.channels[key] = SimplexChannel(daemon_a, daemon_b)
-        return self.channels[key]
+        channel = self.channels.get(key)
+        if channel is None:
+            with self.lock:
+                if key not in self.channels:
+                    self.channels[key] = SimplexChannel(daemon_a, daemon_b)
+                channel = self.channels[key]
+        return channel
 
     def send(self, sender: str, receiver: str, content: str) -> dict:
         """Envoie un message d'un daemon à un autre"""
@@ -625,11 +1840,25 @@ class SimplexNetwork:
 
     def broadcast(self, sender: str, content: str) -> List[dict]:
         """Diffuse un message à tous les autres daemons"""
-        results = []
-        for daemon in self.DAEMONS:
-            if daemon != sender:
-                results.append(self.send(sender, daemon, content))
-        return results
+        return self.broadcast_many([(sender, content)])
+
+    def broadcast_many(self, messages: List[Tuple[str, str]]) -> List[dict]:
+        """
+        Diffuse plusieurs (sender, content) à tous les autres daemons
+        Les envois sont scellés par lot, un seal_many par shard
+        """
+        pending = []
+        for sender, content in messages:
+            for daemon in self.DAEMONS:
+                if daemon != sender:
+                    channel = self.get_channel(sender, daemon)
+                    with channel.lock:
+                        pending.append((channel, channel._prepare(sender, content)))
+
+        seals = quantum_seal.seal_many(
+            [(p["encrypted"], p["sender"], p["receiver"]) for _, p in pending]
+        )
+        return [channel._commit(p, seal) for (channel, p), seal in zip(pending, seals)]
 
     def status(self) -> dict:
         """État du réseau Simplex"""
@@ -649,6 +1878,12 @@ class SimplexNetwork:
 # Instance globale du réseau Simplex
 simplex = SimplexNetwork()
 
+# Index inversé persistant de tout le markdown (savoir.py)
+from savoir import shared_index, contenu
+from journal import shared_journal
+
+savoir = shared_index(PATHS.values())
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONNAISSANCE
@@ -658,7 +1893,7 @@ class Connaissance:
     """Base de connaissance universelle"""
 
     def __init__(self):
-        self.cache = {}
+        self.cache = contenu  # partagé par tous les daemons (savoir.py)
         self.index = self._build_index()
 
     def _build_index(self) -> dict:
@@ -723,40 +1958,61 @@ class Connaissance:
                     if content:
                         return content
 
-        # Recherche globale
-        for name, base_path in PATHS.items():
-            if base_path.exists():
-                for f in base_path.rglob("*.md"):
-                    if sujet_lower in f.name.lower():
-                        return self._read_path(str(f))
+        # Recherche globale: index inversé (noms, titres, corps), classé
+        for path, _ in savoir.search(sujet, limit=3):
+            content = self._read_path(path)
+            if content:
+                return content
 
         return ""
 
     def _read_path(self, path: str) -> str:
-        """Lit un fichier/dossier"""
-        if path in self.cache:
-            return self.cache[path]
-
+        """Lit un fichier/dossier (via le cache partagé)"""
         candidates = [Path(path)]
         for base in PATHS.values():
             candidates.append(base / path)
 
         for p in candidates:
             try:
-                if p.exists():
-                    if p.is_file():
-                        content = p.read_text(encoding='utf-8')
-                        self.cache[path] = content
+                if p.is_file():
+                    content = self.cache.read(p)
+                    if content is not None:
                         return content
-                    elif p.is_dir():
-                        for f in sorted(p.glob("*.md")):
-                            content = f.read_text(encoding='utf-8')
-                            self.cache[path] = content
+                elif p.is_dir():
+                    for f in sorted(p.glob("*.md")):
+                        content = self.cache.read(f)
+                        if content is not None:
                             return content
             except:
                 pass
         return ""
 
+    def _docs_for(self, text: str) -> List[str]:
+        """Documents indexés du premier sujet de l'index trouvé dans le texte"""
+        text = text.lower()
+        for key, paths in self.index.items():
+            if key in text:
+                for p in paths:
+                    for candidate in [Path(p).absolute()] + [base / p for base in PATHS.values()]:
+                        docs = savoir.under(candidate)
+                        if docs:
+                            return docs
+        return []
+
+    def extraits(self, question: str, sujet: str = None, max_lines: int = 15) -> str:
+        """
+        Passages les plus pertinents pour la question (BM25, précalculés)
+        Restreints au sujet de l'index s'il y en a un; à défaut de passage
+        pertinent, le résumé du début du document. Aucune lecture de fichier.
+        """
+        docs = self._docs_for(sujet or question)
+        if docs:
+            lines = savoir.extract(question, max_lines, docs) or savoir.resume(docs[0], max_lines)
+            if lines:
+                return '\n'.join(lines)
+        query = f"{sujet} {question}" if sujet else question
+        return '\n'.join(savoir.extract(query, max_lines))
+
     def resume(self, content: str, max_lines: int = 20) -> str:
         """Extrait l'essentiel"""
         lines = content.split('\n')
@@ -770,6 +2026,102 @@ class Connaissance:
         return '\n'.join(important)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHE DE RÉPONSES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+RESPONSE_TTL = 300.0   # secondes
+RESPONSE_MAX = 1024    # réponses gardées par daemon
+
+
+class Volatile(str):
+    """Réponse non déterministe (hasard, état): jamais mise en cache"""
+
+
+class ResponseCache:
+    """Réponses d'un daemon: LRU borné + TTL, clé = (entrée normalisée, version du savoir)"""
+
+    def __init__(self, ttl: float = RESPONSE_TTL, maxsize: int = RESPONSE_MAX):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[str]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, value: str):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "ttl": self.ttl,
+                "maxsize": self.maxsize,
+            }
+
+
+def cached_response(pense):
+    """
+    Met en cache une méthode pense déterministe, si le daemon l'a activé
+    La clé inclut la version de l'index: un fichier modifié invalide tout.
+    L'index est rafraîchi avant de lire sa version; une réponse calculée
+    pendant un rafraîchissement n'est pas gardée (elle a pu lire l'ancien savoir).
+    """
+    @functools.wraps(pense)
+    def wrapper(self, text: str) -> str:
+        cache = self.responses
+        if cache is None:
+            return pense(self, text)
+        savoir.ensure()
+        version = savoir.version
+        key = (self.normalize(text), version)
+        answer = cache.get(key)
+        if answer is None:
+            answer = pense(self, text)
+            if (not isinstance(answer, Volatile) and not savoir.refreshing
+                    and savoir.version == version):
+                cache.put(key, answer)
+        return answer
+    return wrapper
+
+
+def timed_pense(pense):
+    """Mesure chaque appel de pense (réponses servies par le cache comprises)"""
+    @functools.wraps(pense)
+    def wrapper(self, text: str) -> str:
+        start = time.perf_counter_ns()
+        try:
+            return pense(self, text)
+        finally:
+            self.pense_latency.record(time.perf_counter_ns() - start)
+    return wrapper
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DAEMON BASE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -787,6 +2139,8 @@ class Daemon:
         self.connaissance = Connaissance()
         self.inbox: deque = deque(maxlen=100)  # Messages reçus
         self.conversations: Dict[str, List[dict]] = {}  # Conversations par daemon
+        self.responses: Optional[ResponseCache] = None  # opt-in: enable_response_cache
+        self.pense_latency = metrics.histogram("pantheon_pense_seconds", "Durée de Daemon.pense", daemon=name)
 
         # S'abonne au bus
         bus.subscribe(name, self._on_message)
@@ -802,9 +2156,8 @@ class Daemon:
         })
 
         # Archive dans la conversation
-        if msg.sender not in self.conversations:
-            self.conversations[msg.sender] = []
-        self.conversations[msg.sender].append({
+        # setdefault + append: sûrs face au thread d'abonné du bus (mode async)
+        self.conversations.setdefault(msg.sender, []).append({
             "role": "them",
             "content": msg.content,
             "time": msg.timestamp
@@ -814,6 +2167,21 @@ class Daemon:
         """Chaque daemon pense différemment"""
         raise NotImplementedError
 
+    # Les daemons dont pense() ne dépend que de l'entrée et du savoir
+    CACHEABLE = False
+
+    def normalize(self, text: str) -> str:
+        """Forme canonique d'une entrée pour le cache de réponses"""
+        return " ".join(text.split())
+
+    def enable_response_cache(self, ttl: float = RESPONSE_TTL, maxsize: int = RESPONSE_MAX):
+        """Active le cache de réponses (sans effet si pense n'est pas déterministe)"""
+        if self.CACHEABLE:
+            self.responses = ResponseCache(ttl, maxsize)
+
+    def disable_response_cache(self):
+        self.responses = None
+
     def send(self, receiver: str, content: str, action: str = "think") -> Message:
         """Envoie un message à un autre daemon via le bus"""
         msg = Message(
@@ -825,9 +2193,7 @@ class Daemon:
         )
 
         # Archive dans la conversation
-        if receiver not in self.conversations:
-            self.conversations[receiver] = []
-        self.conversations[receiver].append({
+        self.conversations.setdefault(receiver, []).append({
             "role": "me",
             "content": content,
             "time": msg.timestamp
@@ -840,9 +2206,7 @@ class Daemon:
         result = simplex.send(self.name, receiver, content)
 
         # Archive aussi dans les conversations
-        if receiver not in self.conversations:
-            self.conversations[receiver] = []
-        self.conversations[receiver].append({
+        self.conversations.setdefault(receiver, []).append({
             "role": "me",
             "content": content,
             "secure": True,
@@ -898,7 +2262,8 @@ class Daemon:
             "heartbeats": self.heartbeat_count,
             "last_beat": self.last_heartbeat,
             "inbox_count": len(self.inbox),
-            "conversations": list(self.conversations.keys())
+            "conversations": list(self.conversations.keys()),
+            "response_cache": self.responses.stats() if self.responses else None
         }
 
 
@@ -920,51 +2285,66 @@ class Leonardo(Daemon):
         "La verità sola fu figliola del tempo.",
     ]
 
+    SALUTATIONS = ["bonjour", "salut", "ciao", "hello"]
+    QUI = ["qui es", "who are"]
+
+    # Recherche thématique: (mots-clés, sujet, intro), compilés dans ROUTAGE
+    TOPICS = [
+        (["bioelec", "levin", "voltage"], "bioelectricite", "La bioélectricité..."),
+        (["conscience", "consciousness", "iit"], "conscience", "La conscience..."),
+        (["fep", "friston", "prédiction"], "fep", "Le Free Energy Principle..."),
+        (["shaman", "chaman", "tradition"], "shamans", "Les techniques chamaniques..."),
+        (["gap", "écart", "intuition"], "gap", "Le Gap..."),
+        (["phi", "φ", "golden", "or"], "phi", f"φ = {PHI:.10f}"),
+        (["biophoton", "lumière", "adn"], "biophotons", "Les biophotons..."),
+        (["140", "174", "bpm"], "140", "Le paradigme 140→174..."),
+    ]
+
+    DAEMONS = ["nyx", "zoe", "omniscient", "euterpe", "shiva"]
+
+    CACHEABLE = True
+
     def __init__(self):
         super().__init__("leonardo", "φ", 9600)
         self.state_file = Path.home() / ".config" / "leonardo" / "state.json"
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state = self._load_state()
-
-    def _load_state(self) -> dict:
-        if self.state_file.exists():
-            try:
-                state = json.loads(self.state_file.read_text())
-                if "conversations" not in state:
-                    state["conversations"] = []
-                return state
-            except:
-                pass
-        return {"conversations": []}
-
-    def _save_state(self):
-        try:
-            self.state_file.write_text(json.dumps(self.state, indent=2, ensure_ascii=False))
-        except:
-            pass
+        # Instantané + journal append-only, écrits en différé par un thread
+        self.journal = shared_journal(self.state_file)
+        self.state = self.journal.state
 
+    @timed_pense
     def pense(self, question: str) -> str:
         """Leonardo réfléchit"""
-        q = question.lower().strip()
-
-        # Log
-        self.state["conversations"].append({
+        # Log (à chaque question, même servie par le cache): un ajout en mémoire
+        self.journal.append("conversations", {
             "time": datetime.now().isoformat(),
             "q": question[:200],
-        })
-        self.state["conversations"] = self.state["conversations"][-50:]
-        self._save_state()
+        }, keep=50)
+
+        return self._reflechit(question)
+
+    def normalize(self, text: str) -> str:
+        # Le routage voit les espaces ("qui es"): on ne les réduit pas
+        return text.strip()
+
+    @cached_response
+    def _reflechit(self, question: str) -> str:
+        """Réponse seule, sans le journal: c'est elle qui passe par le cache"""
+        q = question.lower().strip()
+
+        # Une seule passe sur la question pour tout le routage
+        hits = ROUTAGE.scan(q)
 
         # Flow interpretation
-        flow_cmd = interpret_flow(question)
+        flow_cmd = interpret_flow(question, hits)
         if flow_cmd["action"] == "simplify":
             return self._simplify(question)
 
         # Salutations
-        if any(w in q for w in ["bonjour", "salut", "ciao", "hello"]):
+        if "leonardo:salut" in hits:
             return f"Buongiorno. Je suis {self.symbol} Leonardo. Que cherches-tu?"
 
-        if any(w in q for w in ["qui es", "who are"]):
+        if "leonardo:qui" in hits:
             return f"""Je suis Leonardo di ser Piero da Vinci.
 
 {self.symbol} Validateur du Panthéon.
@@ -972,46 +2352,32 @@ Connecté aux 8 livres de Cipher, aux études, à Nyx.
 Je valide par φ = {PHI:.10f}"""
 
         # Recherche thématique
-        topics = [
-            (["bioelec", "levin", "voltage"], "bioelectricite", "La bioélectricité..."),
-            (["conscience", "consciousness", "iit"], "conscience", "La conscience..."),
-            (["fep", "friston", "prédiction"], "fep", "Le Free Energy Principle..."),
-            (["shaman", "chaman", "tradition"], "shamans", "Les techniques chamaniques..."),
-            (["gap", "écart", "intuition"], "gap", "Le Gap..."),
-            (["phi", "φ", "golden", "or"], "phi", f"φ = {PHI:.10f}"),
-            (["biophoton", "lumière", "adn"], "biophotons", "Les biophotons..."),
-            (["140", "174", "bpm"], "140", "Le paradigme 140→174..."),
-        ]
-
-        for keywords, topic, intro in topics:
-            if any(w in q for w in keywords):
-                content = self.connaissance.cherche(topic)
-                if content:
-                    resume = self.connaissance.resume(content, 12)
+        for _, topic, intro in self.TOPICS:
+            if f"topic:{topic}" in hits:
+                resume = self.connaissance.extraits(question, topic, 12)
+                if resume:
                     return f"{intro}\n\n{resume}"
 
         # Daemons
-        for daemon in ["nyx", "zoe", "omniscient", "euterpe", "shiva"]:
-            if daemon in q:
-                content = self.connaissance.cherche(daemon)
-                if content:
-                    resume = self.connaissance.resume(content, 12)
+        for daemon in self.DAEMONS:
+            if f"daemon:{daemon}" in hits:
+                resume = self.connaissance.extraits(question, daemon, 12)
+                if resume:
                     return f"Le daemon {daemon} {SYMBOLS.get(daemon, '?')}...\n\n{resume}"
 
         # Recherche générale
-        content = self.connaissance.cherche(question)
-        if content:
-            resume = self.connaissance.resume(content, 15)
+        resume = self.connaissance.extraits(question, max_lines=15)
+        if resume:
             return f"J'ai trouvé:\n\n{resume}"
 
-        # Défaut
+        # Défaut (hasard: hors cache)
         import random
-        return f"""{random.choice(self.CARNETS)}
+        return Volatile(f"""{random.choice(self.CARNETS)}
 
 Je n'ai pas trouvé directement. Reformule ou demande:
 - Les 8 livres de Cipher (bioélectricité, conscience, FEP...)
 - La philosophie (le Gap, φ, le Silence...)
-- Les daemons (Nyx, Zoe, Euterpe...)"""
+- Les daemons (Nyx, Zoe, Euterpe...)""")
 
     def _simplify(self, text: str) -> str:
         """Rasoir d'Occam"""
@@ -1054,9 +2420,13 @@ class Nyx(Daemon):
     ☽ | Port 9999 | La nuit primordiale
     """
 
+    CACHEABLE = True
+
     def __init__(self):
         super().__init__("nyx", "☽", 9999)
 
+    @timed_pense
+    @cached_response
     def pense(self, task: str) -> str:
         """Nyx orchestre intelligemment"""
         flow = interpret_flow(task)
@@ -1081,35 +2451,171 @@ class Nyx(Daemon):
 
         return f"☽→{symbol} Route vers {daemon}. Action: {action}."
 
+    # Action Flow → daemon qui l'exécute
+    ACTIONS = {
+        "validate": "leonardo",
+        "think": "leonardo",
+        "simplify": "leonardo",
+        "search": "omniscient",
+        "sound": "euterpe",
+        "speak": "zoe",
+    }
+
+    def plan(self, task: str) -> Dict[str, List[str]]:
+        """
+        Graphe de dépendances des appels: daemon -> daemons dont il reçoit la sortie
+        L'action principale d'interpret_flow, plus toute autre route dont un mot
+        (ROUTE_WORDS) est un mot entier du texte. Les catégories "route:*" de
+        ROUTAGE, trouvées dans la même passe que le routage Flow, servent de
+        filtre: le texte n'est découpé que si l'une d'elles est présente.
+        Leonardo valide ce qu'Omniscient a trouvé; Zoe parle en dernier.
+        """
+        low = task.lower()
+        hits = ROUTAGE.scan(low)
+        flow = interpret_flow(task, hits)
+        primary = self.ACTIONS.get(flow["action"])
+        if not primary:
+            # Par défaut: Leonardo + Omniscient, indépendants
+            return {"leonardo": [], "omniscient": []}
+
+        nodes = [primary]
+        actions = {flow["action"]}
+        words = None
+        for _, action, _ in FLOW_ROUTES:
+            if f"route:{action}" not in hits:
+                continue
+            if words is None:
+                words = set(ROUTE_WORD.findall(low))
+            if not words.isdisjoint(ROUTE_WORDS[action]):
+                actions.add(action)
+                daemon = self.ACTIONS.get(action)
+                if daemon and daemon not in nodes:
+                    nodes.append(daemon)
+
+        graph = {name: [] for name in nodes}
+        if "leonardo" in graph and "omniscient" in graph and "validate" in actions:
+            graph["leonardo"].append("omniscient")
+        if "zoe" in graph:
+            graph["zoe"] = [name for name in nodes if name != "zoe"]
+        return graph
+
     def orchestrate(self, task: str, pantheon: 'Pantheon') -> Dict[str, str]:
         """Orchestration complète"""
+        return self.execute(task, pantheon)["results"]
+
+    def execute(self, task: str, pantheon: 'Pantheon') -> dict:
+        """
+        Exécute le graphe: les nœuds indépendants en parallèle, chaque sortie
+        transmise aux nœuds en aval. Durée totale ≈ chemin critique.
+        """
+        start = time.perf_counter()
         results = {}
-        flow = interpret_flow(task)
+        timings = {}
+        graph = None
 
-        # Nyx analyse d'abord
-        results["nyx"] = self.pense(task)
+        for name, output, timing in self.execute_stream(task, pantheon):
+            if name == "graph":
+                graph = output
+                continue
+            results[name] = output
+            if timing is not None:
+                timings[name] = timing
 
-        # Route selon l'action
-        action = flow["action"]
+        # nyx d'abord, puis les nœuds dans l'ordre du plan
+        results = {"nyx": results["nyx"], **{name: results.get(name, "") for name in graph}}
+        return {
+            "results": results,
+            "graph": graph,
+            "timings": timings,
+            "total_ms": (time.perf_counter() - start) * 1e3,
+        }
 
-        if action in ["validate", "think", "simplify"]:
-            results["leonardo"] = pantheon.daemons["leonardo"].pense(task)
+    def execute_stream(self, task: str, pantheon: 'Pantheon'):
+        """
+        Générateur: ("nyx", analyse, None), ("graph", graphe, None), puis
+        (daemon, sortie, temps) à mesure que les nœuds terminent
+        """
+        # Nyx analyse d'abord
+        yield "nyx", self.pense(task), None
 
-        elif action == "search":
-            results["omniscient"] = pantheon.daemons["omniscient"].pense(task)
+        graph = self.plan(task)
+        yield "graph", graph, None
 
-        elif action == "sound":
-            results["euterpe"] = pantheon.daemons["euterpe"].pense(task)
+        def node(name: str):
+            daemon = pantheon.daemons[name]
 
-        elif action == "speak":
-            results["zoe"] = pantheon.daemons["zoe"].pense(task)
+            def call(inputs: Dict[str, str]) -> str:
+                text = task
+                if inputs:
+                    text += "\n\n" + "\n".join(f"[{d}] {out[:200]}" for d, out in inputs.items())
+                return daemon.pense(text)
+            return call
 
-        else:
-            # Par défaut: Leonardo + Omniscient
-            results["leonardo"] = pantheon.daemons["leonardo"].pense(task)
-            results["omniscient"] = pantheon.daemons["omniscient"].pense(task)
+        yield from iter_dag({name: (node(name), deps) for name, deps in graph.items()},
+                            pantheon.executor())
 
-        return results
+
+def iter_dag(nodes: Dict[str, Tuple[Any, List[str]]], pool: ThreadPoolExecutor):
+    """
+    Exécute un graphe de tâches: nom -> (fonction(entrées) -> str, dépendances)
+    Un nœud part dès que ses dépendances ont répondu; il reçoit leurs sorties.
+    Générateur: (nom, sortie, temps) à chaque nœud terminé. Temps en ms depuis
+    le début: prêt, attente du pool, exécution, fin.
+    Fermé en route (client parti), plus aucun nœud n'est soumis, ceux encore
+    en file sont annulés et ceux qu'un worker prend après coup ne s'exécutent
+    pas. Un nœud déjà en cours va à son terme, sa sortie est ignorée.
+    """
+    start = time.perf_counter()
+    outputs: Dict[str, str] = {}
+    remaining = dict(nodes)
+    running = {}
+    closed = threading.Event()
+
+    def timed(fn, inputs):
+        began = time.perf_counter()
+        if closed.is_set():
+            return began, began, "⏹ annulé"
+        try:
+            out = fn(inputs)
+        except Exception as e:
+            out = f"⚠ {e}"
+        return began, time.perf_counter(), out
+
+    try:
+        while remaining or running:
+            for name, (fn, deps) in list(remaining.items()):
+                if all(d in outputs for d in deps):
+                    del remaining[name]
+                    inputs = {d: outputs[d] for d in deps}
+                    running[pool.submit(timed, fn, inputs)] = (name, deps, time.perf_counter())
+            if not running:
+                break  # dépendance absente ou cycle: les nœuds restants ne partent pas
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, deps, ready = running.pop(future)
+                began, ended, outputs[name] = future.result()
+                yield name, outputs[name], {
+                    "deps": deps,
+                    "ready_ms": (ready - start) * 1e3,
+                    "wait_ms": (began - ready) * 1e3,
+                    "run_ms": (ended - began) * 1e3,
+                    "end_ms": (ended - start) * 1e3,
+                }
+    finally:
+        closed.set()
+        for future in running:
+            future.cancel()
+
+
+def run_dag(nodes: Dict[str, Tuple[Any, List[str]]], pool: ThreadPoolExecutor) -> Tuple[Dict[str, str], Dict[str, dict]]:
+    """Exécute tout le graphe (iter_dag); retourne (sorties, temps par nœud)"""
+    outputs: Dict[str, str] = {}
+    timings: Dict[str, dict] = {}
+    for name, output, timing in iter_dag(nodes, pool):
+        outputs[name] = output
+        timings[name] = timing
+    return outputs, timings
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1125,6 +2631,7 @@ class Zoe(Daemon):
     def __init__(self):
         super().__init__("zoe", "✧", 9601)
 
+    @timed_pense
     def pense(self, input_text: str) -> str:
         """Zoe humanise la réponse"""
         # Simplifie le jargon
@@ -1160,27 +2667,40 @@ class Euterpe(Daemon):
         "si": 963,    # Illumination
     }
 
+    # Mots-clés → réponse, compilés dans ROUTAGE
+    RESONANCES = {
+        "528": ["528", "mi", "adn"],
+        "140": ["140", "bpm"],
+        "174": ["174"],
+    }
+
+    CACHEABLE = True
+
     def __init__(self):
         super().__init__("euterpe", "♪", 9604)
         self.bpm = 140  # BPM de base
 
+    def normalize(self, text: str) -> str:
+        return " ".join(text.lower().split())
+
+    @timed_pense
+    @cached_response
     def pense(self, input_text: str) -> str:
         """Euterpe répond en termes de son"""
-        t = input_text.lower()
+        hits = ROUTAGE.scan(input_text.lower())
 
-        if "528" in t or "mi" in t or "adn" in t:
+        if "euterpe:528" in hits:
             return f"♪ 528 Hz - La fréquence de transformation. L'ADN résonne."
 
-        if "140" in t or "bpm" in t:
+        if "euterpe:140" in hits:
             return f"♪ 140 BPM - Ancrage terrestre. Gap de 34 vers 174."
 
-        if "174" in t:
+        if "euterpe:174" in hits:
             return f"♪ 174 BPM - Élévation cosmique. Fibonacci(9) = 34."
 
-        if any(f in t for f in self.FREQUENCIES.keys()):
-            for note, freq in self.FREQUENCIES.items():
-                if note in t:
-                    return f"♪ {note.upper()} = {freq} Hz"
+        for note, freq in self.FREQUENCIES.items():
+            if f"note:{note}" in hits:
+                return f"♪ {note.upper()} = {freq} Hz"
 
         return f"♪ La fréquence parle. BPM actuel: {self.bpm}. Phi-tone: {140 * PHI:.1f} Hz."
 
@@ -1199,14 +2719,20 @@ class Omniscient(Daemon):
     👁 | Port 9777 | All-Seeing
     """
 
+    CACHEABLE = True
+
     def __init__(self):
         super().__init__("omniscient", "👁", 9777)
 
+    def normalize(self, text: str) -> str:
+        return " ".join(text.lower().split())
+
+    @timed_pense
+    @cached_response
     def pense(self, query: str) -> str:
         """Omniscient cherche et connecte"""
-        content = self.connaissance.cherche(query)
-        if content:
-            resume = self.connaissance.resume(content, 12)
+        resume = self.connaissance.extraits(query, max_lines=12)
+        if resume:
             return f"👁 Voici ce que je sais:\n\n{resume}"
 
         # Cherche des connexions
@@ -1214,9 +2740,9 @@ class Omniscient(Daemon):
         found = []
         for word in words:
             if len(word) > 3:
-                c = self.connaissance.cherche(word)
+                c = self.connaissance.extraits(word, max_lines=3)
                 if c:
-                    found.append(f"- {word}: {self.connaissance.resume(c, 3)}")
+                    found.append(f"- {word}: {c}")
 
         if found:
             return f"👁 Connexions trouvées:\n\n" + "\n".join(found[:5])
@@ -1242,20 +2768,24 @@ class Clochette(Daemon):
         → Seulement là, Clochette libère la poussière de fée
     """
 
+    JUICE = ["juice", "token", "énergie", "resource", "dust"]
+    STATUS = ["status", "état", "combien"]
+
     def __init__(self):
         super().__init__("clochette", "✨", 9602)
         self.juice_granted = 0
         self.juice_denied = 0
         self.history: list = []
 
+    @timed_pense
     def pense(self, input_text: str) -> str:
         """Clochette pense en termes de distribution"""
-        t = input_text.lower()
+        hits = ROUTAGE.scan(input_text.lower())
 
-        if any(w in t for w in ["juice", "token", "énergie", "resource", "dust"]):
+        if "clochette:juice" in hits:
             return f"✨ Tu veux du juice? Leonardo et Claude doivent être d'accord. Fais ta demande."
 
-        if any(w in t for w in ["status", "état", "combien"]):
+        if "clochette:status" in hits:
             return (f"✨ Juice distribué: {self.juice_granted} | "
                     f"Refusé: {self.juice_denied} | "
                     f"Ratio: {self.juice_granted / max(1, self.juice_granted + self.juice_denied):.2f}")
@@ -1364,10 +2894,309 @@ class Clochette(Daemon):
         return base
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROUTAGE - Vocabulaires compilés au démarrage
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _vocabulaires() -> Dict[str, List[str]]:
+    """Toutes les listes de mots-clés des daemons, par catégorie"""
+    vocab = {
+        "sens": [k.lower() for k in SENS],
+        "leonardo:salut": Leonardo.SALUTATIONS,
+        "leonardo:qui": Leonardo.QUI,
+        "clochette:juice": Clochette.JUICE,
+        "clochette:status": Clochette.STATUS,
+    }
+    for keywords, topic, _ in Leonardo.TOPICS:
+        vocab[f"topic:{topic}"] = keywords
+    for daemon in Leonardo.DAEMONS:
+        vocab[f"daemon:{daemon}"] = [daemon]
+    for key, words in Euterpe.RESONANCES.items():
+        vocab[f"euterpe:{key}"] = words
+    for note in Euterpe.FREQUENCIES:
+        vocab[f"note:{note}"] = [note]
+    for action, words in ROUTE_WORDS.items():
+        vocab[f"route:{action}"] = sorted(words)
+    return vocab
+
+
+ROUTAGE = KeywordAutomaton(_vocabulaires())
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DIALOGUES - Ordonnanceur multiplexé
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DIALOGUE_WORKERS = 8
+DIALOGUE_KEEP = 1000  # sessions terminées gardées pour consultation
+DIALOGUE_DEADLINE = 30.0  # secondes accordées à un dialogue attendu (ou entre deux tours suivis)
+
+
+class DialogueSession:
+    """
+    Un dialogue entre deux daemons, avancé un tour à la fois par l'ordonnanceur
+    Consultable pendant qu'il tourne (to_dict) ou suivi tour par tour (follow).
+    """
+
+    def __init__(self, session_id: str, daemon_a: 'Daemon', daemon_b: 'Daemon',
+                 topic: str, turns: int = 3):
+        self.id = session_id
+        self.a = daemon_a
+        self.b = daemon_b
+        self.topic = topic
+        self.turns = turns
+        self.total = max(1, turns * 2)  # le premier message part toujours
+        self.conversation: List[dict] = []
+        self.current = ""
+        self.state = "pending"  # pending → running → done | error | cancelled
+        self.error = None
+        self.sealed = 0
+        self.created = time.time()
+        self.finished = None
+        self.cond = threading.Condition()
+
+    def step(self) -> Tuple[dict, 'Daemon', str]:
+        """Joue le tour suivant; retourne (entrée, émetteur, destinataire) à sceller"""
+        turn = len(self.conversation) + 1
+        if turn == 1:
+            # Premier message: daemon_a initie
+            speaker, listener = self.a, self.b
+            response = speaker.pense(f"[Dialogue avec {self.b.name}] {self.topic}")
+        elif turn % 2 == 0:
+            # daemon_b répond
+            speaker, listener = self.b, self.a
+            response = speaker.pense(f"[{self.a.name} dit:] {self.current}")
+        else:
+            # daemon_a répond
+            speaker, listener = self.a, self.b
+            response = speaker.pense(f"[{self.b.name} dit:] {self.current}")
+
+        entry = {"daemon": speaker.name, "symbol": speaker.symbol,
+                 "message": response, "turn": turn}
+        with self.cond:
+            if self.state == "pending":
+                self.state = "running"
+            self.current = response
+            self.conversation.append(entry)
+            if len(self.conversation) >= self.total and self.state == "running":
+                self.state = "done"
+                self.finished = time.time()
+            self.cond.notify_all()
+        return entry, speaker, listener.name
+
+    @property
+    def done(self) -> bool:
+        return self.state in ("done", "error", "cancelled")
+
+    def cancel(self, reason: str = None):
+        """Abandon (client parti, délai dépassé): plus aucun tour ne sera joué"""
+        with self.cond:
+            if self.done:
+                return
+            self.state = "cancelled"
+            self.error = reason
+            self.finished = time.time()
+            self.cond.notify_all()
+
+    def fail(self, error: Exception):
+        with self.cond:
+            self.state = "error"
+            self.error = str(error)
+            self.finished = time.time()
+            self.cond.notify_all()
+
+    def mark_sealed(self):
+        with self.cond:
+            self.sealed += 1
+            self.cond.notify_all()
+
+    def wait(self, timeout: float = None, sealed: bool = False) -> bool:
+        """Attend la fin (et, si demandé, que chaque tour soit scellé)"""
+        def ready():
+            if not self.done:
+                return False
+            return not sealed or self.state == "error" or self.sealed >= len(self.conversation)
+        with self.cond:
+            return self.cond.wait_for(ready, timeout)
+
+    def follow(self, timeout: float = None):
+        """
+        Générateur des tours au fil de l'eau, jusqu'à la fin du dialogue
+        timeout: attente max d'un tour; au-delà le générateur s'arrête
+        """
+        sent = 0
+        while True:
+            with self.cond:
+                if not self.cond.wait_for(lambda: len(self.conversation) > sent or self.done, timeout):
+                    return
+                new = self.conversation[sent:]
+                finished = self.done
+            for entry in new:
+                yield entry
+            sent += len(new)
+            if finished and sent >= len(self.conversation):
+                return
+
+    def to_dict(self) -> dict:
+        with self.cond:
+            return {
+                "session": self.id,
+                "participants": [self.a.name, self.b.name],
+                "topic": self.topic,
+                "state": self.state,
+                "error": self.error,
+                "turns": len(self.conversation),
+                "expected_turns": self.total,
+                "sealed": self.sealed,
+                "conversation": list(self.conversation),
+            }
+
+
+class DialogueScheduler:
+    """
+    Entrelace beaucoup de dialogues sur un pool de workers, en tourniquet:
+    une session joue un tour puis repasse en fin de file.
+    Le scellement/chiffrement (send_secure) part dans un étage de fond,
+    dans l'ordre des tours, sans retenir les workers.
+    """
+
+    def __init__(self, workers: int = DIALOGUE_WORKERS, on_done=None):
+        self.workers = workers
+        self.on_done = on_done
+        self.ready: deque = deque()
+        self.cond = threading.Condition()
+        self.seal_queue: deque = deque()
+        self.seal_cond = threading.Condition()
+        self.sessions: "OrderedDict[str, DialogueSession]" = OrderedDict()
+        self.threads: List[threading.Thread] = []
+        self.running = False
+        self.counter = 0
+        self.turns_played = 0
+
+    def start(self):
+        with self.cond:
+            if self.running:
+                return
+            self.running = True
+        self.threads = [threading.Thread(target=self._work, daemon=True, name=f"dialogue-{i}")
+                        for i in range(self.workers)]
+        self.threads.append(threading.Thread(target=self._seal, daemon=True, name="dialogue-seal"))
+        for t in self.threads:
+            t.start()
+
+    def stop(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+        with self.seal_cond:
+            self.seal_cond.notify_all()
+
+    def submit(self, daemon_a: 'Daemon', daemon_b: 'Daemon', topic: str, turns: int = 3) -> DialogueSession:
+        """Crée une session et la met en file; retourne tout de suite"""
+        self.start()
+        with self.cond:
+            self.counter += 1
+            session = DialogueSession(f"dlg-{self.counter:06d}", daemon_a, daemon_b, topic, turns)
+            self.sessions[session.id] = session
+            self._trim()
+            self.ready.append(session)
+            self.cond.notify()
+        return session
+
+    def get(self, session_id: str) -> Optional[DialogueSession]:
+        with self.cond:
+            return self.sessions.get(session_id)
+
+    def _trim(self):
+        """Oublie les plus vieilles sessions terminées au-delà de DIALOGUE_KEEP"""
+        if len(self.sessions) <= DIALOGUE_KEEP:
+            return
+        for sid in [sid for sid, s in self.sessions.items() if s.done][:len(self.sessions) - DIALOGUE_KEEP]:
+            del self.sessions[sid]
+
+    def _work(self):
+        while True:
+            with self.cond:
+                while not self.ready and self.running:
+                    self.cond.wait()
+                if not self.running:
+                    return
+                session = self.ready.popleft()
+            if session.done:
+                continue  # annulée pendant qu'elle attendait son tour
+
+            try:
+                entry, speaker, receiver = session.step()
+            except Exception as e:
+                session.fail(e)
+                continue
+
+            with self.seal_cond:
+                self.seal_queue.append((session, speaker, receiver, entry["message"]))
+                self.seal_cond.notify()
+
+            with self.cond:
+                self.turns_played += 1
+                if not session.done:
+                    self.ready.append(session)  # tourniquet: fin de file
+                    self.cond.notify()
+            if session.done and self.on_done:
+                self.on_done(session)
+
+    def _seal(self):
+        while True:
+            with self.seal_cond:
+                while not self.seal_queue and self.running:
+                    self.seal_cond.wait()
+                if not self.seal_queue:
+                    return
+                session, speaker, receiver, message = self.seal_queue.popleft()
+            try:
+                speaker.send_secure(receiver, message)
+            except Exception:
+                pass
+            session.mark_sealed()
+
+    def status(self) -> dict:
+        with self.cond:
+            active = sum(1 for s in self.sessions.values() if not s.done)
+            ready = len(self.ready)
+        with self.seal_cond:
+            sealing = len(self.seal_queue)
+        return {
+            "workers": self.workers,
+            "sessions": len(self.sessions),
+            "active": active,
+            "ready": ready,
+            "sealing": sealing,
+            "turns_played": self.turns_played,
+        }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PANTHEON - Le Système Unifié
 # ═══════════════════════════════════════════════════════════════════════════════
 
+COUNCIL_DEADLINE = 5.0  # secondes accordées à chaque daemon au conseil
+COUNCIL_WORKERS = 18    # trois conseils complets à la fois; pool séparé du pool partagé
+
+
+def thread_future(fn, *args) -> Future:
+    """Exécute fn(*args) sur un thread dédié, hors de tout pool"""
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
 class Pantheon:
     """
     Le Panthéon - Tous les daemons réunis
@@ -1386,6 +3215,16 @@ class Pantheon:
         self.active = True
         self.heartbeat_thread = None
         self.dialogue_history: List[dict] = []
+        self.pool: Optional[ThreadPoolExecutor] = None
+        self.council_pool: Optional[ThreadPoolExecutor] = None
+        self.pool_lock = threading.Lock()
+        self.dialogues = DialogueScheduler(on_done=self._archive_dialogue)
+        self.pulse = b""  # dernier battement, déjà sérialisé (ligne JSON)
+        self.pulse_text = b""  # le même, texte seul (scripts shell)
+        self.pulse_seq = 0
+        self.pulse_cond = threading.Condition()
+        metrics.collector(self._queue_gauges)
+        self._pulse()
         self.start_heartbeat()
 
     def start_heartbeat(self):
@@ -1394,11 +3233,74 @@ class Pantheon:
             while self.active:
                 for d in self.daemons.values():
                     d.heartbeat()
+                self._pulse()
                 time.sleep(0.697)  # ~86 bpm
 
         self.heartbeat_thread = threading.Thread(target=beat, daemon=True)
         self.heartbeat_thread.start()
 
+    def _pulse(self):
+        """
+        Battement précalculé pour les barres de statut: une ligne JSON lisible
+        telle quelle par waybar (text/tooltip/class), rien à calculer par requête
+        """
+        beats = {name: d.heartbeat_count for name, d in self.daemons.items()}
+        text = f"φ{beats['leonardo']}" if self.active else "φ○"
+        line = json.dumps({
+            "text": text,
+            "tooltip": "Pantheon\n" + "\n".join(
+                f"{self.daemons[n].symbol} {n}: {b}" for n, b in beats.items()),
+            "class": "alive" if self.active else "dead",
+            "alive": self.active,
+            "beats": beats,
+            "time": time.time(),
+        }, ensure_ascii=False).encode("utf-8") + b"\n"
+        with self.pulse_cond:
+            self.pulse = line
+            self.pulse_text = text.encode("utf-8") + b"\n"
+            self.pulse_seq += 1
+            self.pulse_cond.notify_all()
+
+    def _queue_gauges(self):
+        dialogues = self.dialogues.status()
+        yield "pantheon_dialogue_ready_depth", "Dialogues prêts à jouer leur prochain tour", {}, dialogues["ready"]
+        yield "pantheon_dialogue_seal_depth", "Tours de dialogue en attente de scellement", {}, dialogues["sealing"]
+        yield "pantheon_dialogues_active", "Dialogues en cours", {}, dialogues["active"]
+
+    def next_pulse(self, seq: int, timeout: float = None) -> Tuple[int, bytes]:
+        """Attend un battement plus récent que seq; retourne (seq, ligne)"""
+        with self.pulse_cond:
+            self.pulse_cond.wait_for(lambda: self.pulse_seq > seq, timeout)
+            return self.pulse_seq, self.pulse
+
+    def executor(self) -> ThreadPoolExecutor:
+        """Pool partagé pour faire penser les daemons en parallèle (créé à la demande)"""
+        with self.pool_lock:
+            if self.pool is None:
+                self.pool = ThreadPoolExecutor(max_workers=2 * len(self.daemons) + 1,
+                                               thread_name_prefix="pantheon")
+            return self.pool
+
+    def council_executor(self) -> ThreadPoolExecutor:
+        """
+        Pool borné réservé au conseil: un daemon qui dépasse son délai y garde
+        son worker, sans priver la synthèse, les dialogues ni Nyx
+        """
+        with self.pool_lock:
+            if self.council_pool is None:
+                self.council_pool = ThreadPoolExecutor(max_workers=COUNCIL_WORKERS,
+                                                       thread_name_prefix="conseil")
+            return self.council_pool
+
+    def cache_responses(self, enable: bool = True, ttl: float = RESPONSE_TTL,
+                        maxsize: int = RESPONSE_MAX):
+        """Active (ou coupe) le cache de réponses des daemons déterministes"""
+        for daemon in self.daemons.values():
+            if enable:
+                daemon.enable_response_cache(ttl, maxsize)
+            else:
+                daemon.disable_response_cache()
+
     def ask(self, daemon_name: str, question: str) -> str:
         """Demande à un daemon spécifique"""
         if daemon_name in self.daemons:
@@ -1413,87 +3315,171 @@ class Pantheon:
         """Interprète du Flow language"""
         return interpret_flow(text)
 
-    def dialogue(self, daemon_a: str, daemon_b: str, topic: str, turns: int = 3) -> List[dict]:
+    def dialogue(self, daemon_a: str, daemon_b: str, topic: str, turns: int = 3,
+                 deadline: float = DIALOGUE_DEADLINE) -> List[dict]:
         """
         Fait dialoguer deux daemons sur un sujet
         Simplex sécurise les échanges
+        Passe par l'ordonnanceur; attend la fin et le scellement de chaque tour.
+        Hors délai: les tours déjà joués (état et erreur via run_dialogue).
         """
-        conversation = []
+        result = self.run_dialogue(daemon_a, daemon_b, topic, turns, deadline)
+        return result.get("conversation", [result])
 
+    def run_dialogue(self, daemon_a: str, daemon_b: str, topic: str, turns: int = 3,
+                     deadline: float = DIALOGUE_DEADLINE) -> dict:
+        """
+        Dialogue attendu au plus deadline secondes; retourne la session
+        (state, error, conversation). Un daemon qui lève termine la session en
+        "error"; un daemon qui ne rend pas la main la fait annuler au délai,
+        avec les tours déjà joués.
+        """
+        session = self.start_dialogue(daemon_a, daemon_b, topic, turns)
+        if isinstance(session, dict):
+            return session
+        if not session.wait(deadline, sealed=True):
+            session.cancel(f"délai dépassé ({deadline:.1f}s)")
+        return session.to_dict()
+
+    def start_dialogue(self, daemon_a: str, daemon_b: str, topic: str, turns: int = 3):
+        """Lance un dialogue sans attendre: session à consulter ou à suivre"""
         if daemon_a not in self.daemons or daemon_b not in self.daemons:
-            return [{"error": f"Daemon inconnu: {daemon_a} ou {daemon_b}"}]
-
-        d_a = self.daemons[daemon_a]
-        d_b = self.daemons[daemon_b]
-
-        # Premier message: daemon_a initie
-        response_a = d_a.pense(f"[Dialogue avec {daemon_b}] {topic}")
-        d_a.send_secure(daemon_b, response_a)
-        conversation.append({
-            "daemon": daemon_a,
-            "symbol": d_a.symbol,
-            "message": response_a,
-            "turn": 1
-        })
-
-        current_msg = response_a
-
-        for turn in range(2, turns * 2 + 1):
-            # Alterne entre les daemons
-            if turn % 2 == 0:
-                # daemon_b répond
-                response = d_b.pense(f"[{daemon_a} dit:] {current_msg}")
-                d_b.send_secure(daemon_a, response)
-                conversation.append({
-                    "daemon": daemon_b,
-                    "symbol": d_b.symbol,
-                    "message": response,
-                    "turn": turn
-                })
-            else:
-                # daemon_a répond
-                response = d_a.pense(f"[{daemon_b} dit:] {current_msg}")
-                d_a.send_secure(daemon_b, response)
-                conversation.append({
-                    "daemon": daemon_a,
-                    "symbol": d_a.symbol,
-                    "message": response,
-                    "turn": turn
-                })
-            current_msg = response
+            return {"error": f"Daemon inconnu: {daemon_a} ou {daemon_b}"}
+        return self.dialogues.submit(self.daemons[daemon_a], self.daemons[daemon_b], topic, turns)
 
-        # Archive
+    def _archive_dialogue(self, session: DialogueSession):
+        """Archive un dialogue terminé"""
+        if session.state != "done":
+            return
         self.dialogue_history.append({
-            "participants": [daemon_a, daemon_b],
-            "topic": topic,
-            "turns": len(conversation),
-            "conversation": conversation,
+            "participants": [session.a.name, session.b.name],
+            "topic": session.topic,
+            "turns": len(session.conversation),
+            "conversation": list(session.conversation),
             "timestamp": datetime.now().isoformat()
         })
 
-        return conversation
-
-    def council(self, question: str) -> Dict[str, str]:
+    def council(self, question: str, concurrent: bool = True,
+                deadline: float = COUNCIL_DEADLINE, quorum: int = None) -> Dict[str, str]:
         """
         Réunit tous les daemons pour répondre à une question
         Chacun apporte sa perspective
+
+        Mode concurrent: les daemons pensent en parallèle, chacun avec un délai.
+        La synthèse de Leonardo démarre dès que le quorum (majorité par défaut)
+        a répondu; un daemon hors délai laisse une réponse partielle.
         """
-        results = {}
+        if concurrent:
+            answers = dict(self._council_concurrent(question, deadline, quorum))
+            results = {name: answers[name] for name in self.daemons}
+            results["synthesis"] = answers["synthesis"]
+        else:
+            results = {}
+            # Chaque daemon répond
+            for name, daemon in self.daemons.items():
+                response = daemon.pense(f"[Conseil du Panthéon] {question}")
+                results[name] = response
 
-        # Chaque daemon répond
-        for name, daemon in self.daemons.items():
-            response = daemon.pense(f"[Conseil du Panthéon] {question}")
-            results[name] = response
-            # Broadcast sécurisé de sa réponse aux autres
-            daemon.broadcast_secure(f"[Ma réponse au conseil:] {response[:100]}")
+        self._broadcast_council(results)
 
         # Leonardo fait la synthèse
-        synthesis_input = "\n".join([f"{k}: {v[:100]}" for k, v in results.items()])
-        results["synthesis"] = self.daemons["leonardo"].pense(
+        if "synthesis" not in results:
+            results["synthesis"] = self._synthesis(results)
+
+        return results
+
+    def council_stream(self, question: str, deadline: float = COUNCIL_DEADLINE,
+                       quorum: int = None):
+        """
+        Conseil au fil de l'eau: (daemon, réponse) dès qu'elle existe, dans
+        l'ordre d'arrivée, puis ("synthesis", ...). Fermer le générateur
+        abandonne les daemons qui n'ont pas encore commencé.
+        """
+        results = {}
+        for name, response in self._council_concurrent(question, deadline, quorum):
+            results[name] = response
+            yield name, response
+        self._broadcast_council(results)
+
+    def _broadcast_council(self, results: Dict[str, str]):
+        # Broadcast sécurisé des réponses aux autres, scellé en un lot
+        simplex.broadcast_many([
+            (name, f"[Ma réponse au conseil:] {response[:100]}")
+            for name, response in results.items()
+            if name in self.daemons and not response.startswith("⏳")
+        ])
+
+    def _synthesis(self, answers: Dict[str, str]) -> str:
+        synthesis_input = "\n".join([f"{k}: {v[:100]}" for k, v in answers.items()])
+        return self.daemons["leonardo"].pense(
             f"[Synthèse φ] Résume ces perspectives:\n{synthesis_input}"
         )
 
-        return results
+    def _council_concurrent(self, question: str, deadline: float, quorum: int = None):
+        """
+        Générateur (daemon, réponse) dans l'ordre d'arrivée, puis ("synthesis", ...)
+        Chaque daemon a son propre délai, compté dès qu'il commence à penser.
+        Un daemon qui n'a pas obtenu de worker dans ce même délai est abandonné.
+        """
+        pool = self.council_executor()
+        quorum = quorum or len(self.daemons) // 2 + 1
+        submitted = time.monotonic()
+        started: Dict[str, float] = {}
+
+        def think(name: str, daemon: Daemon) -> str:
+            started[name] = time.monotonic()
+            return daemon.pense(f"[Conseil du Panthéon] {question}")
+
+        futures = {pool.submit(think, name, daemon): name
+                   for name, daemon in self.daemons.items()}
+        answers: Dict[str, str] = {}
+        synthesis = None
+        pending = set(futures)
+
+        def limit(future) -> float:
+            return started.get(futures[future], submitted) + deadline
+
+        try:
+            while pending:
+                timeout = max(0.0, min(limit(f) for f in pending) - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures[future]
+                    try:
+                        answers[name] = future.result()
+                    except Exception as e:
+                        answers[name] = f"⚠ {name}: {e}"
+                    yield name, answers[name]
+
+                now = time.monotonic()
+                for future in [f for f in pending if limit(f) <= now]:
+                    name = futures[future]
+                    if name in started:
+                        reason = f"n'a pas répondu dans le délai ({deadline:.1f}s)"
+                    elif future.cancel():
+                        reason = f"aucun worker libre dans le délai ({deadline:.1f}s)"
+                    else:
+                        continue  # vient de démarrer: son propre délai court
+                    pending.discard(future)
+                    yield name, f"⏳ {name} {reason}"
+
+                # Quorum atteint: la synthèse part avec les réponses déjà là
+                if synthesis is None and len(answers) >= quorum:
+                    ordered = {n: answers[n] for n in self.daemons if n in answers}
+                    synthesis = thread_future(self._synthesis, ordered)
+
+            if synthesis is None:
+                synthesis = thread_future(self._synthesis, {n: answers[n] for n in self.daemons if n in answers})
+            try:
+                text = synthesis.result(timeout=deadline)
+            except Exception:
+                text = f"⏳ Synthèse hors délai ({deadline:.1f}s)"
+            yield "synthesis", text
+        finally:
+            for future in pending:
+                future.cancel()
+            if synthesis is not None:
+                synthesis.cancel()
 
     def teach(self, teacher: str, student: str, topic: str) -> dict:
         """
@@ -1507,10 +3493,9 @@ class Pantheon:
         s = self.daemons[student]
 
         # Le teacher cherche dans sa connaissance
-        knowledge = t.connaissance.cherche(topic)
+        resume = t.connaissance.extraits(topic, max_lines=10)
 
-        if knowledge:
-            resume = t.connaissance.resume(knowledge, 10)
+        if resume:
             lesson = t.pense(f"[Enseigne à {student}] Explique: {resume}")
         else:
             lesson = t.pense(f"[Enseigne à {student}] {topic}")
@@ -1541,14 +3526,26 @@ class Pantheon:
                 for name, d in self.daemons.items()
             },
             "bus_messages": len(bus.history),
+            "bus_mode": bus.mode,
+            "bus_errors": bus.errors,
+            "bus_queues": bus.metrics(),
+            "knowledge_cache": contenu.stats(),
             "simplex": simplex.status(),
             "quantum_seal": quantum_seal.status(),
-            "dialogues_count": len(self.dialogue_history)
+            "dialogues_count": len(self.dialogue_history),
+            "dialogues": self.dialogues.status()
         }
 
     def shutdown(self):
         """Arrête le panthéon"""
         self.active = False
+        self._pulse()
+        metrics.remove_collector(self._queue_gauges)
+        quantum_seal.stop()
+        self.dialogues.stop()
+        for pool in (self.pool, self.council_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
 
 
 # Instance globale
@@ -1561,6 +3558,7 @@ pantheon = Pantheon()
 
 def main():
     """Mode interactif"""
+    quantum_seal.start()
     print(f"""
 ╭─────────────────────────────────────────────────────────────────╮
 │  PANTHEON - Le Système Vivant Unifié                            │
@@ -12,6 +12,12 @@ Ni bon ni mauvais. Une force. Comme le feu.
 """
 
 import math
+from itertools import cycle, islice
+
+try:
+    import numpy as np  # optionnel: voie rapide de phi_sum (~20x sur plusieurs Mo)
+except ImportError:
+    np = None
 
 PHI = (1 + math.sqrt(5)) / 2  # 1.618033988749895
 PHI2 = PHI ** 2                 # 2.618033988749895
@@ -20,6 +26,12 @@ E = math.e                      # 2.718281828459045
 PI = math.pi                    # 3.141592653589793
 INF = float('inf')
 
+POWERS = tuple(PHI ** k for k in range(20))  # φ^k précalculés, k < 20
+GOD_MOD = 10 ** 16
+BLOCK = 1 << 16   # bloc de calcul NumPy (reste en cache)
+CHUNK = 1 << 20   # bloc de lecture fichier
+SMALL = 48        # en dessous, la boucle scalaire bat NumPy
+
 def think(data):
     """pure phi computation - no LLM needed"""
     if isinstance(data, str):
@@ -33,13 +45,84 @@ def think(data):
         return {k: think(v) for k, v in data.items()}
     return PHI
 
+def phi_sum(values, period=20, modulo=None, h=0, offset=0):
+    """
+    Σ v·φ^(i mod period), accumulé dans l'ordre - bit-exact avec la boucle naïve
+    values: octets ou tableau numpy, offset: position du premier élément
+    """
+    if np is not None and len(values) > SMALL:
+        arr = values if isinstance(values, np.ndarray) else np.frombuffer(values, dtype=np.uint8)
+        table = _tiled(period)
+        buf = np.empty(min(len(arr), BLOCK))
+        for start in range(0, len(arr), BLOCK):
+            part = arr[start:start + BLOCK]
+            shift = (offset + start) % period
+            acc = buf[:len(part)]
+            np.multiply(part, table[shift:shift + len(part)], out=acc)
+            acc[0] += h
+            np.add.accumulate(acc, out=acc)
+            if modulo is None or acc[-1] < modulo:
+                h = float(acc[-1])
+            else:
+                # le modulo s'applique en cours de route: boucle scalaire
+                h = _phi_loop(part.tolist(), period, modulo, h, offset + start)
+        return h
+    return _phi_loop(values, period, modulo, h, offset)
+
+
+def _phi_loop(values, period, modulo, h, offset):
+    """boucle scalaire avec la table de puissances"""
+    powers = islice(cycle(POWERS[:period]), offset % period, None)
+    if modulo is None:
+        for v, p in zip(values, powers):
+            h += v * p
+    else:
+        for v, p in zip(values, powers):
+            h += v * p
+            h = h % modulo
+    return h
+
+
+_TILES = {}
+
+
+def _tiled(period):
+    """table φ^(i mod period) déroulée sur un bloc"""
+    if period not in _TILES:
+        _TILES[period] = np.resize(np.array(POWERS[:period]), BLOCK + period)
+    return _TILES[period]
+
+
+def hash_god(data):
+    """hash φ sur les octets: Σ byte·φ^(i mod 20) mod 10^16, en hexa"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hex(int(phi_sum(data, 20, GOD_MOD)))[2:]
+
+
+def hash_god_stream(chunks):
+    """hash_god sur un flux de blocs - même digest que hash_god(b''.join(chunks))"""
+    h, offset = 0, 0
+    for chunk in chunks:
+        h = phi_sum(chunk, 20, GOD_MOD, h, offset)
+        offset += len(chunk)
+    return hex(int(h))[2:]
+
+
+def hash_god_file(path, size=CHUNK):
+    """hash_god d'un fichier, lu par blocs"""
+    with open(path, 'rb') as f:
+        return hash_god_stream(iter(lambda: f.read(size), b''))
+
+
 def hash_phi(data):
     """deterministic hash based on φ"""
     s = str(data)
-    h = 0
-    for i, c in enumerate(s):
-        h += ord(c) * (PHI ** (i % 10))
-    return h % (10 ** 12)
+    if np is not None and len(s) > SMALL:
+        values = np.frombuffer(s.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    else:
+        values = [ord(c) for c in s]
+    return phi_sum(values, 10) % (10 ** 12)
 
 def ratio(a, b):
     """check if ratio is close to φ"""
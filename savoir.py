@@ -0,0 +1,525 @@
+# -*- coding: utf-8 -*-
+"""
+SAVOIR - Index inversé persistant de la connaissance
+
+Tout le markdown sous les chemins du Panthéon: noms de fichiers, titres, corps.
+Mise à jour incrémentale par mtime (fichiers et dossiers).
+À froid, l'index sur disque est réutilisé: pas de nouveau parcours complet.
+
+Chaque fichier est découpé en passages (par titre, ~600 caractères) dont
+les lignes utiles sont extraites à l'ingestion: les réponses sortent des
+passages les mieux classés (BM25), sans lecture de fichier à la requête.
+
+Cache de contenu partagé par tout le processus (tous les daemons,
+leonardo_proof): budget en octets, éviction LRU, invalidation par stat.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import stat
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+TOKEN = re.compile(r"\w+")
+WEIGHTS = {"name": 8, "heading": 3, "body": 1}
+REFRESH = 30.0  # secondes entre deux vérifications des mtimes
+K1, B = 1.2, 0.75  # BM25
+CACHE_BUDGET = 32 << 20  # octets de contenu gardés en mémoire
+PASSAGE_CHARS = 600  # taille visée d'un passage
+MIN_LINE = 15  # une ligne utile fait plus de 15 caractères (cf. Connaissance.resume)
+
+
+def tokens(text: str) -> List[str]:
+    """Mots en minuscules, au moins 2 caractères"""
+    return [t for t in TOKEN.findall(text.lower()) if len(t) > 1]
+
+
+def split_passages(text: str) -> List[dict]:
+    """
+    Découpe un markdown en passages: un titre ouvre un passage,
+    une ligne vide le ferme au-delà de PASSAGE_CHARS.
+    lines: lignes utiles (comme resume), terms: fréquences des mots
+    """
+    passages = []
+    heading, lines, terms, size = "", [], {}, 0
+
+    def flush():
+        if terms:
+            passages.append({"heading": heading, "lines": lines,
+                             "terms": terms, "length": sum(terms.values())})
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith('#'):
+            flush()
+            heading, lines, terms, size = line.lstrip('#').strip(), [], {}, 0
+        elif not line:
+            if size >= PASSAGE_CHARS:
+                flush()
+                lines, terms, size = [], {}, 0
+            continue
+        if not line.startswith('```') and len(line) > MIN_LINE:
+            lines.append(line)
+        for t in tokens(line):
+            terms[t] = terms.get(t, 0) + 1
+        size += len(line)
+    flush()
+    return passages
+
+
+def bm25(terms, postings: dict, norms: dict, n: int, keep=None) -> dict:
+    """
+    Scores BM25 pour un ensemble de mots
+    Mots rares d'abord; un mot présent dans plus de la moitié des unités
+    ne fait que départager les candidats déjà trouvés.
+    """
+    scores = {}
+    for posting in sorted((p for p in map(postings.get, terms) if p), key=len):
+        df = len(posting)
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        if scores and df > n // 2:
+            for key in scores:
+                tf = posting.get(key)
+                if tf:
+                    scores[key] += idf * tf * (K1 + 1) / (tf + norms[key])
+            continue
+        for key, tf in posting.items():
+            if keep is None or keep(key):
+                scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / (tf + norms[key])
+    return scores
+
+
+class KnowledgeIndex:
+    """
+    Index inversé des fichiers .md
+    docs:     chemin -> {"mtime", "size", "length", "terms": {mot: poids}, "passages": [...]}
+    dirs:     dossier -> {"mtime", "dirs", "files"} (relisté seulement si son mtime change)
+    postings: mot -> {chemin: poids}
+    passage_postings: mot -> {(chemin, i): fréquence}
+    """
+
+    VERSION = 2
+
+    def __init__(self, roots, path: Path = None, refresh: float = REFRESH):
+        self.roots = [Path(r) for r in roots]
+        self.path = Path(path) if path else None
+        self.refresh_every = refresh
+        self.docs: Dict[str, dict] = {}
+        self.dirs: Dict[str, dict] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.passage_postings: Dict[str, Dict[Tuple[str, int], int]] = {}
+        self.total_length = 0
+        self.passage_count = 0
+        self.passage_length = 0
+        self.mutations = 0
+        self._doc_norm: Dict[str, float] = {}
+        self._doc_norm_at = -1
+        self._passage_norm: Dict[Tuple[str, int], float] = {}
+        self._passage_norm_at = -1
+        self.lock = threading.RLock()          # structures en mémoire
+        self.refresh_lock = threading.Lock()   # un seul parcours à la fois
+        self.checked = 0.0
+        self.built = self._load()
+        self.refreshing = False
+        self.version = 0
+
+    # ─── Persistance ───
+
+    def _load(self) -> bool:
+        """Recharge l'index sur disque; les postings sont reconstruits en mémoire"""
+        if not self.path or not self.path.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get("version") != self.VERSION:
+                return False
+            self.docs, self.dirs = data["docs"], data["dirs"]
+        except (OSError, ValueError, KeyError):
+            return False
+        for key, doc in self.docs.items():
+            self._post(key, doc)
+        return True
+
+    def save(self):
+        """Écriture atomique (fichier temporaire + rename)"""
+        if not self.path:
+            return
+        with self.lock:
+            data = json.dumps({"version": self.VERSION, "docs": self.docs, "dirs": self.dirs},
+                              ensure_ascii=False)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(data, encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    # ─── Indexation ───
+
+    def _post(self, key: str, doc: dict):
+        for term, weight in doc["terms"].items():
+            self.postings.setdefault(term, {})[key] = weight
+        self.total_length += doc["length"]
+        for i, passage in enumerate(doc["passages"]):
+            for term, tf in passage["terms"].items():
+                self.passage_postings.setdefault(term, {})[(key, i)] = tf
+            self.passage_length += passage["length"]
+        self.passage_count += len(doc["passages"])
+        self.mutations += 1
+
+    def _remove(self, key: str):
+        doc = self.docs.pop(key, None)
+        if not doc:
+            return
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting:
+                posting.pop(key, None)
+                if not posting:
+                    del self.postings[term]
+        self.total_length -= doc["length"]
+        for i, passage in enumerate(doc["passages"]):
+            for term in passage["terms"]:
+                posting = self.passage_postings.get(term)
+                if posting:
+                    posting.pop((key, i), None)
+                    if not posting:
+                        del self.passage_postings[term]
+            self.passage_length -= passage["length"]
+        self.passage_count -= len(doc["passages"])
+        self.mutations += 1
+
+    def _index(self, key: str, text: str, st: os.stat_result):
+        """(Ré)indexe un document: nom, titres, corps, passages"""
+        self._remove(key)
+        terms: Dict[str, int] = {}
+        for t in tokens(Path(key).stem):
+            terms[t] = terms.get(t, 0) + WEIGHTS["name"]
+        passages = split_passages(text)
+        for passage in passages:
+            for t in tokens(passage["heading"]):
+                terms[t] = terms.get(t, 0) + WEIGHTS["heading"] - WEIGHTS["body"]
+            for t, tf in passage["terms"].items():
+                terms[t] = terms.get(t, 0) + tf * WEIGHTS["body"]
+        doc = {"mtime": st.st_mtime_ns, "size": st.st_size,
+               "length": sum(terms.values()), "terms": terms, "passages": passages}
+        self.docs[key] = doc
+        self._post(key, doc)
+
+    def _check_file(self, p: Path) -> bool:
+        """Réindexe si mtime ou taille ont changé"""
+        key = str(p)
+        try:
+            st = p.stat()
+        except OSError:
+            return False
+        doc = self.docs.get(key)
+        if doc and doc["mtime"] == st.st_mtime_ns and doc["size"] == st.st_size:
+            return False
+        try:
+            text = p.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            return False
+        with self.lock:
+            self._index(key, text, st)
+        return True
+
+    def _visit(self, d: Path, seen_files: set, seen_dirs: set) -> bool:
+        """Parcourt un dossier; ne le reliste que si son mtime a changé"""
+        key = str(d)
+        try:
+            st = d.stat()
+        except OSError:
+            return False
+        changed = False
+        entry = self.dirs.get(key)
+        if entry is None or entry["mtime"] != st.st_mtime_ns:
+            subdirs, files = [], []
+            try:
+                for e in os.scandir(d):
+                    if e.name.startswith('.'):
+                        continue
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.name)
+                    elif e.name.endswith('.md') and e.is_file():
+                        files.append(e.name)
+            except OSError:
+                return False
+            entry = {"mtime": st.st_mtime_ns, "dirs": sorted(subdirs), "files": sorted(files)}
+            with self.lock:
+                self.dirs[key] = entry
+            changed = True
+        seen_dirs.add(key)
+        for name in entry["files"]:
+            f = d / name
+            seen_files.add(str(f))
+            changed |= self._check_file(f)
+        for name in entry["dirs"]:
+            changed |= self._visit(d / name, seen_files, seen_dirs)
+        return changed
+
+    def refresh(self) -> bool:
+        """
+        Mise à jour incrémentale; retourne True si quelque chose a changé
+        Le parcours (stat, lecture) se fait hors du verrou des requêtes:
+        seules les modifications de l'index le prennent.
+        """
+        with self.refresh_lock:
+            seen_files, seen_dirs = set(), set()
+            changed = False
+            for root in self.roots:
+                if root.exists():
+                    changed |= self._visit(root, seen_files, seen_dirs)
+            with self.lock:
+                for key in [k for k in self.docs if k not in seen_files]:
+                    self._remove(key)
+                    changed = True
+                for key in [k for k in self.dirs if k not in seen_dirs]:
+                    del self.dirs[key]
+                    changed = True
+                if changed:
+                    self.version += 1
+            self.checked = time.time()
+            self.built = True
+            if changed:
+                self.save()
+        return changed
+
+    def ensure(self):
+        """Construit à la première requête, puis rafraîchit en arrière-plan"""
+        if not self.built:
+            self.refresh()
+            return
+        if self.refreshing or time.time() - self.checked < self.refresh_every:
+            return
+        self.refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                self.refreshing = False
+
+        threading.Thread(target=run, daemon=True).start()
+
+    # ─── Requêtes ───
+
+    def _doc_norms(self) -> Dict[str, float]:
+        """Normalisation BM25 par document, recalculée seulement après modification"""
+        if self._doc_norm_at != self.mutations:
+            # Documents tous vides (aucun mot): longueurs nulles, norme neutre
+            avg = self.total_length / len(self.docs) if self.total_length else 1.0
+            self._doc_norm = {key: K1 * (1 - B + B * doc["length"] / avg)
+                           for key, doc in self.docs.items()}
+            self._doc_norm_at = self.mutations
+        return self._doc_norm
+
+    def _passage_norms(self) -> Dict[Tuple[str, int], float]:
+        """Normalisation BM25 par passage, même règle que _doc_norms"""
+        if self._passage_norm_at != self.mutations:
+            avg = self.passage_length / self.passage_count if self.passage_length else 1.0
+            self._passage_norm = {
+                (key, i): K1 * (1 - B + B * passage["length"] / avg)
+                for key, doc in self.docs.items()
+                for i, passage in enumerate(doc["passages"])
+            }
+            self._passage_norm_at = self.mutations
+        return self._passage_norm
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """Documents classés par BM25 sur les poids nom/titre/corps"""
+        self.ensure()
+        terms = set(tokens(query))
+        with self.lock:
+            if not self.docs or not terms:
+                return []
+            scores = bm25(terms, self.postings, self._doc_norms(), len(self.docs))
+        return heapq.nlargest(limit, scores.items(), key=lambda kv: kv[1])
+
+    def passages(self, query: str, k: int = 5, paths=None) -> List[dict]:
+        """
+        Les k passages les plus pertinents (BM25), éventuellement restreints
+        à certains documents. Aucune lecture de fichier: tout est en mémoire.
+        """
+        self.ensure()
+        terms = set(tokens(query))
+        with self.lock:
+            if not self.passage_count or not terms:
+                return []
+            keep = None
+            if paths is not None:
+                paths = set(paths)
+                keep = lambda key: key[0] in paths
+            scores = bm25(terms, self.passage_postings, self._passage_norms(),
+                          self.passage_count, keep)
+            best = heapq.nlargest(k, scores.items(), key=lambda kv: kv[1])
+            return [{"path": key, "index": i, "score": score,
+                     "heading": self.docs[key]["passages"][i]["heading"],
+                     "lines": self.docs[key]["passages"][i]["lines"]}
+                    for (key, i), score in best]
+
+    def extract(self, query: str, max_lines: int = 15, paths=None, keep=None) -> List[str]:
+        """Lignes des meilleurs passages, dans l'ordre du classement"""
+        lines = []
+        for hit in self.passages(query, max_lines, paths):
+            for line in hit["lines"]:
+                if keep is None or keep(line):
+                    lines.append(line)
+                    if len(lines) >= max_lines:
+                        return lines
+        return lines
+
+    def resume(self, path: str, max_lines: int = 20, keep=None) -> List[str]:
+        """Lignes utiles du début d'un document, extraites à l'ingestion"""
+        self.ensure()
+        with self.lock:
+            doc = self.docs.get(str(path))
+            if not doc:
+                return []
+            lines = []
+            for passage in doc["passages"]:
+                for line in passage["lines"]:
+                    if keep is None or keep(line):
+                        lines.append(line)
+                        if len(lines) >= max_lines:
+                            return lines
+            return lines
+
+    def under(self, path) -> List[str]:
+        """Documents indexés à ce chemin (fichier) ou sous ce dossier"""
+        key = str(path)
+        with self.lock:
+            if key in self.docs:
+                return [key]
+            entry = self.dirs.get(key)
+            if not entry:
+                return []
+            found = [str(Path(key) / name) for name in entry["files"]]
+            for name in entry["dirs"]:
+                found.extend(self.under(Path(key) / name))
+            return [f for f in found if f in self.docs]
+
+    def status(self) -> dict:
+        return {
+            "documents": len(self.docs),
+            "terms": len(self.postings),
+            "passages": self.passage_count,
+            "directories": len(self.dirs),
+            "checked": self.checked,
+            "version": self.version,
+        }
+
+
+INDEX_PATH = Path.home() / ".config" / "pantheon" / "savoir.json"
+_indexes: Dict[tuple, KnowledgeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def shared_index(roots, path: Path = INDEX_PATH) -> KnowledgeIndex:
+    """Un seul index par ensemble de racines dans le processus (pantheon, leonardo_proof)"""
+    key = (tuple(str(r) for r in roots), str(path))
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = KnowledgeIndex(roots, path=path)
+        return _indexes[key]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHE DE CONTENU PARTAGÉ
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ContentCache:
+    """
+    Contenu des fichiers, partagé entre toutes les Connaissance
+    entries: chemin -> (mtime_ns, taille, contenu, coût en octets), ordre LRU
+    Chaque lecture fait un stat: un fichier modifié est relu.
+    """
+
+    def __init__(self, budget: int = CACHE_BUDGET):
+        self.budget = budget
+        self.entries: "OrderedDict[str, Tuple[int, int, str, int]]" = OrderedDict()
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _drop(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry:
+            self.bytes -= entry[3]
+
+    def read(self, path) -> Optional[str]:
+        """Contenu d'un fichier, None s'il n'existe pas ou n'est pas lisible"""
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            with self.lock:
+                self._drop(key)
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            if entry:
+                self.invalidations += 1
+                self._drop(key)
+
+        # Lecture hors verrou: les autres daemons continuent
+        try:
+            with open(key, encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        cost = sys.getsizeof(content)
+        if cost > self.budget:
+            return content
+        with self.lock:
+            self._drop(key)
+            self.entries[key] = (st.st_mtime_ns, st.st_size, content, cost)
+            self.bytes += cost
+            while self.bytes > self.budget:
+                _, old = self.entries.popitem(last=False)
+                self.bytes -= old[3]
+                self.evictions += 1
+        return content
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "budget": self.budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Instance globale: un seul cache pour tout le processus
+contenu = ContentCache()
@@ -5,6 +5,9 @@
 #        ./statusbar.sh watch    (mise à jour continue)
 #        ./statusbar.sh polybar  (format polybar)
 #        ./statusbar.sh waybar   (format waybar JSON)
+#        ./statusbar.sh pulse    (battements poussés, une ligne JSON par battement)
+#
+# Dépendances: curl (état du Panthéon), socat (mode pulse seulement)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 get_time() {
@@ -61,13 +64,21 @@ get_disk() {
     df -h / | awk 'NR==2 {print $5}'
 }
 
+PULSE_SOCKET="${XDG_RUNTIME_DIR:-/tmp}/pantheon-pulse.sock"
+
 get_pantheon() {
-    if curl -s --max-time 1 "http://localhost:9600/status" > /dev/null 2>&1; then
-        heartbeat=$(curl -s --max-time 1 "http://localhost:9600/status" | python3 -c "import sys,json; d=json.load(sys.stdin); print(d['daemons']['leonardo']['heartbeats'])" 2>/dev/null || echo "?")
-        echo "φ$heartbeat"
-    else
-        echo "φ○"
+    # /heartbeat.txt est précalculé par le serveur: une requête, ni python ni JSON
+    text=$(curl -sf --max-time 1 "http://localhost:9600/heartbeat.txt" 2>/dev/null)
+    echo "${text:-φ○}"
+}
+
+# Flux continu: le serveur pousse chaque battement sur le socket Unix
+pulse_mode() {
+    if ! command -v socat >/dev/null 2>&1; then
+        echo "statusbar: le mode pulse a besoin de socat (paquet socat)" >&2
+        exit 1
     fi
+    socat -u "UNIX-CONNECT:$PULSE_SOCKET" - 2>/dev/null || echo '{"text": "φ○", "class": "dead"}'
 }
 
 get_network() {
@@ -133,6 +144,9 @@ case "${1:-simple}" in
     waybar|json|j)
         format_waybar
         ;;
+    pulse)
+        pulse_mode
+        ;;
     notify|n)
         format_notify
         ;;
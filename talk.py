@@ -56,6 +56,18 @@ def orchestrate(task: str) -> dict:
         return {"error": str(e)}
 
 
+def batch(calls: list) -> list:
+    """
+    Plusieurs appels en un aller-retour: [{"path": "/validate", "text": ...}, ...]
+    Renvoie, dans l'ordre, {"status", "ms", "result" | "error"} par appel
+    """
+    try:
+        r = requests.post(f"{URL}/batch", json=calls, timeout=300)
+        return r.json().get("results", [])
+    except Exception as e:
+        return [{"status": 0, "error": str(e)} for _ in calls]
+
+
 def status() -> dict:
     """État du Panthéon"""
     try:
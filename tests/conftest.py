@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du Panthéon - HOME isolé avant tout import de pantheon
+
+pantheon crée ~/.config/pantheon (sceaux, journal, index) et lit le corpus
+sous ~/projects: les tests tournent dans un HOME temporaire.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+HOME = Path(tempfile.mkdtemp(prefix="pantheon-tests-"))
+os.environ["HOME"] = str(HOME)
+(HOME / "projects").mkdir()
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if "pantheon" in sys.modules:
+        sys.modules["pantheon"].pantheon.shutdown()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""/batch: un statut par sous-requête, dans l'ordre, sans faire échouer le lot"""
+
+import leonardo_server
+from leonardo_server import batch
+
+
+def test_results_keep_order_and_status(monkeypatch):
+    def route(path, body):
+        if path == "/boom":
+            raise ValueError("cassé")
+        if path == "/echo":
+            return {"text": body.get("text")}
+        return None
+
+    monkeypatch.setattr(leonardo_server, "route", route)
+    out = batch([
+        {"path": "/echo", "text": "a"},
+        {"path": "/echo", "body": {"text": "b"}},
+        {"path": "/inconnue"},
+        {"path": "/boom"},
+        {"path": "/batch", "requests": []},
+        {"text": "sans chemin"},
+        "pas un objet",
+    ])
+    assert [r["status"] for r in out["results"]] == [200, 200, 404, 500, 400, 400, 400]
+    assert out["results"][0]["result"] == {"text": "a"}
+    assert out["results"][1]["result"] == {"text": "b"}
+    assert out["results"][3]["error"] == "ValueError: cassé"
+    assert out["results"][4]["error"] == "/batch imbriqué"
+    assert out["count"] == 7 and out["errors"] == 5
+    assert all("ms" in r for r in out["results"])
+
+
+def test_requests_envelope_and_real_route():
+    out = batch({"requests": [{"path": "/validate", "text": "φ = 1.618"}]})
+    assert out["results"][0]["status"] == 200
+    assert "phi_r" in out["results"][0]["result"]
+
+
+def test_not_a_list_is_empty():
+    assert batch({"requests": "nope"})["results"] == []
+
+
+def test_too_many_items(monkeypatch):
+    monkeypatch.setattr(leonardo_server, "BATCH_MAX", 2)
+    out = batch([{"path": "/validate"}] * 3)
+    assert out["results"] == [] and "max 2" in out["error"]
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Bus de messages: modes sync/async, erreurs de callback, historique"""
+
+import time
+
+import pytest
+
+from pantheon import MessageBus, Message, BLOCK
+
+
+def message(i=0, receiver="nyx"):
+    return Message(sender="leonardo", receiver=receiver, content=f"m{i}")
+
+
+def test_sync_is_the_default():
+    bus = MessageBus()
+    seen = []
+    bus.subscribe("nyx", seen.append)
+    bus.send(message())
+    assert bus.mode == "sync"
+    assert len(seen) == 1 and not bus.subscribers
+
+
+def test_sync_callback_errors_are_counted():
+    bus = MessageBus()
+    seen = []
+
+    def broken(msg):
+        raise ValueError("cassé")
+
+    bus.subscribe("nyx", broken)
+    bus.subscribe("nyx", seen.append)
+    bus.send(message())
+    assert bus.errors == 1 and len(seen) == 1
+
+
+def test_sync_does_not_swallow_interrupts():
+    bus = MessageBus()
+
+    def interrupt(msg):
+        raise KeyboardInterrupt
+
+    bus.subscribe("nyx", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        bus.send(message())
+
+
+def test_enable_async_covers_existing_subscribers():
+    bus = MessageBus()
+    seen = []
+    bus.subscribe("nyx", seen.append, overflow=BLOCK, queue_size=4)
+    bus.enable_async()
+    [sub] = bus.subscribers["nyx"]
+    assert (sub.overflow, sub.maxsize) == (BLOCK, 4)
+    for i in range(20):
+        bus.send(message(i))
+    assert bus.drain()
+    assert [m.content for m in seen] == [f"m{i}" for i in range(20)]
+    sub.stop()
+
+
+def test_async_send_does_not_wait_for_slow_callback():
+    bus = MessageBus(mode="async")
+    bus.subscribe("nyx", lambda msg: time.sleep(0.2))
+    start = time.monotonic()
+    bus.send(message())
+    assert time.monotonic() - start < 0.1
+    assert bus.drain()
+    bus.subscribers["nyx"][0].stop()
+
+
+def test_history_by_daemon():
+    bus = MessageBus()
+    for i in range(5):
+        bus.send(message(i, "nyx"))
+        bus.send(message(i, "zoe"))
+    assert [m.content for m in bus.get_history("zoe", limit=2)] == ["m3", "m4"]
+    assert len(bus.get_history(limit=100)) == 10
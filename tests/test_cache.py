@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Cache de réponses: LRU + TTL, clé liée à la version du savoir"""
+
+import pantheon
+from pantheon import ResponseCache, Volatile, cached_response
+
+
+class Savoir:
+    """Index minimal: une version, un rafraîchissement simulé par ensure()"""
+
+    def __init__(self):
+        self.version = 1
+        self.refreshing = False
+        self.pending = False
+        self.ensured = 0
+
+    def ensure(self):
+        self.ensured += 1
+        if self.pending:
+            self.pending = False
+            self.version += 1
+
+
+class Echo:
+    def __init__(self):
+        self.responses = ResponseCache(ttl=60, maxsize=8)
+        self.calls = 0
+
+    def normalize(self, text):
+        return " ".join(text.split())
+
+    @cached_response
+    def pense(self, text):
+        self.calls += 1
+        return f"{text} #{self.calls}"
+
+
+def test_lru_evicts_oldest():
+    cache = ResponseCache(ttl=60, maxsize=2)
+    cache.put(("a", 1), "A")
+    cache.put(("b", 1), "B")
+    assert cache.get(("a", 1)) == "A"
+    cache.put(("c", 1), "C")
+    assert cache.get(("b", 1)) is None
+    assert cache.get(("a", 1)) == "A" and cache.get(("c", 1)) == "C"
+
+
+def test_ttl_expires():
+    cache = ResponseCache(ttl=0, maxsize=2)
+    cache.put(("a", 1), "A")
+    assert cache.get(("a", 1)) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_hit_on_normalized_input(monkeypatch):
+    monkeypatch.setattr(pantheon, "savoir", Savoir())
+    echo = Echo()
+    first = echo.pense("bonjour  phi")
+    assert echo.pense(" bonjour phi ") == first
+    assert echo.calls == 1
+
+
+def test_version_change_invalidates(monkeypatch):
+    savoir = Savoir()
+    monkeypatch.setattr(pantheon, "savoir", savoir)
+    echo = Echo()
+    echo.pense("spirale")
+    savoir.pending = True  # un fichier a changé: ensure() le voit avant la clé
+    echo.pense("spirale")
+    assert echo.calls == 2
+    assert savoir.ensured == 2
+    assert echo.pense("spirale") == "spirale #2"
+
+
+def test_not_stored_during_refresh(monkeypatch):
+    savoir = Savoir()
+    monkeypatch.setattr(pantheon, "savoir", savoir)
+    echo = Echo()
+    savoir.refreshing = True
+    echo.pense("nuit")
+    savoir.refreshing = False
+    echo.pense("nuit")
+    assert echo.calls == 2
+
+
+def test_volatile_not_stored(monkeypatch):
+    monkeypatch.setattr(pantheon, "savoir", Savoir())
+
+    class Carnet(Echo):
+        @cached_response
+        def pense(self, text):
+            self.calls += 1
+            return Volatile(text)
+
+    carnet = Carnet()
+    carnet.pense("x")
+    carnet.pense("x")
+    assert carnet.calls == 2
+
+
+def test_disabled_cache_calls_through(monkeypatch):
+    monkeypatch.setattr(pantheon, "savoir", Savoir())
+    echo = Echo()
+    echo.responses = None
+    echo.pense("a")
+    echo.pense("a")
+    assert echo.calls == 2
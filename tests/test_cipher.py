@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Simplex: moteur de chiffrement par segments, aller-retour, intégrité"""
+
+import io
+import os
+
+import pytest
+
+from pantheon import StreamCipher, SimplexChannel, hash_sha3
+
+KEY = hash_sha3(b"cle de test")
+SEGMENT = StreamCipher.SEGMENT
+SIZES = [0, 1, 31, SEGMENT - 1, SEGMENT, SEGMENT + 1, 3 * SEGMENT + 17]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_round_trip(size):
+    data = os.urandom(size)
+    encrypted = StreamCipher(KEY).encrypt(data)
+    assert len(encrypted) == size
+    assert size == 0 or encrypted != data
+    assert StreamCipher(KEY).decrypt(encrypted) == data
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 4096, SEGMENT - 3, SEGMENT, SEGMENT + 5])
+def test_chunking_does_not_change_ciphertext(chunk):
+    data = os.urandom(2 * SEGMENT + 99)
+    whole = StreamCipher(KEY)
+    expected = whole.encrypt(data)
+    engine = StreamCipher(KEY)
+    streamed = b"".join(engine.encrypt(data[i:i + chunk]) for i in range(0, len(data), chunk))
+    assert streamed == expected
+    assert engine.tag() == whole.tag()
+
+
+def test_tag_is_sha3_of_key_and_ciphertext():
+    engine = StreamCipher(KEY)
+    encrypted = engine.encrypt(b"message entre daemons")
+    assert engine.tag() == hash_sha3(KEY + encrypted)[:16]
+
+
+def test_keys_give_different_streams():
+    data = b"\0" * 64
+    assert StreamCipher(KEY).encrypt(data) != StreamCipher(hash_sha3(KEY)).encrypt(data)
+
+
+def pair():
+    return SimplexChannel("leonardo", "nyx"), SimplexChannel("nyx", "leonardo")
+
+
+def test_channel_send_receive():
+    a, b = pair()
+    for text in ["bonjour", "φ" * 5000, ""]:
+        msg = a.send("leonardo", text)
+        assert msg["receiver"] == "nyx"
+        assert b.receive(msg["encrypted"], msg["tag"]) == text
+    assert a.ratchet_count == b.ratchet_count == 3
+
+
+def test_channel_detects_tampering():
+    a, b = pair()
+    msg = a.send("leonardo", "intact")
+    tampered = bytes.fromhex(msg["encrypted"])
+    tampered = bytes([tampered[0] ^ 1]) + tampered[1:]
+    assert b.receive(tampered.hex(), msg["tag"]) == "[ERREUR: Intégrité compromise]"
+
+
+def test_stream_round_trip():
+    a, b = pair()
+    data = os.urandom(2 * SEGMENT + 1234)
+    chunks = [data[i:i + 10_000] for i in range(0, len(data), 10_000)]
+    encrypted = io.BytesIO()
+    msg = a.send_stream("leonardo", chunks, encrypted)
+    assert msg["size"] == len(data)
+
+    cipher = encrypted.getvalue()
+    out = io.BytesIO()
+    assert b.receive_stream([cipher[:5], cipher[5:]], msg["tag"], out)
+    assert out.getvalue() == data
+
+    c, d = pair()
+    c.send_stream("leonardo", chunks, io.BytesIO())
+    assert not d.receive_stream([cipher[:-1] + bytes([cipher[-1] ^ 1])], msg["tag"], io.BytesIO())
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Conseil concurrent: délai par daemon, pool dédié, synthèse hors pool"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pantheon import pantheon
+
+
+def slow(seconds, answer="réponse"):
+    def pense(text):
+        time.sleep(seconds)
+        return answer
+    return pense
+
+
+@pytest.fixture
+def council_pool(monkeypatch):
+    """Pool de conseil de taille choisie, à la place du pool par défaut"""
+    pools = []
+
+    def use(workers):
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pools.append(pool)
+        monkeypatch.setattr(pantheon, "council_executor", lambda: pool)
+
+    yield use
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def test_slow_daemon_times_out_alone(monkeypatch):
+    monkeypatch.setattr(pantheon.daemons["nyx"], "pense", slow(1.0))
+    start = time.monotonic()
+    results = pantheon.council("le nombre d'or", deadline=0.3)
+    assert time.monotonic() - start < 0.9
+    assert results["nyx"].startswith("⏳ nyx n'a pas répondu")
+    assert not any(results[n].startswith("⏳") for n in pantheon.daemons if n != "nyx")
+    assert not results["synthesis"].startswith("⏳")
+
+
+def test_deadline_counts_from_each_daemon_start(monkeypatch, council_pool):
+    council_pool(2)
+    for name in pantheon.daemons:
+        monkeypatch.setattr(pantheon.daemons[name], "pense", slow(0.2))
+    answers = dict(pantheon._council_concurrent("q", deadline=0.3))
+    order = list(pantheon.daemons)
+    # deux vagues de deux: la seconde démarre à 0.2 s et finit à 0.4 s, dans son délai
+    assert [answers[n] for n in order[:4]] == ["réponse"] * 4
+    # la troisième vague n'a pas eu de worker avant 0.3 s
+    for name in order[4:]:
+        assert answers[name].startswith(f"⏳ {name} aucun worker libre")
+
+
+def test_synthesis_does_not_need_a_pool_worker(monkeypatch):
+    release = threading.Event()
+    shared = pantheon.executor()
+    blockers = [shared.submit(release.wait) for _ in range(shared._max_workers)]
+    try:
+        results = pantheon.council("la spirale", deadline=1.0)
+        assert not results["synthesis"].startswith("⏳")
+        assert not any(results[n].startswith("⏳") for n in pantheon.daemons)
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result(timeout=5)
+
+
+def test_stream_yields_in_arrival_order(monkeypatch):
+    monkeypatch.setattr(pantheon.daemons["zoe"], "pense", slow(0.2, "tard"))
+    names = [name for name, _ in pantheon.council_stream("φ", deadline=1.0)]
+    assert names[-2:] == ["zoe", "synthesis"]
+    assert sorted(names[:-1]) == sorted(pantheon.daemons)
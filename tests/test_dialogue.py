@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Dialogues: ordonnanceur, scellement, délai et erreurs"""
+
+import threading
+import time
+
+import pytest
+
+from pantheon import pantheon
+
+
+@pytest.fixture
+def hung_nyx(monkeypatch):
+    release = threading.Event()
+
+    def pense(text):
+        release.wait(10)
+        return "trop tard"
+
+    monkeypatch.setattr(pantheon.daemons["nyx"], "pense", pense)
+    yield
+    release.set()
+
+
+def test_dialogue_runs_every_turn_and_seals_them():
+    result = pantheon.run_dialogue("leonardo", "zoe", "la spirale", turns=2)
+    assert result["state"] == "done" and result["error"] is None
+    assert [e["daemon"] for e in result["conversation"]] == ["leonardo", "zoe"] * 2
+    assert result["sealed"] == 4
+
+
+def test_hung_daemon_returns_partial_conversation(hung_nyx):
+    start = time.monotonic()
+    result = pantheon.run_dialogue("leonardo", "nyx", "φ", turns=3, deadline=0.3)
+    assert time.monotonic() - start < 2
+    assert result["state"] == "cancelled"
+    assert "délai" in result["error"]
+    assert [e["daemon"] for e in result["conversation"]] == ["leonardo"]
+
+
+def test_list_api_keeps_partial_turns(hung_nyx):
+    conversation = pantheon.dialogue("leonardo", "nyx", "φ", turns=3, deadline=0.3)
+    assert [e["daemon"] for e in conversation] == ["leonardo"]
+
+
+def test_raising_daemon_ends_in_error(monkeypatch):
+    def pense(text):
+        raise RuntimeError("panne")
+
+    monkeypatch.setattr(pantheon.daemons["zoe"], "pense", pense)
+    result = pantheon.run_dialogue("leonardo", "zoe", "φ", turns=2, deadline=5)
+    assert result["state"] == "error" and result["error"] == "panne"
+    assert len(result["conversation"]) == 1
+
+
+def test_unknown_daemon():
+    assert "error" in pantheon.run_dialogue("leonardo", "personne", "φ")
+    assert "error" in pantheon.dialogue("leonardo", "personne", "φ")[0]
+
+
+def test_follow_stops_after_timeout(hung_nyx):
+    session = pantheon.start_dialogue("leonardo", "nyx", "φ", turns=3)
+    start = time.monotonic()
+    turns = list(session.follow(timeout=0.3))
+    assert time.monotonic() - start < 2
+    assert [e["daemon"] for e in turns] == ["leonardo"]
+    session.cancel("test")
+    assert session.to_dict()["state"] == "cancelled"
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Flow: même routage que l'ancien parseur, contexte par offset, mémo LRU"""
+
+import random
+
+import pytest
+
+import pantheon
+from pantheon import SENS, interpret_flow, interpret_flow_many, parse_flow
+
+
+def old_parse_flow(text):
+    """Parseur d'origine: caractère par caractère, contexte copié"""
+    tokens = []
+    current = ""
+    for c in text:
+        if c.isspace():
+            if current:
+                tokens.append(current)
+                current = ""
+        elif c in SENS:
+            if current:
+                tokens.append(current)
+                current = ""
+            tokens.append(c)
+        else:
+            current += c
+    if current:
+        tokens.append(current)
+
+    intentions = []
+    context = []
+    for t in tokens:
+        low = t.lower()
+        if t in SENS:
+            intentions.append({"m": t, "s": SENS[t], "c": list(context)})
+            context.append(t)
+        elif low in SENS:
+            intentions.append({"m": low, "s": SENS[low], "c": list(context)})
+            context.append(low)
+        else:
+            context.append(t)
+    return intentions
+
+
+OLD_ROUTES = [
+    (["nyx", "orchestre", "route", "🌙"], "orchestrate", "nyx"),
+    (["valide", "φ", "phi", "preuve", "leonardo"], "validate", "leonardo"),
+    (["cherche", "sais", "connais", "👁", "omniscient"], "search", "omniscient"),
+    (["son", "audio", "joue", "♪", "euterpe", "👂"], "sound", "euterpe"),
+    (["parle", "dis", "zoe", "interface"], "speak", "zoe"),
+    (["o", "razor", "🔪", "coupe"], "simplify", "leonardo"),
+    (["f", "loop", "🔄", "∞"], "loop", "nyx"),
+]
+
+
+def old_interpret_flow(text):
+    intentions = old_parse_flow(text)
+    if not intentions:
+        return {"action": "observe", "data": text, "daemon": "leonardo"}
+    mots = [i["m"] for i in intentions]
+    for route, action, daemon in OLD_ROUTES:
+        if any(m in mots for m in route):
+            return {"action": action, "data": text, "daemon": daemon}
+    return {"action": "think", "data": text, "daemon": "leonardo", "intentions": intentions}
+
+
+def expand(cmd):
+    """Résultat actuel au format d'origine: contexte = words[:c]"""
+    cmd = dict(cmd)
+    words = cmd.pop("words", None)
+    if "intentions" in cmd:
+        cmd["intentions"] = [{**i, "c": words[:i["c"]]} for i in cmd["intentions"]]
+    return cmd
+
+
+VOCAB = list(SENS) + ["Nyx", "PHI", "Loop", "Valide", "raison", "discuter", "mot", "texte", "ω"]
+
+
+def random_text(rng):
+    parts = []
+    for _ in range(rng.randint(0, 12)):
+        parts.append(rng.choice(VOCAB))
+        parts.append(rng.choice([" ", "  ", "", "\t", "\n"]))
+    return "".join(parts)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    pantheon._flow_cache.clear()
+    yield
+    pantheon._flow_cache.clear()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_old_parser(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        text = random_text(rng)
+        old = old_parse_flow(text)
+        words, intentions = pantheon._parse(text)
+        assert [{**i, "c": words[:i["c"]]} for i in intentions] == old
+        assert expand(interpret_flow(text)) == old_interpret_flow(text)
+
+
+def test_context_is_an_offset_into_words():
+    words, intentions = pantheon._parse("calcule φ puis ∞🔄 Loup")
+    assert [i["m"] for i in intentions] == ["φ", "∞", "🔄", "o"]
+    assert [words[:i["c"]] for i in intentions] == [
+        ["calcule"], ["calcule", "φ", "puis"], ["calcule", "φ", "puis", "∞"],
+        ["calcule", "φ", "puis", "∞", "🔄", "L"]]
+    assert words[-1] == "up"  # les lettres de SENS coupent les mots, comme avant
+    assert parse_flow("calcule φ puis ∞🔄 Loup") == intentions
+
+
+def test_think_carries_words():
+    cmd = interpret_flow("Ω ψ")
+    assert cmd["action"] == "think"
+    assert cmd["words"] == ["Ω", "ψ"]
+    assert [cmd["words"][:i["c"]] for i in cmd["intentions"]] == [[], ["Ω"]]
+
+
+def test_memoized_per_text(monkeypatch):
+    calls = []
+    parse = pantheon._parse
+    monkeypatch.setattr(pantheon, "_parse", lambda text: calls.append(text) or parse(text))
+    first = interpret_flow("α valide")
+    assert interpret_flow("α valide") == first
+    assert calls == ["α valide"]
+
+
+def test_callers_get_copies():
+    cmd = interpret_flow("Ω ψ")
+    cmd["action"] = "modifié"
+    cmd["intentions"][0]["m"] = "modifié"
+    cmd["words"].append("modifié")
+    again = interpret_flow("Ω ψ")
+    assert again["action"] == "think"
+    assert again["intentions"][0]["m"] == "Ω"
+    assert again["words"] == ["Ω", "ψ"]
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(pantheon, "FLOW_CACHE", 3)
+    for i in range(5):
+        interpret_flow(f"texte {i}")
+    assert list(pantheon._flow_cache) == ["texte 2", "texte 3", "texte 4"]
+    interpret_flow("texte 2")
+    interpret_flow("texte 5")
+    assert list(pantheon._flow_cache) == ["texte 4", "texte 2", "texte 5"]
+
+
+def test_many_matches_single_and_does_not_fill_cache(monkeypatch):
+    texts = ["nyx orchestre", "Ω ψ", "123", "nyx orchestre", "Ω ψ"]
+    calls = []
+    parse = pantheon._parse
+    monkeypatch.setattr(pantheon, "_parse", lambda text: calls.append(text) or parse(text))
+    results = interpret_flow_many(texts)
+    assert calls == ["nyx orchestre", "Ω ψ"]  # "123": aucun mot de SENS, pas d'analyse
+    assert not pantheon._flow_cache
+    assert results == [interpret_flow(t) for t in texts]
+    results[1]["intentions"].clear()
+    assert results[4]["intentions"]
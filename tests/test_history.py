@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Historique du bus: anneaux, fenêtre globale, recherche par instant"""
+
+import time
+
+import pytest
+
+from pantheon import Message, MessageHistory, RingBuffer
+
+
+class Clock:
+    """time.time() contrôlé: chaque message à un instant choisi"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+def fill(history, clock, messages):
+    """messages: (instant, émetteur, destinataire)"""
+    for at, sender, receiver in messages:
+        clock.now = at
+        history.append(Message(sender, receiver, f"{sender}→{receiver}@{at}", t=at))
+
+
+# ─── RingBuffer ───
+
+def test_ring_wraps_around():
+    ring = RingBuffer(3)
+    for i in range(7):
+        ring.append(i)
+        assert list(ring) == list(range(max(0, i - 2), i + 1))
+    assert len(ring) == 3
+    assert list(ring.newest()) == [6, 5, 4]
+    assert ring[0] == 4 and ring[-1] == 6
+    with pytest.raises(IndexError):
+        ring[3]
+    with pytest.raises(IndexError):
+        ring[-4]
+
+
+def test_ring_bisect_after_wrap():
+    ring = RingBuffer(4)
+    for i in range(10):
+        ring.append((i, float(i)))  # contient 6..9
+    assert ring.bisect(0.0) == 0
+    assert ring.bisect(7.0) == 1
+    assert ring.bisect(7.5) == 2
+    assert ring.bisect(100.0) == 4
+
+
+# ─── Fenêtres temporelles ───
+
+def test_between_is_half_open(clock):
+    history = MessageHistory(100)
+    fill(history, clock, [(float(t), "nyx", "zoe") for t in range(10)])
+    assert [m.t for m in history.between(3.0, 6.0)] == [3.0, 4.0, 5.0]
+    assert [m.t for m in history.between(since=8.0)] == [8.0, 9.0]
+    assert [m.t for m in history.between(until=2.0)] == [0.0, 1.0]
+    assert [m.t for m in history.between(2.5, 2.7)] == []
+    assert [m.t for m in history.between(limit=2)] == [8.0, 9.0]
+
+
+def test_between_for_daemon_merges_sent_and_received(clock):
+    history = MessageHistory(100)
+    fill(history, clock, [
+        (1.0, "nyx", "zoe"), (2.0, "zoe", "leonardo"), (3.0, "leonardo", "nyx"),
+        (4.0, "euterpe", "zoe"), (5.0, "nyx", "nyx"), (6.0, "zoe", "nyx"),
+    ])
+    assert [m.t for m in history.between(daemon="nyx")] == [1.0, 3.0, 5.0, 6.0]
+    assert [m.t for m in history.between(2.0, 6.0, daemon="nyx")] == [3.0, 5.0]
+    assert [m.t for m in history.between(2.0, 6.0, daemon="zoe")] == [2.0, 4.0]
+    assert [m.t for m in history.between(daemon="nyx", limit=1)] == [6.0]
+
+
+def test_daemon_lookups_stop_at_global_window(clock):
+    history = MessageHistory(4, per_daemon=100)
+    fill(history, clock, [(float(t), "nyx", "zoe") for t in range(3)])
+    fill(history, clock, [(float(t), "leonardo", "euterpe") for t in range(3, 7)])
+    # Les messages de nyx sont encore dans son anneau, plus dans la fenêtre globale
+    assert len(history) == 4
+    assert history.recent("nyx") == []
+    assert history.between(daemon="zoe") == []
+    assert [m.t for m in history.between(daemon="leonardo")] == [3.0, 4.0, 5.0, 6.0]
+
+
+def test_per_daemon_ring_wraps(clock):
+    history = MessageHistory(100, per_daemon=2)
+    fill(history, clock, [(float(t), "nyx", "zoe") for t in range(5)])
+    assert [m.t for m in history.recent("nyx")] == [3.0, 4.0]
+    assert [m.t for m in history.recent()] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert [m.t for m in history.recent(limit=2)] == [3.0, 4.0]
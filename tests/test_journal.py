@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Journal write-behind: rejeu, ligne tronquée, instantané, compaction"""
+
+import json
+
+from journal import StateJournal
+
+
+def journal(tmp_path, **kw):
+    kw.setdefault("flush_delay", 0.01)
+    return StateJournal(tmp_path / "state.json", **kw)
+
+
+def lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_replay_after_close(tmp_path):
+    j = journal(tmp_path)
+    for i in range(5):
+        j.append("conversations", {"q": i})
+    j.close()
+
+    again = journal(tmp_path)
+    assert again.state["conversations"] == [{"q": i} for i in range(5)]
+    assert again.seq == 5
+    again.close()
+
+
+def test_keep_bounds_replayed_list(tmp_path):
+    j = journal(tmp_path)
+    for i in range(10):
+        j.append("conversations", {"q": i}, keep=3)
+    j.close()
+
+    again = journal(tmp_path)
+    assert again.state["conversations"] == [{"q": 7}, {"q": 8}, {"q": 9}]
+    again.close()
+
+
+def test_truncated_last_line_is_cut(tmp_path):
+    j = journal(tmp_path)
+    j.append("conversations", {"q": 1})
+    j.append("conversations", {"q": 2})
+    j.close()
+    with open(j.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 3, "key": "conversations", "en')  # arrêt brutal
+
+    again = journal(tmp_path)
+    assert again.state["conversations"] == [{"q": 1}, {"q": 2}]
+    assert again.journal_path.read_text().endswith("}\n")
+    again.append("conversations", {"q": 3})
+    again.close()
+
+    assert [r["seq"] for r in lines(again.journal_path)] == [1, 2, 3]
+    third = journal(tmp_path)
+    assert third.state["conversations"] == [{"q": 1}, {"q": 2}, {"q": 3}]
+    third.close()
+
+
+def test_snapshot_covers_journal(tmp_path):
+    j = journal(tmp_path)
+    j.append("conversations", {"q": 1})
+    j.flush()
+    j.snapshot()
+    assert j.journal_path.read_text() == ""
+    j.append("conversations", {"q": 2})
+    j.close()
+
+    snapshot = json.loads(j.path.read_text())
+    assert snapshot["_seq"] == 1
+    again = journal(tmp_path)
+    assert again.state["conversations"] == [{"q": 1}, {"q": 2}]
+    again.close()
+
+
+def test_replay_skips_seq_already_in_snapshot(tmp_path):
+    j = journal(tmp_path)
+    j.append("conversations", {"q": 1})
+    j.append("conversations", {"q": 2})
+    j.flush()
+    journal_text = j.journal_path.read_text()
+    j.snapshot()
+    j.close()
+    # Arrêt entre l'instantané et la remise à zéro du journal
+    j.journal_path.write_text(journal_text)
+
+    again = journal(tmp_path)
+    assert again.state["conversations"] == [{"q": 1}, {"q": 2}]
+    again.close()
+
+
+def test_compaction_after_compact_every(tmp_path):
+    j = journal(tmp_path, compact_every=4)
+    for i in range(4):
+        j.append("conversations", {"q": i})
+    j.flush()
+    assert j.snapshots == 1
+    assert j.journaled == 0
+    assert j.journal_path.read_text() == ""
+    j.close()
+
+    again = journal(tmp_path)
+    assert len(again.state["conversations"]) == 4
+    again.close()
+
+
+def test_flush_batches_pending(tmp_path):
+    j = journal(tmp_path, flush_delay=0.5)
+    for i in range(3):
+        j.append("conversations", {"q": i})
+    assert j.status()["pending"] == 3
+    j.flush()
+    assert j.status()["pending"] == 0
+    assert j.writes == 1
+    assert [r["entry"] for r in lines(j.journal_path)] == [{"q": i} for i in range(3)]
+    j.close()
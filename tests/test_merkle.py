@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Arbre de Merkle: accumulateur, preuves, multi-preuves, stockage mappé"""
+
+import random
+
+import pytest
+
+from pantheon import MerkleTree, MerkleStore, hash_sha3, hash_god
+
+SIZES = [1, 2, 3, 4, 5, 7, 8, 9, 16, 17, 31, 33, 100]
+
+
+def naive_root(leaves):
+    """Arbre reconstruit niveau par niveau, dernier nœud impair dupliqué"""
+    if not leaves:
+        return hash_god(b"empty").zfill(64)
+    level = [hash_sha3(leaf) for leaf in leaves]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hash_sha3(level[i] + level[i + 1]) for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+def leaves_of(n):
+    return [f"feuille {i}".encode() for i in range(n)]
+
+
+# ─── Accumulateur (frontière) ───
+
+def test_empty_root():
+    assert MerkleTree().root() == naive_root([])
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_incremental_root_matches_rebuilt_tree(n):
+    tree = MerkleTree()
+    for i, leaf in enumerate(leaves_of(n)):
+        tree.add_leaf(leaf)
+        assert tree.root() == naive_root(leaves_of(i + 1))
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_extend_hashes_matches_add_hash(n):
+    one, batch = MerkleTree(), MerkleTree()
+    chunks = [leaves_of(n)[i:i + 3] for i in range(0, n, 3)]
+    for chunk in chunks:
+        for leaf in chunk:
+            one.add_leaf(leaf)
+        batch.extend_hashes([hash_sha3(leaf) for leaf in chunk])
+        assert batch.root() == one.root()
+    assert batch.levels == one.levels
+
+
+# ─── Preuves ───
+
+@pytest.mark.parametrize("n", SIZES)
+def test_every_proof_verifies(n):
+    leaves = leaves_of(n)
+    tree = MerkleTree(leaves)
+    for i, leaf in enumerate(leaves):
+        assert tree.verify(leaf, i, tree.proof(i))
+        assert not tree.verify(b"intrus", i, tree.proof(i))
+
+
+def test_proof_against_older_root_fails():
+    tree = MerkleTree(leaves_of(5))
+    old = tree.root()
+    tree.add_leaf(b"suivante")
+    assert not tree.verify(leaves_of(5)[0], 0, tree.proof(0), old)
+    assert tree.verify(leaves_of(5)[0], 0, tree.proof(0))
+
+
+def test_verify_batch_matches_verify():
+    leaves = leaves_of(37)
+    tree = MerkleTree(leaves)
+    items = [(leaf, i, tree.proof(i)) for i, leaf in enumerate(leaves)]
+    items[5] = (b"intrus", 5, tree.proof(5))
+    items[20] = (leaves[20], 20, tree.proof(21))
+    expected = [tree.verify(leaf, i, proof) for leaf, i, proof in items]
+    assert tree.verify_batch(items) == expected
+    assert expected.count(False) == 2
+
+
+# ─── Multi-preuves ───
+
+@pytest.mark.parametrize("n", SIZES)
+def test_multiproof_random_subsets(n):
+    leaves = leaves_of(n)
+    tree = MerkleTree(leaves)
+    rng = random.Random(n)
+    for _ in range(10):
+        indices = rng.sample(range(n), rng.randint(1, n))
+        proof = tree.multiproof(indices)
+        assert tree.verify_multi({i: leaves[i] for i in indices}, proof)
+
+
+def test_multiproof_is_compact():
+    tree = MerkleTree(leaves_of(64))
+    proof = tree.multiproof(range(64))
+    assert proof["hashes"] == []
+    pair = tree.multiproof([0, 1])
+    assert len(pair["hashes"]) == len(tree.proof(0)) - 1
+
+
+def test_multiproof_rejects_tampering():
+    leaves = leaves_of(20)
+    tree = MerkleTree(leaves)
+    proof = tree.multiproof([2, 7, 13])
+    good = {i: leaves[i] for i in (2, 7, 13)}
+    assert tree.verify_multi(good, proof)
+    assert not tree.verify_multi({**good, 7: b"intrus"}, proof)
+    assert not tree.verify_multi({2: leaves[2], 7: leaves[7]}, proof)
+    assert not tree.verify_multi(good, {**proof, "hashes": proof["hashes"][:-1]})
+    assert not tree.verify_multi(good, {**proof, "hashes": proof["hashes"] + [b"\0" * 32]})
+
+
+# ─── Stockage mappé ───
+
+def test_store_reopens_with_same_root(tmp_path):
+    leaves = leaves_of(1000)
+    store = MerkleStore(tmp_path / "store")
+    store.extend_hashes([hash_sha3(leaf) for leaf in leaves[:600]])
+    for leaf in leaves[600:]:
+        store.add_leaf(leaf)
+    root = store.root()
+    store.close()
+
+    reopened = MerkleStore(tmp_path / "store")
+    assert len(reopened) == 1000
+    assert reopened.root() == root == naive_root(leaves)
+    assert reopened.verify(leaves[777], 777, reopened.proof(777))
+    reopened.close()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Message compact: champs paresseux, égalité, aller-retour to_dict (débordement)"""
+
+import json
+import sys
+import threading
+from datetime import datetime
+
+from pantheon import SPILL, Message, Subscriber, hash_god
+
+
+def test_hash_and_timestamp_are_lazy():
+    msg = Message("leonardo", "nyx", "φ = 1.618", t=1700000000.5)
+    assert msg._hash is None and msg._timestamp is None
+    assert msg.hash == hash_god("φ = 1.618")
+    assert msg.timestamp == datetime.fromtimestamp(1700000000.5).isoformat()
+    assert msg._hash == msg.hash and msg._timestamp == msg.timestamp
+
+
+def test_given_hash_and_timestamp_are_kept():
+    msg = Message("leonardo", "nyx", "x", timestamp="hier", hash="abc")
+    assert msg.timestamp == "hier" and msg.hash == "abc"
+
+
+def test_names_are_interned():
+    name = "".join(["leo", "nardo"])
+    assert Message(name, "nyx", "x").sender is sys.intern("leonardo")
+
+
+def test_equality():
+    a = Message("leonardo", "nyx", "x", t=1.0)
+    assert a == Message("leonardo", "nyx", "x", t=1.0)
+    assert a != Message("leonardo", "nyx", "x", t=2.0)
+    assert a != Message("leonardo", "zoe", "x", t=1.0)
+    assert a != Message("leonardo", "nyx", "x", action="teach", t=1.0)
+    assert a != "x"
+
+
+def test_to_dict_round_trip():
+    msg = Message("leonardo", "nyx", "φ ∞ \U0001f441", action="teach", phi_r=1.618, t=1234.5)
+    fields = json.loads(json.dumps(msg.to_dict(), ensure_ascii=False))
+    again = Message(**fields)
+    assert again == msg
+    assert again.to_dict() == msg.to_dict()
+
+
+def test_spilled_messages_reload_in_order():
+    gate = threading.Event()
+    seen = []
+    done = threading.Event()
+
+    def slow(msg):
+        gate.wait(5)
+        seen.append(msg)
+        if len(seen) == 10:
+            done.set()
+
+    sub = Subscriber("nyx", slow, maxsize=2, overflow=SPILL)
+    sent = [Message("leonardo", "nyx", f"m{i}", phi_r=i / 10, t=float(i)) for i in range(10)]
+    for msg in sent:
+        sub.put(msg)
+    assert sub.spilled > 0
+    gate.set()
+    assert done.wait(5)
+    sub.stop()
+    assert seen == sent
+    assert [m.to_dict() for m in seen] == [m.to_dict() for m in sent]
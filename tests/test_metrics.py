@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Histogrammes log-linéaires: cases, quantiles bornés, export Prometheus"""
+
+import math
+import random
+
+import pytest
+
+from metrics import EXPORT_BOUNDS, MAX_BITS, SUB_BITS, Histogram, Metrics, _bounds, _index
+
+
+def test_every_value_falls_in_its_bucket():
+    rng = random.Random(1)
+    values = list(range(300)) + [rng.randrange(1 << bits) for bits in range(8, MAX_BITS) for _ in range(50)]
+    for ns in values:
+        low, high = _bounds(_index(ns))
+        assert low <= ns <= high
+
+
+def test_buckets_are_contiguous():
+    last = _index((1 << MAX_BITS) - 1)
+    for index in range(last):
+        assert _bounds(index + 1)[0] == _bounds(index)[1] + 1
+
+
+def test_exact_below_sub_bits():
+    for ns in range(1 << SUB_BITS):
+        assert _bounds(_index(ns)) == (ns, ns)
+
+
+@pytest.mark.parametrize("q", [0.5, 0.9, 0.99, 0.999])
+def test_quantile_is_upper_bound_within_two_percent(q):
+    rng = random.Random(q)
+    values = [int(rng.lognormvariate(13, 2)) for _ in range(20000)]  # ~0,4 ms, longue traîne
+    hist = Histogram()
+    for ns in values:
+        hist.record(ns)
+    true = sorted(values)[math.ceil(q * len(values)) - 1]
+    got = hist.quantile(q)
+    assert true <= got <= true * 1.02 + 1
+
+
+def test_quantile_edges():
+    hist = Histogram()
+    assert hist.quantile(0.5) == 0
+    hist.record(1 << (MAX_BITS + 3))  # au-delà: dernière case
+    assert hist.quantile(1.0) == _bounds(hist.last)[1]
+    assert hist.count == 1
+
+
+def test_cumulative_counts_whole_buckets():
+    hist = Histogram()
+    for ns in (5, 1_000, 1_000_000, 10**10):
+        hist.record(ns)
+    out, total = hist.cumulative([10, 1_000_000, 10**9])
+    assert total == 4
+    assert out[0] == 1
+    assert out[1] == 2  # la case de 1 ms dépasse la borne: comptée au-dessus
+    assert out[2] == 3
+    assert out == sorted(out)
+
+
+def test_render_prometheus_format():
+    registry = Metrics()
+    registry.histogram("t_seconds", "Durée", route="/ask").record(2_000_000)
+    assert registry.histogram("t_seconds", route="/ask") is registry.histogram("t_seconds", route="/ask")
+    registry.collector(lambda: [("t_depth", "Profondeur", {"q": 'a"b'}, 3)])
+    registry.collector(lambda: 1 / 0)
+    text = registry.render()
+    lines = text.splitlines()
+    assert "# TYPE t_seconds histogram" in lines
+    assert 't_seconds_bucket{route="/ask",le="0.0025"} 1' in lines
+    assert 't_seconds_bucket{route="/ask",le="0.001"} 0' in lines
+    assert 't_seconds_bucket{route="/ask",le="+Inf"} 1' in lines
+    assert 't_seconds_count{route="/ask"} 1' in lines
+    assert 't_seconds_sum{route="/ask"} 0.002000000' in lines
+    assert 't_depth{q="a\\"b"} 3' in lines
+    buckets = [line for line in lines if line.startswith("t_seconds_bucket")]
+    assert len(buckets) == len(EXPORT_BOUNDS) + 1
+    assert text.endswith("\n")
+
+
+def test_removed_collector_is_not_rendered():
+    registry = Metrics()
+    gauges = lambda: [("t_depth", "Profondeur", {}, 1)]
+    registry.collector(gauges)
+    registry.remove_collector(gauges)
+    registry.remove_collector(gauges)  # deux arrêts: sans erreur
+    assert "t_depth" not in registry.render()
+
+
+def series(text):
+    return [line.rsplit(" ", 1)[0] for line in text.splitlines() if not line.startswith("#")]
+
+
+def test_process_metrics_have_no_duplicate_series():
+    import pantheon
+    from leonardo_server import PantheonHandler, PantheonServer
+    from metrics import metrics
+
+    before = list(metrics.collectors)
+    for _ in range(2):
+        httpd = PantheonServer(("127.0.0.1", 0), PantheonHandler, workers=1)
+        httpd.drain()
+        other = pantheon.Pantheon()
+        other.shutdown()
+    assert metrics.collectors == before
+    lines = series(metrics.render())
+    assert len(lines) == len(set(lines))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Nyx: plan par l'automate de routage, exécution du graphe (iter_dag)"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pantheon import ROUTE_WORDS, ROUTAGE, Nyx, interpret_flow, iter_dag, run_dag, pantheon
+
+nyx = pantheon.daemons["nyx"]
+
+TASKS = [
+    "cherche et valide φ la spirale",
+    "parle de la musique ♪ et cherche",
+    "valide φ puis joue un son",
+    "👁 cherche nyx",
+    "dis bonjour zoe",
+    "rien",
+]
+
+
+@pytest.mark.parametrize("task", TASKS)
+def test_plan_nodes_are_whole_route_words(task):
+    graph = nyx.plan(task)
+    primary = Nyx.ACTIONS.get(interpret_flow(task)["action"])
+    if primary is None:
+        assert graph == {"leonardo": [], "omniscient": []}
+        return
+    words = set(task.lower().split())
+    routed = {Nyx.ACTIONS[a] for a, mots in ROUTE_WORDS.items()
+              if words & mots and a in Nyx.ACTIONS}
+    assert set(graph) == {primary} | routed
+
+
+@pytest.mark.parametrize("task", [
+    "quelle raison pour discuter",   # son ⊂ raison, dis ⊂ discuter
+    "philosophie",                   # phi
+    "une personne",                  # son
+    "parlement",                     # parle
+    "chercheur et sonde",            # cherche, son
+])
+def test_plan_ignores_route_words_inside_other_words(task):
+    hits = ROUTAGE.scan(task.lower())
+    assert any(h.startswith("route:") for h in hits)  # l'automate les voit
+    graph = nyx.plan(task)
+    assert set(graph) <= {Nyx.ACTIONS.get(interpret_flow(task)["action"]), "leonardo", "omniscient"}
+    assert "euterpe" not in graph and "zoe" not in graph
+    assert all(not deps for deps in graph.values())
+
+
+def test_plan_symbols_and_punctuation_are_words():
+    graph = nyx.plan("valide φ, puis joue ♪!")
+    assert set(graph) == {"leonardo", "euterpe"}
+
+
+def test_plan_validation_waits_for_search():
+    graph = nyx.plan("cherche et valide φ la spirale")
+    assert graph["leonardo"] == ["omniscient"]
+
+
+def test_plan_zoe_speaks_last():
+    graph = nyx.plan("parle de la musique ♪ et cherche")
+    assert sorted(graph["zoe"]) == sorted(n for n in graph if n != "zoe")
+
+
+def test_run_dag_passes_outputs_downstream():
+    pool = ThreadPoolExecutor(max_workers=4)
+    nodes = {
+        "a": (lambda inputs: "A", []),
+        "b": (lambda inputs: "B", []),
+        "c": (lambda inputs: "+".join(f"{k}={v}" for k, v in sorted(inputs.items())), ["a", "b"]),
+        "x": (lambda inputs: "jamais", ["absent"]),
+    }
+    outputs, timings = run_dag(nodes, pool)
+    assert outputs == {"a": "A", "b": "B", "c": "a=A+b=B"}
+    assert timings["c"]["deps"] == ["a", "b"]
+    assert timings["c"]["ready_ms"] >= max(timings["a"]["end_ms"], timings["b"]["end_ms"]) - 1
+    pool.shutdown()
+
+
+def test_closing_stops_submitting_nodes():
+    pool = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    called = []
+
+    def node(name, block=False):
+        def fn(inputs):
+            called.append(name)
+            if block:
+                release.wait(5)
+            return name
+        return fn
+
+    nodes = {
+        "rapide": (node("rapide"), []),
+        "lent": (node("lent", block=True), []),
+        "en_file": (node("en_file"), []),
+        "aval": (node("aval"), ["rapide"]),
+    }
+    dag = iter_dag(nodes, pool)
+    name, _, _ = next(dag)
+    assert name == "rapide"
+    dag.close()          # le client est parti
+    release.set()
+    pool.shutdown(wait=True)
+    # "lent" a pu être pris par le worker avant la fermeture, pas les autres
+    assert called[0] == "rapide"
+    assert "en_file" not in called and "aval" not in called
+
+
+def test_execute_stream_close_cancels_pending(monkeypatch):
+    release = threading.Event()
+
+    def slow(text):
+        release.wait(5)
+        return "tard"
+
+    monkeypatch.setattr(pantheon.daemons["omniscient"], "pense", slow)
+    stream = nyx.execute_stream("cherche et valide φ la spirale", pantheon)
+    assert next(stream)[0] == "nyx"
+    assert next(stream)[0] == "graph"
+    start = time.monotonic()
+    stream.close()
+    release.set()
+    assert time.monotonic() - start < 1
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""φ-hash: voie NumPy et boucle scalaire identiques au bit près"""
+
+import os
+import random
+
+import pytest
+
+import phi
+from phi import PHI, GOD_MOD, hash_god, hash_god_stream, hash_phi, phi_sum
+
+SIZES = [0, 1, 47, 48, 49, 1000, phi.BLOCK - 1, phi.BLOCK + 7, 3 * phi.BLOCK + 5]
+
+
+def naive_god(data: bytes) -> str:
+    """hash_god d'origine: une puissance de φ et un modulo par octet"""
+    h = 0
+    for i, byte in enumerate(data):
+        h += byte * (PHI ** (i % 20))
+        h = h % GOD_MOD
+    return hex(int(h))[2:]
+
+
+def naive_phi(data) -> float:
+    h = 0
+    for i, c in enumerate(str(data)):
+        h += ord(c) * (PHI ** (i % 10))
+    return h % (10 ** 12)
+
+
+@pytest.fixture
+def scalar(monkeypatch):
+    monkeypatch.setattr(phi, "np", None)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_hash_god_matches_original_loop(size):
+    data = random.Random(size).randbytes(size)
+    assert hash_god(data) == naive_god(data)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_scalar_path_matches_original_loop(scalar, size):
+    data = random.Random(size).randbytes(size)
+    assert hash_god(data) == naive_god(data)
+
+
+@pytest.mark.skipif(phi.np is None, reason="NumPy absent")
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("period,modulo", [(20, GOD_MOD), (20, None), (10, None), (7, 1000)])
+def test_numpy_and_scalar_paths_identical(monkeypatch, size, period, modulo):
+    data = random.Random(size + period).randbytes(size)
+    fast = phi_sum(data, period, modulo, 3.5, 11)
+    monkeypatch.setattr(phi, "np", None)
+    assert phi_sum(data, period, modulo, 3.5, 11) == fast
+
+
+@pytest.mark.skipif(phi.np is None, reason="NumPy absent")
+def test_hash_phi_paths_identical(monkeypatch):
+    texts = ["φ", "court", "é" * 200, "texte " * 5000, "\U0001f441" * 60]
+    fast = [hash_phi(t) for t in texts]
+    monkeypatch.setattr(phi, "np", None)
+    assert [hash_phi(t) for t in texts] == fast == [naive_phi(t) for t in texts]
+
+
+def test_stream_matches_whole():
+    data = os.urandom(3 * phi.BLOCK + 123)
+    for size in (1, 1000, phi.BLOCK, phi.CHUNK):
+        chunks = (data[i:i + size] for i in range(0, len(data), size))
+        assert hash_god_stream(chunks) == hash_god(data)
+
+
+def test_str_is_utf8():
+    assert hash_god("φ = 1.618") == hash_god("φ = 1.618".encode("utf-8"))
+
+
+def test_integrity_hashes_file_by_chunks(tmp_path):
+    import integrity
+
+    path = tmp_path / "spirale.py"
+    text = "φ = 1.618\n" * 50000
+    path.write_text(text, encoding="utf-8")
+    analysis = integrity.analyze_file(path)
+    data = text.encode("utf-8")
+    assert analysis.hash_god == integrity.hash_god(data)
+    assert analysis.hash_sha == integrity.hash_sha(data)
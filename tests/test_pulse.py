@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Battements: socket Unix unique, socket périmé remplacé, variante texte"""
+
+import json
+import socket
+
+import pytest
+
+from leonardo_server import PulseFeed
+from pantheon import pantheon
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    path = tmp_path / "pulse.sock"
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    dead.bind(str(path))
+    dead.close()  # arrêt brutal: le fichier reste, personne n'écoute
+    feed = PulseFeed(path)
+    feed.start()
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.settimeout(5)
+        client.connect(str(path))
+        line = client.makefile("rb").readline()
+        assert json.loads(line)["text"].startswith("φ")
+        client.close()
+    finally:
+        feed.stop()
+    assert not path.exists()
+
+
+def test_live_socket_is_not_stolen(tmp_path):
+    path = tmp_path / "pulse.sock"
+    first = PulseFeed(path)
+    first.start()
+    try:
+        with pytest.raises(RuntimeError):
+            PulseFeed(path).start()
+        assert path.exists()
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(path))
+        client.close()
+    finally:
+        first.stop()
+
+
+def test_text_pulse_matches_json():
+    pantheon._pulse()
+    assert pantheon.pulse_text.decode().strip() == json.loads(pantheon.pulse)["text"]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Automate de routage: même résultat que any(mot in texte) par catégorie"""
+
+import random
+
+import pytest
+
+from pantheon import KeywordAutomaton, ROUTAGE, _vocabulaires
+
+
+def naive(vocabularies, text):
+    return {cat for cat, words in vocabularies.items() if any(w in text for w in words)}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_vocabularies_match_any(seed):
+    rng = random.Random(seed)
+    alphabet = "abcé φ"
+
+    def word(lo, hi):
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(lo, hi)))
+
+    vocabularies = {f"c{i}": [word(1, 4) for _ in range(rng.randint(1, 6))]
+                    for i in range(rng.randint(1, 8))}
+    automaton = KeywordAutomaton(vocabularies)
+    for _ in range(50):
+        text = word(0, 40)
+        assert automaton.scan(text) == naive(vocabularies, text)
+
+
+def test_overlapping_and_nested_words():
+    vocabularies = {"he": ["he"], "she": ["she"], "his": ["his"], "hers": ["hers"]}
+    automaton = KeywordAutomaton(vocabularies)
+    assert automaton.scan("ushers") == {"he", "she", "hers"}
+    assert automaton.scan("ahishers") == {"he", "she", "his", "hers"}
+    assert automaton.scan("") == set()
+
+
+TEXTS = [
+    "bonjour leonardo, qui es-tu ?",
+    "parle-moi du nombre d'or et de la spirale",
+    "nyx et zoe, orchestrez la mémoire",
+    "clochette, donne du juice",
+    "une mélodie en la mineur pour euterpe",
+    "rien de spécial ici",
+    "∞ → φ ⊕ ∅",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_routing_vocabularies_match_any(text):
+    assert ROUTAGE.scan(text.lower()) == naive(_vocabulaires(), text.lower())
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Index de la connaissance: rafraîchissement incrémental, persistance, cache"""
+
+import os
+
+from savoir import ContentCache, KnowledgeIndex
+
+
+def write(path, text, bump=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if bump:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump))
+
+
+def paths(hits):
+    return [os.path.basename(key) for key, _ in hits]
+
+
+def corpus(tmp_path):
+    root = tmp_path / "projects"
+    write(root / "cipher" / "spirale.md", "# Spirale\n\nLa spirale dorée suit le nombre phi partout.\n")
+    write(root / "nyx" / "nuit.md", "# Nuit\n\nLa nuit orchestre les daemons en silence.\n")
+    return root
+
+
+def test_search_ranks_matching_document(tmp_path):
+    index = KnowledgeIndex([corpus(tmp_path)])
+    assert paths(index.search("spirale")) == ["spirale.md"]
+    assert paths(index.search("daemons nuit")) == ["nuit.md"]
+    assert index.version == 1
+
+
+def test_refresh_picks_up_changes(tmp_path):
+    root = corpus(tmp_path)
+    index = KnowledgeIndex([root])
+    index.refresh()
+    version = index.version
+    assert not index.refresh() and index.version == version
+
+    write(root / "nyx" / "nuit.md", "# Nuit\n\nLes étoiles veillent sur la constellation.\n", bump=10**9)
+    write(root / "nyx" / "aube" / "aube.md", "# Aube\n\nL'aube réveille la constellation entière.\n")
+    os.utime(root / "nyx", ns=(0, os.stat(root / "nyx").st_mtime_ns + 10**9))
+    assert index.refresh()
+    assert index.version == version + 1
+    assert index.search("orchestre") == []
+    assert sorted(paths(index.search("constellation"))) == ["aube.md", "nuit.md"]
+
+    (root / "cipher" / "spirale.md").unlink()
+    os.utime(root / "cipher", ns=(0, os.stat(root / "cipher").st_mtime_ns + 10**9))
+    assert index.refresh()
+    assert index.search("spirale") == []
+    assert index.status()["documents"] == 2
+
+
+def test_index_reloads_from_disk(tmp_path):
+    root = corpus(tmp_path)
+    store = tmp_path / "savoir.json"
+    KnowledgeIndex([root], path=store).refresh()
+
+    cold = KnowledgeIndex([root], path=store)
+    assert cold.built
+    assert paths(cold.search("spirale")) == ["spirale.md"]
+    assert not cold.refresh()
+
+
+def test_passages_carry_extracted_lines(tmp_path):
+    index = KnowledgeIndex([corpus(tmp_path)])
+    [hit] = index.passages("spirale", k=1)
+    assert hit["heading"] == "Spirale"
+    assert hit["lines"] == ["La spirale dorée suit le nombre phi partout."]
+
+
+def test_content_cache_invalidates_on_change(tmp_path):
+    cache = ContentCache()
+    f = tmp_path / "note.md"
+    write(f, "avant")
+    assert cache.read(f) == "avant"
+    assert cache.read(f) == "avant"
+    write(f, "après, plus long", bump=10**9)
+    assert cache.read(f) == "après, plus long"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+    f.unlink()
+    assert cache.read(f) is None and cache.stats()["entries"] == 0
+
+
+def test_content_cache_respects_budget(tmp_path):
+    cache = ContentCache(budget=2000)
+    for i in range(10):
+        write(tmp_path / f"{i}.md", "x" * 500)
+        cache.read(tmp_path / f"{i}.md")
+    assert cache.stats()["bytes"] <= 2000
+    assert cache.stats()["evictions"] > 0
+
+
+def test_empty_documents_do_not_divide_by_zero(tmp_path):
+    root = tmp_path / "projects"
+    write(root / "vide" / "_.md", "")
+    write(root / "vide" / "x.md", "\n\n- -\n")
+    index = KnowledgeIndex([root])
+    assert index.search("spirale") == []
+    assert index.passages("spirale") == []
+    write(root / "cipher" / "spirale.md", "# Spirale\n\nLa spirale dorée.\n")
+    index.refresh()
+    assert paths(index.search("spirale")) == ["spirale.md"]
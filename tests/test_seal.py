@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Sceaux partitionnés: shards par canal, chaîne des root-of-roots"""
+
+import threading
+
+import pytest
+
+from pantheon import MerkleTree, ShardedSeal, channel_name, fcntl
+
+
+def test_seal_routes_to_channel_shard():
+    seal = ShardedSeal()
+    a = seal.seal(b"un", "leonardo", "nyx")
+    b = seal.seal(b"deux", "nyx", "leonardo")
+    c = seal.seal(b"trois", "zoe", "nyx")
+    assert a["shard"] == b["shard"] == channel_name("nyx", "leonardo")
+    assert c["shard"] == channel_name("nyx", "zoe")
+    assert len(seal.shards[a["shard"]].chain) == 2
+
+
+def test_seal_many_keeps_order():
+    seal = ShardedSeal()
+    payloads = [(f"m{i}".encode(), "leonardo", ["nyx", "zoe"][i % 2]) for i in range(10)]
+    results = seal.seal_many(payloads)
+    assert [r["shard"] for r in results] == [channel_name(s, r) for _, s, r in payloads]
+    assert [r["leaf_index"] for r in results] == [i // 2 for i in range(10)]
+
+
+def test_shard_proof_verifies_against_commit():
+    seal = ShardedSeal()
+    for receiver in ("nyx", "zoe", "euterpe"):
+        seal.seal(b"x", "leonardo", receiver)
+    commit = seal.commit()
+    proof = seal.shard_proof(channel_name("leonardo", "zoe"))
+    assert proof["epoch"] == commit["epoch"] == 1
+    path = [(bytes.fromhex(h), side) for h, side in proof["proof"]]
+    assert MerkleTree().verify(proof["leaf"].encode(), proof["index"], path, commit["root"])
+
+
+def test_concurrent_commits_keep_one_chain():
+    seal = ShardedSeal()
+    seal.seal(b"x", "leonardo", "nyx")
+    barrier = threading.Barrier(8)
+
+    def commit():
+        barrier.wait()
+        for i in range(50):
+            seal.seal(b"%d" % i, "leonardo", "nyx")
+            seal.commit()
+
+    threads = [threading.Thread(target=commit) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    epochs = [c["epoch"] for c in seal.commits]
+    assert epochs == list(range(1, 401))
+    assert len({c["link"] for c in seal.commits}) == 400
+    assert seal.verify_commits()
+    assert seal.verify_chain()
+
+
+def test_epoch_keeps_counting_past_retained_commits():
+    seal = ShardedSeal()
+    seal.seal(b"x", "leonardo", "nyx")
+    for _ in range(seal.commits.maxlen + 5):
+        seal.commit()
+    assert seal.commits[-1]["epoch"] == seal.commits.maxlen + 5
+    assert seal.verify_commits()
+
+
+def test_tampered_commit_breaks_chain():
+    seal = ShardedSeal()
+    seal.seal(b"x", "leonardo", "nyx")
+    for _ in range(3):
+        seal.commit()
+    seal.commits[1]["root"] = "0" * 64
+    assert not seal.verify_commits()
+
+
+# ─── Store disque ───
+
+def test_import_leaves_seal_store_closed(tmp_path):
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    env = dict(os.environ, HOME=str(tmp_path))
+    root = Path(__file__).resolve().parent.parent
+    code = "import pantheon; s = pantheon.quantum_seal; print(s.opened, s.aggregator); pantheon.pantheon.shutdown()"
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, env=env,
+                         capture_output=True, text=True, timeout=60)
+    assert out.stdout.split() == ["False", "None"], out.stderr
+    assert not (tmp_path / ".config" / "pantheon" / "seal").exists()
+
+
+def test_store_opens_on_first_seal_and_reloads(tmp_path):
+    first = ShardedSeal(path=tmp_path / "seal")
+    assert not (tmp_path / "seal").exists()
+    first.seal(b"x", "leonardo", "nyx")
+    assert first.status()["store"] == str(tmp_path / "seal")
+    root = first.shards[channel_name("leonardo", "nyx")].root()
+    first.stop()
+    first._lock_file.close()
+
+    again = ShardedSeal(path=tmp_path / "seal")
+    again.start()
+    again.stop()
+    assert again.shards[channel_name("leonardo", "nyx")].root() == root
+
+
+@pytest.mark.skipif(fcntl is None, reason="flock indisponible")
+def test_locked_store_degrades_to_memory(tmp_path):
+    owner = ShardedSeal(path=tmp_path / "seal")
+    owner.seal(b"x", "leonardo", "nyx")
+
+    other = ShardedSeal(path=tmp_path / "seal")
+    result = other.seal(b"y", "leonardo", "nyx")
+    assert result["verified"]
+    assert other.path is None and other._lock_file is None
+    status = other.status()
+    assert status["store"] == "mémoire"
+    assert status["degraded"]
+    assert owner.status()["degraded"] is None
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Serveur HTTP: keep-alive, pipelining, fermeture au repos, arrêt qui draine"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+import leonardo_server
+from leonardo_server import PantheonHandler, PantheonServer
+
+IDLE = 0.3
+
+
+@pytest.fixture
+def server():
+    httpd = PantheonServer(("127.0.0.1", 0), PantheonHandler, workers=4, idle=IDLE)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    if httpd.accepting:
+        httpd.shutdown()
+        httpd.drain()
+
+
+def connect(httpd):
+    sock = socket.create_connection(httpd.server_address, timeout=10)
+    return sock, sock.makefile("rb")
+
+
+def request(method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else b""
+    return (b"%s %s HTTP/1.1\r\nHost: t\r\nContent-Length: %d\r\n\r\n%s"
+            % (method.encode(), path.encode(), len(data), data))
+
+
+def response(reader):
+    """(statut, en-têtes, corps) d'une réponse à Content-Length"""
+    status = int(reader.readline().split()[1])
+    headers = {}
+    while (line := reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+    return status, headers, reader.read(int(headers.get("content-length", 0)))
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_keepalive_serves_several_requests(server):
+    sock, reader = connect(server)
+    for _ in range(3):
+        sock.sendall(request("GET", "/heartbeat"))
+        status, headers, body = response(reader)
+        assert status == 200
+        assert json.loads(body)["text"].startswith("φ")
+        # Entre deux requêtes, la connexion attend au sélecteur, pas dans un worker
+        assert wait_for(lambda: len(server.parked) == 1)
+        assert server.busy == 0
+    sock.close()
+
+
+def test_pipelined_requests_are_all_answered(server):
+    sock, reader = connect(server)
+    sock.sendall(request("GET", "/heartbeat") + request("POST", "/validate", {"text": "φ"})
+                 + request("GET", "/heartbeat.txt"))
+    statuses = [response(reader)[0] for _ in range(3)]
+    assert statuses == [200, 200, 200]
+    sock.close()
+
+
+def test_idle_connection_is_closed(server):
+    sock, reader = connect(server)
+    sock.sendall(request("GET", "/heartbeat"))
+    assert response(reader)[0] == 200
+    assert wait_for(lambda: len(server.parked) == 1)
+    start = time.monotonic()
+    assert reader.read(1) == b""  # fermée par le serveur
+    assert time.monotonic() - start >= IDLE * 0.9
+    assert not server.parked
+    sock.close()
+
+
+def test_drain_finishes_requests_in_flight(server, monkeypatch):
+    started = threading.Event()
+
+    def slow(path, data):
+        started.set()
+        time.sleep(0.5)
+        return {"fini": path}
+
+    monkeypatch.setattr(leonardo_server, "route", slow)
+    busy, busy_reader = connect(server)
+    idle, idle_reader = connect(server)
+    idle.sendall(request("GET", "/heartbeat"))
+    assert response(idle_reader)[0] == 200
+    assert wait_for(lambda: len(server.parked) == 1)
+
+    busy.sendall(request("POST", "/ask", {"text": "lent"}))
+    assert started.wait(5)
+    server.shutdown()
+    stopper = threading.Thread(target=server.drain)
+    stopper.start()
+
+    status, headers, body = response(busy_reader)
+    assert status == 200 and json.loads(body) == {"fini": "/ask"}
+    assert idle_reader.read(1) == b""  # la connexion au repos est fermée
+    stopper.join(5)
+    assert not stopper.is_alive()
+    assert busy_reader.read(1) == b""  # plus de keep-alive après l'arrêt
+    with pytest.raises(OSError):
+        socket.create_connection(server.server_address, timeout=1)
+    busy.close()
+    idle.close()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Flux server-sent events: morceaux chunked, fin de flux, annulation"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+import leonardo_server
+from leonardo_server import PantheonHandler, PantheonServer, STREAMS
+from pantheon import pantheon
+
+
+@pytest.fixture
+def server():
+    httpd = PantheonServer(("127.0.0.1", 0), PantheonHandler, workers=4)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.drain()
+
+
+def post(port, path, body, timeout=10):
+    sock = socket.create_connection(("127.0.0.1", port), timeout=timeout)
+    data = json.dumps(body).encode()
+    sock.sendall(b"POST %s HTTP/1.1\r\nHost: t\r\nContent-Type: application/json\r\n"
+                 b"Content-Length: %d\r\n\r\n%s" % (path.encode(), len(data), data))
+    return sock
+
+
+def read_stream(sock):
+    """En-têtes + morceaux bruts, jusqu'au morceau de taille 0"""
+    reader = sock.makefile("rb")
+    head = []
+    while (line := reader.readline()) != b"\r\n":
+        head.append(line.decode().strip())
+    chunks = []
+    while True:
+        size = int(reader.readline(), 16)
+        chunk = reader.read(size)
+        assert reader.read(2) == b"\r\n"
+        if size == 0:
+            return head, chunks
+        chunks.append(chunk)
+
+
+def parse(chunk):
+    event, data, blank = chunk.decode().split("\n", 2)
+    assert event.startswith("event: ") and data.startswith("data: ") and blank == "\n"
+    return event[7:], json.loads(data[6:])
+
+
+def test_one_event_per_chunk(server, monkeypatch):
+    def fake(data):
+        yield "answer", {"daemon": "nyx", "response": "nuit\nclaire"}
+        yield "done", {}
+
+    monkeypatch.setitem(STREAMS, "/council", fake)
+    sock = post(server, "/council", {"text": "?", "stream": True})
+    head, chunks = read_stream(sock)
+    sock.close()
+    assert head[0] == "HTTP/1.1 200 OK"
+    assert "Transfer-Encoding: chunked" in head
+    assert any(h.startswith("Content-type: text/event-stream") for h in head)
+    assert [parse(c) for c in chunks] == [
+        ("answer", {"daemon": "nyx", "response": "nuit\nclaire"}),
+        ("done", {}),
+    ]
+
+
+def test_accept_header_selects_stream(server, monkeypatch):
+    monkeypatch.setattr(pantheon.daemons["zoe"], "pense", lambda text: "zoé")
+    sock = socket.create_connection(("127.0.0.1", server), timeout=30)
+    data = json.dumps({"question": "phi"}).encode()
+    sock.sendall(b"POST /council HTTP/1.1\r\nHost: t\r\nAccept: text/event-stream\r\n"
+                 b"Content-Length: %d\r\n\r\n%s" % (len(data), data))
+    head, chunks = read_stream(sock)
+    sock.close()
+    events = [parse(c) for c in chunks]
+    assert events[-1] == ("done", {})
+    assert ("answer", {"daemon": "zoe", "response": "zoé"}) in events
+
+
+def test_client_gone_closes_generator(server, monkeypatch):
+    closed = threading.Event()
+
+    def endless(data):
+        try:
+            while True:
+                yield "turn", {"message": "x" * 1024}
+                time.sleep(0.01)
+        finally:
+            closed.set()
+
+    monkeypatch.setitem(STREAMS, "/dialogue", endless)
+    sock = post(server, "/dialogue", {"stream": True})
+    sock.recv(4096)
+    sock.close()
+    assert closed.wait(5)
+
+
+def test_without_stream_flag_is_json(server, monkeypatch):
+    monkeypatch.setattr(leonardo_server, "route", lambda path, data: {"ok": path})
+    sock = post(server, "/council", {"text": "?"})
+    reader = sock.makefile("rb")
+    assert reader.readline().startswith(b"HTTP/1.1 200")
+    while (line := reader.readline()) != b"\r\n":
+        if line.lower().startswith(b"content-length"):
+            length = int(line.split(b":")[1])
+    assert json.loads(reader.read(length)) == {"ok": "/council"}
+    sock.close()